@@ -13,7 +13,10 @@ from . import template
 from . import user
 
 from plainvoice.model.config import Config
+from plainvoice.model.document.document_cache import DocumentCache
 from plainvoice.utils import file_utils
+from plainvoice.utils import yaml_utils
+from plainvoice.view.output import Output
 
 import click
 
@@ -39,12 +42,27 @@ def pv_cli(ctx: click.Context, verbose: bool, user: str):
     ctx.obj = ctx.ensure_object(dict)
     ctx.obj['verbose'] = verbose
     ctx.obj['user'] = user
+    if verbose >= 2:
+        Output.print_info(f'YAML backend: {yaml_utils.get_backend()}')
+        ctx.call_on_close(print_cache_stats)
+
+
+def print_cache_stats() -> None:
+    '''
+    Print the statistics of the document caches, when the command
+    is finished. It is used on verbosity level 2.
+    '''
+    stats = DocumentCache.get_total_stats()
+    Output.print_info(
+        f'Document cache: {stats["hits"]} hits, {stats["misses"]} misses,'
+        f' {stats["evictions"]} evictions'
+    )
 
 
 @pv_cli.command()
 def config():
     '''Open the config in the defined editor. By default this is vi.'''
-    config = Config()
+    config = Config.get_instance()
     file_utils.open_in_editor(config.config_file)
 
 
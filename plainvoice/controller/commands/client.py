@@ -28,35 +28,37 @@ def client_edit(name):
     Edit a client, if it exists. Also update its fixed fields
     according to the clients document type.
     '''
-    DocumentController().edit(str(Config().get('client_type')), name)
+    DocumentController().edit(str(Config.get_instance().get('client_type')), name)
 
 
 @client.command('hide')
 @click.argument('name')
 def client_hide(name):
     '''Hide a client.'''
-    DocumentController().change_visibility(str(Config().get('client_type')), name, True)
+    DocumentController().change_visibility(
+        str(Config.get_instance().get('client_type')), name, True
+    )
 
 
 @client.command('list')
 @click.option('-a', '--show-all', is_flag=True, help='Also list hidden items')
 def client_list(show_all):
     '''List available and visible clients.'''
-    DocumentController().list(str(Config().get('client_type')), show_all)
+    DocumentController().list(str(Config.get_instance().get('client_type')), show_all)
 
 
 @client.command('new')
 @click.argument('name')
 def client_new(name):
     '''Create a new client or edit it if it exists already.'''
-    DocumentController().new(str(Config().get('client_type')), name)
+    DocumentController().new(str(Config.get_instance().get('client_type')), name)
 
 
 @client.command('remove')
 @click.argument('name')
 def client_remove(name):
     '''Remove a client.'''
-    DocumentController().remove(str(Config().get('client_type')), name)
+    DocumentController().remove(str(Config.get_instance().get('client_type')), name)
 
 
 @client.command('render')
@@ -67,7 +69,11 @@ def client_remove(name):
 def client_render(ctx, name, template, output_file):
     '''Render a client.'''
     DocumentController().render(
-        str(Config().get('client_type')), name, template, ctx.obj['user'], output_file
+        str(Config.get_instance().get('client_type')),
+        name,
+        template,
+        ctx.obj['user'],
+        output_file,
     )
 
 
@@ -79,7 +85,11 @@ def client_render(ctx, name, template, output_file):
 def client_script(ctx, name, script, quiet):
     '''Execute a script on the given client.'''
     DocumentController().script(
-        str(Config().get('client_type')), name, script, ctx.obj['user'], quiet
+        str(Config.get_instance().get('client_type')),
+        name,
+        script,
+        ctx.obj['user'],
+        quiet,
     )
 
 
@@ -88,7 +98,7 @@ def client_script(ctx, name, script, quiet):
 def client_show(name):
     '''Show a client.'''
     DocumentController().change_visibility(
-        str(Config().get('client_type')), name, False
+        str(Config.get_instance().get('client_type')), name, False
     )
 
 
@@ -100,4 +110,4 @@ def client_update(name):
     updated client docuemnt type. After that edit it immediately.
     Basically this is just an alias for the edit command.
     '''
-    DocumentController().edit(str(Config().get('client_type')), name)
+    DocumentController().edit(str(Config.get_instance().get('client_type')), name)
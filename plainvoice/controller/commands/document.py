@@ -84,10 +84,50 @@ def doc_hide(ctx, name):
 
 @doc.command('list')
 @click.option('-a', '--show-all', is_flag=True, help='Also list hidden items')
+@click.option(
+    '--from',
+    'date_from',
+    default='',
+    help='Only list items with the date on this day or later (e.g. 2024-07-01, +0)',
+)
+@click.option(
+    '--to',
+    'date_to',
+    default='',
+    help='Only list items with the date on this day or earlier (e.g. 2024-09-30, +7)',
+)
+@click.option(
+    '-d',
+    '--date',
+    'date_name',
+    type=click.Choice(['issued', 'due', 'done']),
+    default='issued',
+    help='The date for --from and --to',
+)
+@click.option(
+    '-w',
+    '--where',
+    default='',
+    help='Only list items matching the conditions (e.g. \'code~"24*" and total>1000\')',
+)
+@click.option(
+    '-s',
+    '--sort',
+    default='',
+    help='Sort by these comma separated fields; "-" for descending (e.g. -total,code)',
+)
+@click.option('-l', '--limit', type=int, default=0, help='List this many items at most')
 @click.pass_context
-def doc_list(ctx, show_all):
-    '''List available and visible documents.'''
-    DocumentController().list(ctx.obj['type'], show_all)
+def doc_list(ctx, show_all, date_from, date_to, date_name, where, sort, limit):
+    '''
+    List available and visible documents. With --from and/or --to only
+    the documents with the date in this range are listed, with --where
+    only the ones matching the conditions; of all types, if no type is
+    given.
+    '''
+    DocumentController().list(
+        ctx.obj['type'], show_all, date_from, date_to, date_name, where, sort, limit
+    )
 
 
 @doc.command('new')
@@ -28,35 +28,37 @@ def user_edit(name):
     Edit a user, if it exists. Also update its fixed fields
     according to the users document type.
     '''
-    DocumentController().edit(str(Config().get('user_type')), name)
+    DocumentController().edit(str(Config.get_instance().get('user_type')), name)
 
 
 @user.command('hide')
 @click.argument('name')
 def user_hide(name):
     '''Hide a user.'''
-    DocumentController().change_visibility(str(Config().get('user_type')), name, True)
+    DocumentController().change_visibility(
+        str(Config.get_instance().get('user_type')), name, True
+    )
 
 
 @user.command('list')
 @click.option('-a', '--show-all', is_flag=True, help='Also list hidden items')
 def user_list(show_all):
     '''List available and visible users.'''
-    DocumentController().list(str(Config().get('user_type')), show_all)
+    DocumentController().list(str(Config.get_instance().get('user_type')), show_all)
 
 
 @user.command('new')
 @click.argument('name')
 def user_new(name):
     '''Create a new user or edit it if it exists already.'''
-    DocumentController().new(str(Config().get('user_type')), name)
+    DocumentController().new(str(Config.get_instance().get('user_type')), name)
 
 
 @user.command('remove')
 @click.argument('name')
 def user_remove(name):
     '''Remove a user.'''
-    DocumentController().remove(str(Config().get('user_type')), name)
+    DocumentController().remove(str(Config.get_instance().get('user_type')), name)
 
 
 @user.command('render')
@@ -67,7 +69,11 @@ def user_remove(name):
 def user_render(ctx, name, template, output_file):
     '''Render a user.'''
     DocumentController().render(
-        str(Config().get('user_type')), name, template, ctx.obj['user'], output_file
+        str(Config.get_instance().get('user_type')),
+        name,
+        template,
+        ctx.obj['user'],
+        output_file,
     )
 
 
@@ -79,7 +85,11 @@ def user_render(ctx, name, template, output_file):
 def user_script(ctx, name, script, quiet):
     '''Execute a script on the given user.'''
     DocumentController().script(
-        str(Config().get('user_type')), name, script, ctx.obj['user'], quiet
+        str(Config.get_instance().get('user_type')),
+        name,
+        script,
+        ctx.obj['user'],
+        quiet,
     )
 
 
@@ -87,7 +97,9 @@ def user_script(ctx, name, script, quiet):
 @click.argument('name')
 def user_show(name):
     '''Show a user.'''
-    DocumentController().change_visibility(str(Config().get('user_type')), name, False)
+    DocumentController().change_visibility(
+        str(Config.get_instance().get('user_type')), name, False
+    )
 
 
 @user.command('update')
@@ -98,4 +110,4 @@ def user_update(name):
     updated user docuemnt type. After that edit it immediately.
     Basically this is just an alias for the edit command.
     '''
-    DocumentController().edit(str(Config().get('user_type')), name)
+    DocumentController().edit(str(Config.get_instance().get('user_type')), name)
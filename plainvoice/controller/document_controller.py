@@ -6,7 +6,8 @@ Handles Document managing.
 
 from plainvoice.controller.io_facade.io_facade import IOFacade as io
 from plainvoice.model.data.data_model_populator import DataModelPopulator
-from plainvoice.model.document.document import Document
+from plainvoice.model.document.document import Document, date_to_internal
+from plainvoice.model.document.document_query import DocumentQuery
 from plainvoice.model.config import Config
 from plainvoice.model.script.script_repository import ScriptRepository
 from plainvoice.model.template.template_repository import TemplateRepository
@@ -14,7 +15,7 @@ from plainvoice.utils import data_utils
 from plainvoice.utils import doc_utils
 from plainvoice.utils import file_utils
 
-from datetime import datetime
+from datetime import datetime, timedelta
 
 
 class DocumentController:
@@ -52,6 +53,32 @@ class DocumentController:
         else:
             io.print(f'Document "{name}" not found.', 'warning')
 
+    @staticmethod
+    def _date_from_input(value: str) -> datetime | None:
+        '''
+        Convert the given date input to the start of that day. It can
+        be a date like for setting the done date or a relative one
+        like "+7" for in 7 days from today on.
+
+        Args:
+            value (str): The date input or an empty string.
+
+        Returns:
+            datetime | None: Returns the date or None, if no input is given.
+        '''
+        if not value:
+            return None
+        if value.startswith(('+', '-')):
+            date = date_to_internal(value)
+        else:
+            readable = data_utils.is_valid_date(value)
+            if not readable:
+                raise ValueError(f'Not a valid date: {value}')
+            date = datetime.strptime(readable, '%Y-%m-%d')
+        return (date or datetime.now()).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+
     def edit(self, doc_typename: str, name: str) -> None:
         '''
         Edit the document with the given type and name. Also it
@@ -104,17 +131,77 @@ class DocumentController:
             self.doc_repo.save(doc_a)
             self.doc_repo.save(doc_b)
 
-    def list(self, doc_typename: str, show_all: bool) -> None:
+    def list(
+        self,
+        doc_typename: str,
+        show_all: bool,
+        date_from: str = '',
+        date_to: str = '',
+        date_name: str = 'issued',
+        where: str = '',
+        sort: str = '',
+        limit: int = 0,
+    ) -> None:
         '''
-        List documents of a certain type.
+        List documents of a certain type. Optionally only the ones
+        with a date in the given range or matching the given query;
+        then also all types, if no type is given.
 
         Args:
-            doc_typename (str): The name of the document type.
-            show_all (bool): If True, shows also hidden documents.
+            doc_typename (str): \
+                The name of the document type.
+            show_all (bool): \
+                If True, shows also hidden documents.
+            date_from (str): \
+                Only list documents with the date on this day or later.
+            date_to (str): \
+                Only list documents with the date on this day or earlier.
+            date_name (str): \
+                The date for the range: "issued", "due" or "done". \
+                (default: `'issued'`)
+            where (str): \
+                The conditions of the query like 'total>1000'.
+            sort (str): \
+                The comma separated fields to sort by like "-date,code".
+            limit (int): \
+                The maximum number of documents or 0 for all.
         '''
+        try:
+            start = self._date_from_input(date_from)
+            end = self._date_from_input(date_to)
+        except ValueError:
+            io.print(
+                'Use YYYY-MM-DD, DD.MM.YYYY or +/-DAYS as the date format, please.',
+                'warning',
+            )
+            return None
+        # the range includes the "to" day
+        if end is not None:
+            end = end + timedelta(days=1)
+
         # show_all is on the show_only_visible argument; thus
         # it has to be inverted to act correct
-        docs_list = self.doc_repo.get_list_of_docs(doc_typename, not show_all)
+        try:
+            if where or sort or limit:
+                query = DocumentQuery(where, sort, limit)
+                if start is not None:
+                    query.add_condition(date_name, '>=', start.strftime('%Y-%m-%d'))
+                if end is not None:
+                    query.add_condition(date_name, '<', end.strftime('%Y-%m-%d'))
+                docs_list = self.doc_repo.get_summaries_by_query(
+                    doc_typename, query, not show_all
+                )
+            elif start is not None or end is not None:
+                docs_list = self.doc_repo.get_summaries_by_date(
+                    doc_typename, date_name, start, end, not show_all
+                )
+            else:
+                docs_list = self.doc_repo.get_list_of_summaries(
+                    doc_typename, not show_all
+                )
+        except ValueError as error:
+            io.print(str(error), 'warning')
+            return None
         if docs_list:
             io.print_docs_table(docs_list)
         else:
@@ -155,20 +242,20 @@ class DocumentController:
         # it has to be inverted to act correct
         show_only_visible = not show_all
 
-        # get the due docs
-        due_docs = self.doc_repo.get_due_docs(
-            doc_typename, include_due, False, show_only_visible
-        )
-        overdue_docs = self.doc_repo.get_due_docs(
-            doc_typename, False, include_overdue, show_only_visible
-        )
+        # get the due and overdue docs in one go
+        buckets = self.doc_repo.get_due_buckets(doc_typename, show_only_visible)
+        due_docs = buckets['due'] if include_due else []
+        overdue_docs = buckets['overdue'] if include_overdue else []
 
         # print them in tables
         typename = doc_typename if doc_typename else 'document'
         # first due
         if due_docs:
             io.print_doc_due_table(
-                due_docs, f'[green]Due {typename}:[/green]', doc_typename == ''
+                [doc for doc, _ in due_docs],
+                f'[green]Due {typename}:[/green]',
+                doc_typename == '',
+                [days for _, days in due_docs],
             )
 
         # newline seperator if there are due AND overdue
@@ -178,7 +265,10 @@ class DocumentController:
         # then overdue
         if overdue_docs:
             io.print_doc_due_table(
-                overdue_docs, f'[red]Overdue {typename}:[/red]', doc_typename == ''
+                [doc for doc, _ in overdue_docs],
+                f'[red]Overdue {typename}:[/red]',
+                doc_typename == '',
+                [days for _, days in overdue_docs],
             )
 
     def list_linked_documents(
@@ -220,20 +310,23 @@ class DocumentController:
         doc = self.doc_repo.get_document_by_name_type_combi(name, doc_typename)
         user = self.doc_repo.get_user_by_username(user_name)
 
-        if name == '':
-            new_name = self.doc_repo.generate_next_name(doc_typename)
-        else:
-            new_name = name
+        new_name = name
         if not doc_typename:
             io.print('Please specify a document type with -t/--type!', 'warning')
         else:
             if not doc:
+                try:
+                    new_doc = self.doc_repo.create_document(doc_typename, name)
+                except TimeoutError as error:
+                    # another program holds the lock for the next code
+                    io.print(f'{error} Please try again.', 'error')
+                    return None
+                new_name = new_doc.get_name()
                 io.print(f'Creating new "{doc_typename}": "{new_name}" ...')
-                new_doc = self.doc_repo.create_document(doc_typename, name)
 
                 # now the optional direct client linking
                 if client:
-                    client_type = str(Config().get('client_type'))
+                    client_type = str(Config.get_instance().get('client_type'))
                     if not self.doc_repo.exists(client_type, client):
                         io.print(f'Client "{client}" not found!', 'warning')
                     else:
@@ -297,7 +390,9 @@ class DocumentController:
                 the replacement values of the main document.
         '''
         client = self.doc_repo.get_client_of_document(document)
-        populator = DataModelPopulator(client=client, config=Config(), user=user)
+        populator = DataModelPopulator(
+            client=client, config=Config.get_instance(), user=user
+        )
         populator.populate(document)
 
     def remove(self, doc_typename: str, name: str) -> None:
@@ -374,7 +469,9 @@ class DocumentController:
         doc = self.doc_repo.get_document_by_name_type_combi(name, doc_typename)
         user = self.doc_repo.get_user_by_username(user_name)
 
-        template_repo = TemplateRepository(str(Config().get('templates_folder')))
+        template_repo = TemplateRepository(
+            str(Config.get_instance().get('templates_folder'))
+        )
         if template_name is None:
             io.print('Specify a template. Choose one of those:', 'warning')
             io.print_list(sorted(template_repo.get_template_names()))
@@ -384,7 +481,7 @@ class DocumentController:
                 # since weasyprint is slow loading
                 from plainvoice.view.render import Render
 
-                render = Render(str(Config().get('templates_folder')))
+                render = Render(str(Config.get_instance().get('templates_folder')))
 
                 # load the document and render it
                 self.populate_document(doc, user)
@@ -486,7 +583,7 @@ class DocumentController:
         doc = self.doc_repo.get_document_by_name_type_combi(name, doc_typename)
         user = self.doc_repo.get_user_by_username(user_name)
 
-        script_repo = ScriptRepository(str(Config().get('scripts_folder')))
+        script_repo = ScriptRepository(str(Config.get_instance().get('scripts_folder')))
         if script_name is None:
             io.print('Specify a script. Choose one of those:', 'warning')
             io.print_list(sorted(script_repo.get_script_names()))
@@ -19,7 +19,9 @@ class DocumentTypeController:
         '''
         Handles DocumentType managing.
         '''
-        self.doc_type_repo = DocumentTypeRepository(str(Config().get('types_folder')))
+        self.doc_type_repo = DocumentTypeRepository(
+            str(Config.get_instance().get('types_folder'))
+        )
 
     def edit(self, name: str) -> None:
         '''
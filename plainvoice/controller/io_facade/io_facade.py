@@ -12,6 +12,7 @@ Output class' methods.
 from plainvoice.model.config import Config
 from plainvoice.model.document.document import Document
 from plainvoice.model.document.document_calculator import DocumentCalculator
+from plainvoice.model.document.document_summary import DocumentSummary
 from plainvoice.view.input import Input
 from plainvoice.view.output import Output
 
@@ -81,11 +82,15 @@ class IOFacade:
         '''
         issued_date = doc.get_issued_date(False)
         if isinstance(issued_date, datetime):
-            issued_date = issued_date.strftime(str(Config().get('date_output_format')))
+            issued_date = issued_date.strftime(
+                str(Config.get_instance().get('date_output_format'))
+            )
             issued_date = f'[normal]{issued_date}[/normal]'
         due_date = doc.get_due_date(False)
         if isinstance(due_date, datetime):
-            due_date = due_date.strftime(str(Config().get('date_output_format')))
+            due_date = due_date.strftime(
+                str(Config.get_instance().get('date_output_format'))
+            )
             due_date = f'[normal][yellow]{due_date}[/yellow][/normal]'
         title = f'[white]{doc.get_name()}[/white]'
         total_with_vat = f'[green]{doc.get_total_with_vat(True)}[/green]'
@@ -93,15 +98,21 @@ class IOFacade:
 
     @staticmethod
     def print_doc_due_table(
-        docs: list[Document], title: str = '', print_type: bool = False
+        docs: list[Document | DocumentSummary],
+        title: str = '',
+        print_type: bool = False,
+        due_days: list[int | None] | None = None,
     ) -> None:
         '''
         Prints a single document calculation in a pretty way.
 
         Args:
-            docs (list): The list of documents to print.
+            docs (list): The list of documents (or summaries) to print.
             title (str): The title of the table.
             print_type (bool): Print the type as well.
+            due_days (list): \
+                The already calculated days till due for the docs; \
+                otherwise they get calculated here.
         '''
         header = [
             {'header': 'Date', 'style': 'cyan'},
@@ -113,20 +124,22 @@ class IOFacade:
         ]
         rows = []
         doc_calc = DocumentCalculator(docs)
-        for doc in docs:
+        for i, doc in enumerate(docs):
             issued_date = doc.get_issued_date(False)
             if isinstance(issued_date, datetime):
                 issued_date = issued_date.strftime(
-                    str(Config().get('date_output_format'))
+                    str(Config.get_instance().get('date_output_format'))
                 )
             due_date = doc.get_due_date(False)
             if isinstance(due_date, datetime):
-                due_date = due_date.strftime(str(Config().get('date_output_format')))
-            due_days = doc.days_till_due_date()
-            if isinstance(due_days, int) and due_days > 0:
-                due_days = f'[blue]{due_days}[/blue]'
+                due_date = due_date.strftime(
+                    str(Config.get_instance().get('date_output_format'))
+                )
+            days = due_days[i] if due_days is not None else doc.days_till_due_date()
+            if isinstance(days, int) and days > 0:
+                days_str = f'[blue]{days}[/blue]'
             else:
-                due_days = f'[red]{due_days}[/red]'
+                days_str = f'[red]{days}[/red]'
             doc_title = doc.get_name()
             doc_title_defined = doc.get_title()
             if doc_title_defined != doc_title:
@@ -142,7 +155,7 @@ class IOFacade:
                 [
                     issued_date,
                     due_date,
-                    due_days,
+                    days_str,
                     doc_title,
                     doc_code,
                     doc.get_total_with_vat(True),
@@ -164,12 +177,14 @@ class IOFacade:
         Output.print_table(header, rows, title)
 
     @staticmethod
-    def print_docs_table(docs: list[Document], title: str = '') -> None:
+    def print_docs_table(
+        docs: list[Document | DocumentSummary], title: str = ''
+    ) -> None:
         '''
         Prints a list of documents in a pretty way.
 
         Args:
-            docs (list): The document list to print.
+            docs (list): The document (or summary) list to print.
         '''
         header = [
             {'header': 'Type', 'style': 'yellow'},
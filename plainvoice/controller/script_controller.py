@@ -19,7 +19,9 @@ class ScriptController:
         '''
         Handles Script managing.
         '''
-        self.script_repo = ScriptRepository(str(Config().get('scripts_folder')))
+        self.script_repo = ScriptRepository(
+            str(Config.get_instance().get('scripts_folder'))
+        )
 
     def edit(self, name: str) -> None:
         '''
@@ -21,7 +21,9 @@ class TemplateController:
         '''
         Handles Template managing.
         '''
-        self.template_repo = TemplateRepository(str(Config().get('templates_folder')))
+        self.template_repo = TemplateRepository(
+            str(Config.get_instance().get('templates_folder'))
+        )
 
     def edit(self, name: str) -> None:
         '''
@@ -9,15 +9,33 @@ from .config_base import ConfigBase
 
 
 class Config(ConfigBase):
+
+    PROGRAM_NAME: str = 'plainvoice'
+    '''
+    The program name, which is used for the data dir and the
+    environment variable to set it.
+    '''
+
     def __init__(self, data_dir: str = ''):
         '''
-        The config object.
+        The config object. Better use Config.get_instance() to get
+        the shared instance instead of loading the config again.
 
         Args:
             data_dir (str): \
                 Optionally set a different data_dir folder. (default: `''`)
         '''
-        super().__init__('plainvoice', data_dir)
+        super().__init__(self.PROGRAM_NAME, data_dir)
+
+        self.add_config(
+            'cache_folder',
+            '{app_dir}/cache',
+            [
+                'The folder where e.g. the document indexes are stored. They',
+                'can be deleted at any time and will be rebuilt then. Use',
+                '\'{app_dir}\' to use the app dirs folder.',
+            ],
+        )
 
         self.add_config(
             'client_type',
@@ -37,6 +55,16 @@ class Config(ConfigBase):
             ['Sets the terminal command for the editor to use, when', 'editing files.'],
         )
 
+        self.add_config(
+            'load_workers',
+            1,
+            [
+                'The number of threads for loading many documents at once;',
+                'e.g. when listing them. This can speed up loading on slow',
+                'network filesystems. 1 means loading one after another.',
+            ],
+        )
+
         self.add_config(
             'scripts_folder',
             '{app_dir}/scripts',
@@ -4,10 +4,17 @@ ConfigBase class
 This class handles the config. It serves basic methods
 for creating or updating the config and also for
 loading it, of course.
+
+Since the config is needed almost everywhere in the program,
+there is a shared instance per data dir, which can be fetched
+with get_instance(). It will only read the config file again,
+if its mtime changed, and only write it, if a value changed or
+a new config key was added to the program.
 '''
 
+from plainvoice.utils import yaml_utils
+
 import os
-import yaml
 
 
 class ConfigBase:
@@ -15,6 +22,17 @@ class ConfigBase:
     The config class, which can modify the config.
     '''
 
+    PROGRAM_NAME: str = 'PROGRAM'
+    '''
+    The default program name, which will be used by get_instance()
+    to find the data dir.
+    '''
+
+    _instances: dict = {}
+    '''
+    The shared instances with the class and the data dir as the key.
+    '''
+
     def __init__(self, program_name: str = 'PROGRAM', data_dir: str = ''):
         '''
         The config base class which serves certain methods
@@ -57,6 +75,17 @@ class ConfigBase:
         resective folder and also be able to load config data from it.
         '''
 
+        self.config_mtime: int | None = None
+        '''
+        The mtime of the config file, when it was loaded the last time.
+        '''
+
+        self.changed = False
+        '''
+        Tells if a config value changed since loading or saving the
+        config, so that it only has to be saved, if needed.
+        '''
+
         self.project_path = os.path.dirname(os.path.realpath(__file__)).replace(
             '/model', ''
         )
@@ -65,18 +94,8 @@ class ConfigBase:
         in the config file, since it gets generated on runtime.
         '''
 
-        # get the data_dir, which can be defined as a class initiation argument
-        # or even as an ENVIRONMENT variable. the latter one will only be used,
-        # if it is set and if the argument of the class initiation is not set.
-        # the ENVIRONMENT variable to set is the "program name" in upper case
-        # plus "_DATA_DIR". E.g. for the program name "app" it would be
-        # "APP_DATA_DIR".
-        data_dir_env = os.getenv(self.program_name.upper() + '_DATA_DIR')
-        if data_dir == '' and data_dir_env is not None:
-            data_dir = data_dir_env
-
         # change the data_dir and all depending internals accordingly
-        self.change_data_dir(data_dir)
+        self.change_data_dir(self.resolve_data_dir(self.program_name, data_dir))
 
     def add_comments_on_config(self) -> bool:
         '''
@@ -152,26 +171,35 @@ class ConfigBase:
         and maybe update new keys with its defaults ot so.
         Also this method thus would create a new config
         for the programm on its first run.
+
+        The config file will only be written, if it does not
+        exist yet or if a new key with its default was added.
         '''
         user_config = {}
 
         # first load user config, if it exists
-        if os.path.exists(self.config_file):
+        config_mtime = self.get_config_mtime()
+        if config_mtime is not None:
             with open(self.config_file, 'r') as yaml_file:
-                user_config = yaml.safe_load(yaml_file)
+                user_config = yaml_utils.load(yaml_file)
         if not user_config:
             user_config = {}
 
-        # set user config to the internal values
+        # set user config to the internal values; this is no
+        # change, which has to be saved, since it comes from
+        # the file after all
         for key, value in user_config.items():
             self.set(key, value)
+        self.changed = False
+        self.config_mtime = config_mtime
 
         # set defaults for unset values
         for key, value in self.get_defaults().items():
             if key not in user_config:
                 self.set(key, value)
 
-        self.save()
+        if self.changed or config_mtime is None:
+            self.save()
 
     def get(self, key: str) -> object:
         '''
@@ -188,6 +216,18 @@ class ConfigBase:
             output = self.config_data[key]['value']
         return output
 
+    def get_config_mtime(self) -> int | None:
+        '''
+        Get the mtime of the config file in nanoseconds.
+
+        Returns:
+            int | None: Returns the mtime or None, if it does not exist.
+        '''
+        try:
+            return os.stat(self.config_file).st_mtime_ns
+        except OSError:
+            return None
+
     def get_defaults(self) -> dict:
         '''
         Return the defaults as a dict without comments.
@@ -200,6 +240,31 @@ class ConfigBase:
             output[key] = value['default']
         return output
 
+    @classmethod
+    def get_instance(cls, data_dir: str = ''):
+        '''
+        Get the shared instance of this config class for the given
+        data dir (or the one from the environment / the default). It
+        will be created on the first call only. Later calls only
+        check, if the config file changed in the meantime, and load
+        it again in that case.
+
+        Args:
+            data_dir (str): \
+                Optionally set a different data_dir folder. (default: `''`)
+
+        Returns:
+            ConfigBase: Returns the shared config instance.
+        '''
+        key = (cls, cls.resolve_data_dir(cls.PROGRAM_NAME, data_dir))
+        instance = cls._instances.get(key)
+        if instance is None:
+            instance = cls(data_dir) if data_dir else cls()
+            cls._instances[key] = instance
+        else:
+            instance.reload_if_changed()
+        return instance
+
     def get_values(self) -> dict:
         '''
         Return the values as a dict without comments.
@@ -212,6 +277,41 @@ class ConfigBase:
             output[key] = value['value']
         return output
 
+    def reload_if_changed(self) -> bool:
+        '''
+        Load the config file again, if it changed since it was
+        loaded the last time.
+
+        Returns:
+            bool: Returns True, if the config was loaded again.
+        '''
+        if self.get_config_mtime() == self.config_mtime:
+            return False
+        self.create_or_update_config()
+        return True
+
+    @staticmethod
+    def resolve_data_dir(program_name: str, data_dir: str = '') -> str:
+        '''
+        Get the data_dir, which can be defined as a class initiation argument
+        or even as an ENVIRONMENT variable. the latter one will only be used,
+        if it is set and if the argument of the class initiation is not set.
+        the ENVIRONMENT variable to set is the "program name" in upper case
+        plus "_DATA_DIR". E.g. for the program name "app" it would be
+        "APP_DATA_DIR".
+
+        Args:
+            program_name (str): The name of the program.
+            data_dir (str): The data dir argument, which may be blank.
+
+        Returns:
+            str: Returns the data dir or blank for the default one.
+        '''
+        data_dir_env = os.getenv(program_name.upper() + '_DATA_DIR')
+        if data_dir == '' and data_dir_env is not None:
+            data_dir = data_dir_env
+        return data_dir
+
     def save(self) -> bool:
         '''
         Save the config.
@@ -224,13 +324,15 @@ class ConfigBase:
                 os.makedirs(self.data_dir)
 
             with open(self.config_file, 'w') as file:
-                yaml.dump(
+                yaml_utils.dump(
                     self.get_values(),
                     file,
                     default_flow_style=False,
                     allow_unicode=True,
                 )
             self.add_comments_on_config()
+            self.changed = False
+            self.config_mtime = self.get_config_mtime()
             return True
         except Exception:
             return False
@@ -247,6 +349,8 @@ class ConfigBase:
         '''
         if key in self.config_data:
             tmp = self.config_data[key]
+            if tmp['value'] != value:
+                self.changed = True
             tmp['value'] = value
             self.config_data[key] = tmp
         else:
@@ -0,0 +1,343 @@
+'''
+CodeAllocator class
+
+This class stores the highest used code of a DataRepository in a
+small state file, so that getting the next code does not need to
+scan the whole folder every time. Next to the code, the state holds
+the filename, which carries this code. The stored state gets verified
+lazily: as long as this file exists and the files for the next few
+codes do not exist yet, the state is trusted. Otherwise the folder will
+be scanned again and the state gets rebuilt from it.
+
+Allocating a code happens under a lock so that two programs creating
+a new document at the same time will not get the same code. The lock
+is held by the operating system on the opened lock file (flock or
+msvcrt.locking on Windows); so it gets released, when the program
+ends, and a lock can never be left stale by a crashed program.
+'''
+
+from typing import IO, Callable
+
+import json
+import os
+import time
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore
+    import msvcrt
+
+
+class CodeAllocator:
+    '''
+    Persistent allocator for the next code of a DataRepository.
+    '''
+
+    LOCK_TIMEOUT: float = 10.0
+    '''
+    The seconds to wait for the lock.
+    '''
+
+    RESERVATION_TIMEOUT: float = 60.0
+    '''
+    The seconds an allocated code is reserved, even if its file
+    does not exist yet. The file will probably be saved right after
+    the allocation, yet during this time another allocation should
+    not get the same code again.
+    '''
+
+    STATE_VERSION: int = 1
+    '''
+    The version of the state format. If it changes, older
+    state files will be ignored and rebuilt.
+    '''
+
+    VERIFY_WINDOW: int = 10
+    '''
+    The number of codes above the stored one, whose files must not
+    exist for the state to be trusted. Files, which were added to the
+    folder without the program (e.g. by syncing or copying), usually
+    continue the codes; so they lead to a new scan.
+    '''
+
+    def __init__(self, state_file: str = '', fingerprint: str = ''):
+        '''
+        The persistent code allocator for a DataRepository.
+
+        Args:
+            state_file (str): \
+                The absolute filename of the state file. If left blank, \
+                the folder will be scanned every time. (default: `''`)
+            fingerprint (str): \
+                A string describing what the codes depend on; e.g. the \
+                folder and the filename pattern. If it differs from the \
+                stored one, the state will be rebuilt. (default: `''`)
+        '''
+        self.fingerprint: str = fingerprint
+        '''
+        The fingerprint of the data, the state depends on.
+        '''
+
+        self.lock_file: str = f'{state_file}.lock' if state_file else ''
+        '''
+        The absolute filename of the lock file.
+        '''
+
+        self.state_file: str = state_file
+        '''
+        The absolute filename of the state file.
+        '''
+
+    def _get_verified_code(
+        self,
+        scan: Callable[[], tuple[int, str]],
+        generate_filename: Callable[[int], str],
+    ) -> int:
+        '''
+        Get the highest used code. It comes from the state file,
+        if it can be verified, otherwise from scanning the folder.
+        The scan result will be saved as the new state then.
+
+        Args:
+            scan (Callable): \
+                The callable, which scans the folder and returns the \
+                highest code and the absolute filename carrying it.
+            generate_filename (Callable): \
+                The callable, which generates the absolute filename \
+                for the given code.
+
+        Returns:
+            int: Returns the highest used code.
+        '''
+        state = self._load_state()
+        if state is not None:
+            code = state['code']
+            filename = state['filename']
+            reserved_at = state['reserved_at']
+            carrier_exists = (
+                code == 0
+                or os.path.exists(filename)
+                or time.time() - reserved_at < self.RESERVATION_TIMEOUT
+            )
+            if carrier_exists and not any(
+                os.path.exists(generate_filename(code + i))
+                for i in range(1, self.VERIFY_WINDOW + 1)
+            ):
+                return code
+
+        # the state and the files disagree: scan the folder
+        code, filename = scan()
+        self._save_state(code, filename)
+        return code
+
+    def _load_state(self) -> dict | None:
+        '''
+        Load the state from the state file.
+
+        Returns:
+            dict | None: Returns the state or None, if it is not valid.
+        '''
+        if not self.state_file or not os.path.exists(self.state_file):
+            return None
+        try:
+            with open(self.state_file, 'r') as state_file:
+                data = json.load(state_file)
+            if (
+                data.get('version') != self.STATE_VERSION
+                or data.get('fingerprint') != self.fingerprint
+            ):
+                return None
+            return {
+                'code': int(data['code']),
+                'filename': str(data['filename']),
+                'reserved_at': float(data.get('reserved_at', 0.0)),
+            }
+        except Exception:
+            return None
+
+    def _save_state(self, code: int, filename: str, reserved_at: float = 0.0) -> bool:
+        '''
+        Save the state to the state file.
+
+        Args:
+            code (int): The highest used code.
+            filename (str): The absolute filename carrying the code.
+            reserved_at (float): \
+                The timestamp of the allocation, if the file does not \
+                exist yet. (default: `0.0`)
+
+        Returns:
+            bool: Returns True on success.
+        '''
+        if not self.state_file:
+            return False
+        try:
+            directory = os.path.dirname(self.state_file)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory)
+            tmp_file = f'{self.state_file}.{os.getpid()}.tmp'
+            with open(tmp_file, 'w') as state_file:
+                json.dump(
+                    {
+                        'version': self.STATE_VERSION,
+                        'fingerprint': self.fingerprint,
+                        'code': code,
+                        'filename': filename,
+                        'reserved_at': reserved_at,
+                    },
+                    state_file,
+                )
+            os.replace(tmp_file, self.state_file)
+            return True
+        except Exception:
+            return False
+
+    def allocate(
+        self,
+        scan: Callable[[], tuple[int, str]],
+        generate_filename: Callable[[int], str],
+    ) -> int:
+        '''
+        Allocate the next code. It will be reserved for a short
+        time, so that another allocation gets the code after it,
+        even if the file for this code was not saved yet.
+
+        Args:
+            scan (Callable): \
+                The callable, which scans the folder and returns the \
+                highest code and the absolute filename carrying it.
+            generate_filename (Callable): \
+                The callable, which generates the absolute filename \
+                for the given code.
+
+        Returns:
+            int: Returns the allocated code.
+
+        Raises:
+            TimeoutError: \
+                If the lock could not be acquired in LOCK_TIMEOUT \
+                seconds; a code without reservation could be given \
+                to another program as well.
+        '''
+        # without a state file, there is nothing to reserve the code in
+        if not self.lock_file:
+            return scan()[0] + 1
+        lock_handle = self.lock()
+        if lock_handle is None:
+            raise TimeoutError(f'Could not lock "{self.lock_file}" to allocate a code.')
+        try:
+            code = self._get_verified_code(scan, generate_filename) + 1
+            self._save_state(code, generate_filename(code), time.time())
+            return code
+        finally:
+            self.unlock(lock_handle)
+
+    def get_next_code(
+        self,
+        scan: Callable[[], tuple[int, str]],
+        generate_filename: Callable[[int], str],
+    ) -> int:
+        '''
+        Get the next code without allocating it.
+
+        Args:
+            scan (Callable): \
+                The callable, which scans the folder and returns the \
+                highest code and the absolute filename carrying it.
+            generate_filename (Callable): \
+                The callable, which generates the absolute filename \
+                for the given code.
+
+        Returns:
+            int: Returns the next code.
+        '''
+        # reading the code does not reserve it, yet a rebuilt state
+        # gets saved; the lock keeps this from overwriting the state
+        # of an allocation, which happens at the same time
+        lock_handle = self.lock()
+        if lock_handle is None:
+            return scan()[0] + 1
+        try:
+            return self._get_verified_code(scan, generate_filename) + 1
+        finally:
+            self.unlock(lock_handle)
+
+    def lock(self) -> IO | None:
+        '''
+        Acquire the lock on the lock file. It waits up to LOCK_TIMEOUT
+        seconds for another program (or thread) to release it.
+
+        Returns:
+            IO | None: \
+                Returns the opened lock file, which holds the lock, \
+                or None, if the lock was not acquired.
+        '''
+        if not self.lock_file:
+            return None
+        try:
+            directory = os.path.dirname(self.lock_file)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory)
+            lock_handle = open(self.lock_file, 'a')
+        except OSError:
+            return None
+        deadline = time.time() + self.LOCK_TIMEOUT
+        while True:
+            try:
+                if fcntl is not None:
+                    fcntl.flock(lock_handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                else:  # pragma: no cover
+                    msvcrt.locking(lock_handle.fileno(), msvcrt.LK_NBLCK, 1)
+                return lock_handle
+            except OSError:
+                if time.time() > deadline:
+                    lock_handle.close()
+                    return None
+                time.sleep(0.01)
+
+    def observe(self, code: int, filename: str) -> None:
+        '''
+        Tell the allocator about a saved file with the given code.
+        If it is higher than the stored one, it will be the new
+        highest code. This way also documents with a manually
+        given name keep the state up to date.
+
+        Args:
+            code (int): The code of the saved file.
+            filename (str): The absolute filename of the saved file.
+        '''
+        # without a state, the next call will scan the folder anyway
+        state = self._load_state()
+        if state is None or code < state['code']:
+            return
+        lock_handle = self.lock()
+        if lock_handle is None:
+            return
+        try:
+            state = self._load_state()
+            if state is not None and (
+                code > state['code']
+                or (code == state['code'] and filename == state['filename'])
+            ):
+                self._save_state(code, filename)
+        finally:
+            self.unlock(lock_handle)
+
+    def unlock(self, lock_handle: IO) -> None:
+        '''
+        Release the lock. The lock file itself stays, since another
+        program might wait for the lock on it already.
+
+        Args:
+            lock_handle (IO): The opened lock file returned by lock().
+        '''
+        try:
+            if fcntl is not None:
+                fcntl.flock(lock_handle.fileno(), fcntl.LOCK_UN)
+            else:  # pragma: no cover
+                msvcrt.locking(lock_handle.fileno(), msvcrt.LK_UNLCK, 1)
+        except OSError:
+            pass
+        finally:
+            lock_handle.close()
@@ -0,0 +1,317 @@
+'''
+DataIndex class
+
+This class is a persistent index for the files of a DataRepository.
+It stores a small record for every file, keyed by its absolute
+filename and validated with the files mtime and size. The record
+itself is generated by a "projector" callable, which gets the
+absolute filename and the loaded dict and returns only the data,
+which is needed for e.g. listing the files.
+
+That way only changed files have to be parsed again, when listing
+all documents of a certain type, for example. The index is stored
+as a JSON file, since it is no file the user should edit and JSON
+can be loaded a lot faster than YAML.
+'''
+
+from typing import Callable
+
+import json
+import os
+
+
+class DataIndex:
+    '''
+    Persistent index with one record per file.
+    '''
+
+    INDEX_VERSION: int = 1
+    '''
+    The version of the index format. If it changes, older
+    index files will be ignored and rebuilt.
+    '''
+
+    def __init__(self, index_file: str = '', fingerprint: str = ''):
+        '''
+        The persistent index for the files of a DataRepository.
+
+        Args:
+            index_file (str): \
+                The absolute filename of the index file. If left blank, \
+                the index only lives in memory. (default: `''`)
+            fingerprint (str): \
+                A string describing the state of whatever the records \
+                depend on; e.g. the document type. If it differs from \
+                the stored one, the whole index will be rebuilt. \
+                (default: `''`)
+        '''
+        self.changed: bool = False
+        '''
+        Tells if the index got changed since it was loaded, so
+        that it only has to be written, if needed.
+        '''
+
+        self.entries: dict[str, dict] = {}
+        '''
+        The entries of the index with the absolute filename as the
+        key and a dict with "mtime", "size" and "record" as the value.
+        '''
+
+        self.fingerprint: str = fingerprint
+        '''
+        The fingerprint of the data, the records depend on.
+        '''
+
+        self.index_file: str = index_file
+        '''
+        The absolute filename of the index file.
+        '''
+
+        self.loaded: bool = False
+        '''
+        Tells if the index file was already tried to be loaded.
+        '''
+
+        self.revision: int = 0
+        '''
+        Counts the changes of the entries, so that anything built
+        from the records can tell, if it is outdated.
+        '''
+
+    @staticmethod
+    def file_signature(abs_filename: str) -> tuple[int, int] | None:
+        '''
+        Get the signature of the given file, which is the mtime
+        in nanoseconds and the size in bytes.
+
+        Args:
+            abs_filename (str): The absolute filename.
+
+        Returns:
+            tuple | None: Returns (mtime, size) or None if not existing.
+        '''
+        try:
+            stat = os.stat(abs_filename)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def get(self, abs_filename: str) -> dict | None:
+        '''
+        Get the record of the given absolute filename, if it
+        exists in the index. This won't check the file itself.
+
+        Args:
+            abs_filename (str): The absolute filename.
+
+        Returns:
+            dict | None: Returns the record or None.
+        '''
+        self.load()
+        entry = self.entries.get(abs_filename)
+        return entry['record'] if entry is not None else None
+
+    def get_entries(self) -> dict[str, dict]:
+        '''
+        Get all entries of the index with the absolute filename as
+        the key and a dict with "mtime", "size" and "record" as the
+        value. This won't check the files.
+
+        Returns:
+            dict: Returns the entries dict.
+        '''
+        self.load()
+        return self.entries
+
+    def get_outdated(self, abs_filenames: list[str]) -> list[str]:
+        '''
+        Get the files of the given list, which are not in the index
+        or changed since then; thus which would have to be parsed on
+        the next update().
+
+        Args:
+            abs_filenames (list): The absolute filenames to check.
+
+        Returns:
+            list: Returns the outdated absolute filenames.
+        '''
+        self.load()
+        output = []
+        for abs_filename in abs_filenames:
+            signature = self.file_signature(abs_filename)
+            if signature is None:
+                continue
+            entry = self.entries.get(abs_filename)
+            if (
+                entry is None
+                or entry.get('mtime') != signature[0]
+                or entry.get('size') != signature[1]
+            ):
+                output.append(abs_filename)
+        return output
+
+    def get_records(self) -> dict[str, dict]:
+        '''
+        Get all records of the index with the absolute filename
+        as the key.
+
+        Returns:
+            dict: Returns the records dict.
+        '''
+        self.load()
+        return {
+            abs_filename: entry['record']
+            for abs_filename, entry in self.entries.items()
+        }
+
+    def load(self) -> bool:
+        '''
+        Load the index from its file; only once per instance.
+        If the file does not exist, has another version or
+        another fingerprint, the index simply starts empty.
+
+        Returns:
+            bool: Returns True, if entries were loaded from the file.
+        '''
+        if self.loaded:
+            return False
+        self.loaded = True
+        if not self.index_file or not os.path.exists(self.index_file):
+            return False
+        try:
+            with open(self.index_file, 'r') as index_file:
+                data = json.load(index_file)
+        except Exception:
+            return False
+        if (
+            not isinstance(data, dict)
+            or data.get('version') != self.INDEX_VERSION
+            or data.get('fingerprint') != self.fingerprint
+            or not isinstance(data.get('entries'), dict)
+        ):
+            return False
+        self.entries = data['entries']
+        self.revision += 1
+        return True
+
+    def remove(self, abs_filename: str) -> None:
+        '''
+        Remove the record of the given absolute filename. This way
+        the file will be parsed again on the next update().
+
+        Args:
+            abs_filename (str): The absolute filename.
+        '''
+        self.load()
+        if abs_filename in self.entries:
+            del self.entries[abs_filename]
+            self.changed = True
+            self.revision += 1
+
+    def save(self) -> bool:
+        '''
+        Save the index to its file, if it changed. The file will be
+        written to a temp file first and then replaced so that a
+        concurrently running program never reads a half written index.
+
+        Returns:
+            bool: Returns True on success.
+        '''
+        if not self.changed or not self.index_file:
+            return False
+        try:
+            directory = os.path.dirname(self.index_file)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory)
+            tmp_file = f'{self.index_file}.{os.getpid()}.tmp'
+            with open(tmp_file, 'w') as index_file:
+                json.dump(
+                    {
+                        'version': self.INDEX_VERSION,
+                        'fingerprint': self.fingerprint,
+                        'entries': self.entries,
+                    },
+                    index_file,
+                )
+            os.replace(tmp_file, self.index_file)
+            self.changed = False
+            return True
+        except Exception:
+            return False
+
+    def set(self, abs_filename: str, record: dict) -> None:
+        '''
+        Set the record for the given absolute filename with the
+        actual signature of the file.
+
+        Args:
+            abs_filename (str): The absolute filename.
+            record (dict): The record to store.
+        '''
+        self.load()
+        signature = self.file_signature(abs_filename)
+        if signature is None:
+            self.remove(abs_filename)
+            return
+        self.entries[abs_filename] = {
+            'mtime': signature[0],
+            'size': signature[1],
+            'record': record,
+        }
+        self.changed = True
+        self.revision += 1
+
+    def update(
+        self, abs_filenames: list[str], projector: Callable[[str], dict]
+    ) -> dict[str, dict]:
+        '''
+        Bring the index up to date with the given files. Only new or
+        changed files will be passed to the projector, which should
+        return the record for that file. Records of files, which do
+        not exist in the given list anymore, will be removed. The
+        index gets saved afterwards, if something changed.
+
+        Args:
+            abs_filenames (list): \
+                The list with all the absolute filenames, which \
+                should be in the index.
+            projector (Callable): \
+                The callable, which gets an absolute filename and \
+                returns the record for it.
+
+        Returns:
+            dict: \
+                Returns the records with the absolute filename as the \
+                key in the order of the given list.
+        '''
+        self.load()
+        output = {}
+        for abs_filename in abs_filenames:
+            signature = self.file_signature(abs_filename)
+            if signature is None:
+                continue
+            entry = self.entries.get(abs_filename)
+            if (
+                entry is None
+                or entry.get('mtime') != signature[0]
+                or entry.get('size') != signature[1]
+            ):
+                entry = {
+                    'mtime': signature[0],
+                    'size': signature[1],
+                    'record': projector(abs_filename),
+                }
+                self.entries[abs_filename] = entry
+                self.changed = True
+                self.revision += 1
+            output[abs_filename] = entry['record']
+
+        # remove entries of files, which do not exist anymore
+        for abs_filename in list(self.entries.keys()):
+            if abs_filename not in output:
+                del self.entries[abs_filename]
+                self.changed = True
+                self.revision += 1
+
+        self.save()
+        return output
@@ -35,6 +35,12 @@ and what its default value is.
 
 I really hope, it is clear and also I hope I myself will understand
 this whole principle in a year or so still. :D
+
+Optionally the fixed fields can be loaded lazily: the readable values
+are kept as they are and only converted on their first access. This
+way e.g. listing many documents does not have to convert all their
+postings. Untouched fields can also be written back to the YAML as
+they were loaded, without converting them back and forth.
 '''
 
 from plainvoice.model.field.field_conversion_manager import FieldConversionManager
@@ -78,6 +84,13 @@ class DataModel:
         should have a certain set of fields, or so.
         '''
 
+        self.fixed_field_conversion_manager_shared: bool = False
+        '''
+        If True, the FieldConversionManager is shared with other
+        objects; e.g. all documents of the same document type. It
+        will be copied, before it gets changed by this object.
+        '''
+
         self.fixed = {}
         '''
         The "fixed" fields for the data object. The idea is to
@@ -96,6 +109,26 @@ class DataModel:
         to exist in this data object.
         '''
 
+        self.fixed_readable: dict[str, Any] = {}
+        '''
+        In lazy mode this dict holds the readable values of the fixed
+        fields, which were loaded, yet not converted so far. Their keys
+        still exist in self.fixed, so that the order stays the same.
+        '''
+
+        self.fixed_revision: int = 0
+        '''
+        The revision of the fixed fields. It gets increased on every
+        write to them, so that values calculated from the fixed fields
+        can be cached as long as the revision stays the same.
+        '''
+
+        self.lazy_fixed: bool = False
+        '''
+        If True, the fixed fields from from_dict() will be converted
+        on their first access instead of immediately.
+        '''
+
         self.name = name
         '''
         The name of the DataModel. This will be used for saving to
@@ -127,19 +160,48 @@ class DataModel:
                 readable default later. So it should be a basic \
                 Python object like str, int, float, list or dict.
         '''
+        self._own_fixed_field_conversion_manager()
         self.fixed_field_conversion_manager.add_field_descriptor(
             fieldname, typename, default
         )
+        self.fixed_readable.pop(fieldname, None)
         self.fixed[fieldname] = (
             self.fixed_field_conversion_manager.convert_field_to_internal(fieldname, {})
         )
 
+    def _convert_fixed_readable(self, fieldname: str | None = None) -> None:
+        '''
+        Convert the readable values of the fixed fields, which were
+        loaded lazily and not converted yet, to internal.
+
+        Args:
+            fieldname (str): \
+                Only convert this field. If None, all not yet \
+                converted fields will be converted. (default: `None`)
+        '''
+        if not self.fixed_readable:
+            return
+        fieldnames = (
+            list(self.fixed_readable.keys()) if fieldname is None else [fieldname]
+        )
+        for name in fieldnames:
+            if name in self.fixed_readable:
+                self.fixed[name] = (
+                    self.fixed_field_conversion_manager.convert_field_to_internal(
+                        name, {name: self.fixed_readable.pop(name)}
+                    )
+                )
+
     @classmethod
     def create_instance(cls):
         return cls()
 
     def define_fixed_field_type(
-        self, field_type_str: str, to_internal: Callable, to_readable: Callable
+        self,
+        field_type_str: str,
+        to_internal: Callable,
+        to_readable: Callable,
+        keep_readable: bool = True,
     ) -> None:
         '''
         Define / add a field to the fixed fields. It's basically a
@@ -158,9 +220,15 @@ class DataModel:
             to_readable (Callable): \
                 The callable with which the fields data gets \
                 converted to readbale from internal.
+            keep_readable (bool): \
+                If True, a lazily loaded readable value, which was never \
+                converted, can be written back as it is. Set it to False, \
+                if the conversion changes its meaning; e.g. a relative \
+                date. (default: `True`)
         '''
+        self._own_fixed_field_conversion_manager()
         self.fixed_field_conversion_manager.add_field_type(
-            field_type_str, to_internal, to_readable
+            field_type_str, to_internal, to_readable, keep_readable
         )
 
     def field_exists(self, fieldname: str) -> bool:
@@ -238,6 +306,7 @@ class DataModel:
         and set the fields new with their defaults!
         '''
         self.fixed = {}
+        self.fixed_readable = {}
         for fieldname in self.fixed_field_conversion_manager.get_fieldnames():
             default = self.fixed_field_conversion_manager.get_default_for_fieldname(
                 fieldname, False
@@ -267,21 +336,39 @@ class DataModel:
         Convert given dict data to be put onto the fixed fields. The
         values in of these fields should be in the readable format.
 
+        In lazy mode the given values are only stored and converted
+        on their first access. Missing fields still get their default
+        immediately, like in the normal conversion.
+
         Args:
             values (dict): The dict to load additional fields from.
         '''
         self.fixed = {}
-        self.fixed = self.fixed_field_conversion_manager.convert_dict_to_internal(
-            values
+        self.fixed_readable = {}
+        self.fixed_revision += 1
+        manager = self.fixed_field_conversion_manager
+        if not self.lazy_fixed:
+            self.fixed = manager.convert_dict_to_internal(values)
+            return
+        for fieldname in values:
+            if fieldname in manager.name_to_field_type_converter:
+                self.fixed[fieldname] = None
+                self.fixed_readable[fieldname] = values[fieldname]
+        manager.fill_missing_fieldnames(
+            self.fixed,
+            list(set(manager.user_descriptor.keys()) - set(values.keys())),
+            True,
         )
 
     def get(self, fieldname: str, readable: bool = False) -> Any:
         '''
         This is a magical getter method, which will return either
         a class attribute with the fieldname, if it exists, or
-        a fixed field or an additional one. Internally it will
-        convert the object to a dict, which should create a flat
-        dict and output the value on the given key then.
+        a fixed field or an additional one. It resolves the field
+        the same way, as if the object would be converted to a flat
+        dict with to_dict() first: additional fields overwrite fixed
+        fields, which overwrite the base attributes. Yet only the
+        requested field gets converted.
 
         Args:
             fieldname (str): \
@@ -293,7 +380,20 @@ class DataModel:
         Returns:
             Any: Returns the class attribute, an additional field or None.
         '''
-        return self.to_dict(readable).get(fieldname)
+        if fieldname in self.additional:
+            return self.additional[fieldname]
+
+        # same rules as in FieldConversionManager.convert_dict():
+        # readable fixed fields only exist with a converter, or
+        # with their default, if they are described, yet not set
+        manager = self.fixed_field_conversion_manager
+        if fieldname in self.fixed:
+            if not readable or fieldname in manager.name_to_field_type_converter:
+                return self.get_fixed(fieldname, readable)
+        elif readable and fieldname in manager.name_to_default:
+            return manager.name_to_default[fieldname]
+
+        return self._to_dict_base().get(fieldname)
 
     def get_additional(self, fieldname: str) -> Any:
         '''
@@ -335,6 +435,7 @@ class DataModel:
         Returns:
             Any: Returns the respecting data, if existend.
         '''
+        self._convert_fixed_readable(fieldname)
         if readable:
             return self.fixed_field_conversion_manager.convert_field_to_readable(
                 fieldname, self.fixed
@@ -372,6 +473,27 @@ class DataModel:
         '''
         return self.visible
 
+    def _own_fixed_field_conversion_manager(self) -> None:
+        '''
+        Make sure that the FieldConversionManager is not shared with
+        other objects, before changing it. A shared one gets copied.
+        '''
+        if self.fixed_field_conversion_manager_shared:
+            self.fixed_field_conversion_manager = (
+                self.fixed_field_conversion_manager.copy()
+            )
+            self.fixed_field_conversion_manager_shared = False
+
+    def set_lazy_fixed(self, lazy_fixed: bool = True) -> None:
+        '''
+        Set if the fixed fields should be converted lazily on their
+        first access, when loading them with from_dict().
+
+        Args:
+            lazy_fixed (bool): Lazy mode on or off. (default: `True`)
+        '''
+        self.lazy_fixed = lazy_fixed
+
     def set_additional(self, fieldname: str, value: Any) -> None:
         '''
         Set an additional value to the field with the given fieldname.
@@ -413,6 +535,7 @@ class DataModel:
         Args:
             descriptor (dict): The descriptor dict.
         '''
+        self._own_fixed_field_conversion_manager()
         self.fixed_field_conversion_manager.set_descriptor(descriptor)
         self.init_default_fixed_fields()
 
@@ -444,7 +567,23 @@ class DataModel:
             )
 
         # finally set the value
+        self.fixed_readable.pop(fieldname, None)
         self.fixed[fieldname] = value
+        self.fixed_revision += 1
+
+    def share_fixed_field_conversion_manager(
+        self, manager: FieldConversionManager
+    ) -> None:
+        '''
+        Use the given FieldConversionManager, which is shared with
+        other objects. It must not be changed then, thus this object
+        will copy it first, if it has to change it later on.
+
+        Args:
+            manager (FieldConversionManager): The shared manager.
+        '''
+        self.fixed_field_conversion_manager = manager
+        self.fixed_field_conversion_manager_shared = True
 
     def show(self) -> None:
         '''
@@ -497,7 +636,9 @@ class DataModel:
         '''
         return {'visible': self.visible}
 
-    def _to_dict_fixed(self, readable: bool = False) -> dict:
+    def _to_dict_fixed(
+        self, readable: bool = False, keep_readable: bool = False
+    ) -> dict:
         '''
         Get the fixed fields of this object as a dict. Also they
         can be output in a readble converted format or not.
@@ -506,11 +647,37 @@ class DataModel:
             readable (bool): \
                 If True, fields will be converted to readble \
                 first (default: `False`)
-        '''
-        if readable:
-            return self.fixed_field_conversion_manager.convert_dict_to_readable(
-                self.fixed
+            keep_readable (bool): \
+                If True and readable is True, lazily loaded fields, \
+                which were not converted yet, are output as they were \
+                loaded, if their type allows it. (default: `False`)
+        '''
+        manager = self.fixed_field_conversion_manager
+        if not (readable and keep_readable):
+            self._convert_fixed_readable()
+        elif self.fixed_readable:
+            # convert the fields, which cannot be kept as they are
+            for fieldname in list(self.fixed_readable.keys()):
+                if not manager.can_keep_readable(fieldname):
+                    self._convert_fixed_readable(fieldname)
+            # same as FieldConversionManager.convert_dict(), yet
+            # with the kept readable values
+            output = {}
+            for fieldname in self.fixed:
+                if fieldname in self.fixed_readable:
+                    output[fieldname] = self.fixed_readable[fieldname]
+                elif fieldname in manager.name_to_field_type_converter:
+                    output[fieldname] = manager.convert_field_to_readable(
+                        fieldname, self.fixed
+                    )
+            manager.fill_missing_fieldnames(
+                output,
+                list(set(manager.user_descriptor.keys()) - set(self.fixed.keys())),
+                False,
             )
+            return output
+        if readable:
+            return manager.convert_dict_to_readable(self.fixed)
         else:
             return self.fixed
 
@@ -537,9 +704,9 @@ class DataModel:
         fixed_str = (
             f'''# fixed fields
 
-{data_utils.to_yaml_string(self._to_dict_fixed(True)).strip()}
+{data_utils.to_yaml_string(self._to_dict_fixed(True, True)).strip()}
 '''.strip()
-            if self._to_dict_fixed()
+            if self.fixed
             else ''
         )
 
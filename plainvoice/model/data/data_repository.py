@@ -6,16 +6,36 @@ It also contains a rename method.
 
 Itself has the File class as a component for the file operations. Yet also
 for absolute filepath generation.
+
+Optionally it can have a DataIndex, which holds a small record for every
+file. With it listing the data objects does not need to parse every
+single file again.
+
+Also loading many files at once can optionally be done with a thread
+pool. This helps with slow filesystems, where the latency of opening
+and reading the files dominates.
+
+Also optionally it can have a CodeAllocator, which stores the highest
+used code so that getting the next code does not need a folder scan.
 '''
 
+from plainvoice.model.data.code_allocator import CodeAllocator
+from plainvoice.model.data.data_index import DataIndex
 from plainvoice.model.data.data_model import DataModel
 from plainvoice.model.file.file import File
+from plainvoice.utils import math_utils
 
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterator
 
 
 class DataRepository:
 
+    CHUNK_SIZE_PER_WORKER: int = 4
+    '''
+    The number of files per worker, which iter_files() loads at once.
+    '''
+
     def __init__(self, folder: str = '', filename_pattern: str = ''):
         '''
         The main class for loading / saving certain data objects.
@@ -31,6 +51,71 @@ class DataRepository:
         '''
         self.file = File(folder, 'yaml', filename_pattern)
 
+        self.code_allocator: CodeAllocator | None = None
+        '''
+        The optional persistent allocator for the next code.
+        '''
+
+        self.index: DataIndex | None = None
+        '''
+        The optional persistent index for the files of this repository.
+        '''
+
+        self.index_projector: Callable[[str, dict], dict] = self.project_index_record
+        '''
+        The callable, which generates the index record from the
+        absolute filename and the loaded dict of a file.
+        '''
+
+        self.workers: int = 1
+        '''
+        The number of workers for loading many files at once. With
+        1 or less, the files will be loaded one after another.
+        '''
+
+    def _generate_filename_for_code(self, code: int) -> str:
+        '''
+        Generate the absolute filename for the given code according
+        to the filename pattern.
+
+        Args:
+            code (int): The code.
+
+        Returns:
+            str: Returns the absolute filename.
+        '''
+        return self.file.generate_absolute_filename(
+            self.file.generate_name({'code': code})
+        )
+
+    def _scan_highest_code(self) -> tuple[int, str]:
+        '''
+        Scan the folder for the highest code.
+
+        Returns:
+            tuple: Returns (code, absolute filename carrying it).
+        '''
+        return self.file.get_highest_code(
+            self.file.find_of_type(self.file.get_folder(), self.file.get_extension())
+        )
+
+    def allocate_next_code(self) -> str:
+        '''
+        Get the next code and allocate it, so that another program
+        creating a data object at the same time won't get it as well.
+        Without a CodeAllocator this is the same as get_next_code().
+
+        Returns:
+            str: Returns the allocated code string.
+        '''
+        if self.code_allocator is None:
+            return self.get_next_code()
+        return str(
+            self.code_allocator.allocate(
+                self._scan_highest_code, self._generate_filename_for_code
+            )
+        )
+
     def exists(self, name: str) -> bool:
         '''
         Check if the given DataModel exists in the repo.
@@ -70,12 +155,79 @@ class DataRepository:
     def get_folder(self):
         return self.file.get_folder
 
+    def get_index_records(
+        self, show_only_visible: bool = True, loaded: dict | None = None
+    ) -> dict[str, dict]:
+        '''
+        Get the index records of all available data objects with their
+        absolute filename as the key. Only new or changed files will be
+        parsed for this. Without an index set, every file will be parsed
+        and the default record will be generated on the fly.
+
+        Args:
+            show_only_visible (bool): \
+                Only get records of the data objects, which are visible.
+            loaded (dict): \
+                Optionally a dict, which will be filled with the dicts \
+                of the files, which had to be parsed for the index. \
+                This way the caller does not have to parse them again.
+
+        Returns:
+            dict: Returns the records on the absolute filenames.
+        '''
+
+        data_files = self.get_files_of_data_type()
+
+        # with workers, load all files, which have to be parsed,
+        # in parallel first; the projector will then use them
+        preloaded = {}
+        if self.workers > 1:
+            preloaded = self.load_files(
+                data_files
+                if self.index is None
+                else self.index.get_outdated(data_files)
+            )
+
+        def projector(abs_filename: str) -> dict:
+            if abs_filename in preloaded:
+                data = preloaded[abs_filename]
+            else:
+                data = self.file.load_from_yaml_file(abs_filename) or {}
+            if loaded is not None:
+                loaded[abs_filename] = data
+            return self.index_projector(abs_filename, data)
+
+        if self.index is None:
+            records = {data_file: projector(data_file) for data_file in data_files}
+        else:
+            records = self.index.update(data_files, projector)
+        if show_only_visible:
+            records = {
+                abs_filename: record
+                for abs_filename, record in records.items()
+                if record.get('visible')
+            }
+        return records
+
+    def get_index_revision(self) -> int | None:
+        '''
+        Get the revision of the index, which changes with every
+        change of its records.
+
+        Returns:
+            int | None: Returns the revision or None without an index.
+        '''
+        return None if self.index is None else self.index.revision
+
     def get_list(self, show_only_visible: bool = True) -> dict[str, dict]:
         '''
         Get a dict of all available data objects as dicts. The name
         of the DataModel is on the key and the dict with the loaded
         data on the value.
 
+        If an index is set, it will be used to skip files, which are
+        not visible, without parsing them.
+
         Args:
             show_only_visible (bool): \
                 Show only the DataModels with the attribute set \
@@ -86,10 +238,22 @@ class DataRepository:
         Returns:
             dict: Returns a dict with the DataModel-dicts on their names.
         '''
+        if self.index is not None:
+            loaded = {}
+            records = self.get_index_records(show_only_visible, loaded)
+            loaded.update(
+                self.load_files(
+                    [data_file for data_file in records if data_file not in loaded]
+                )
+            )
+            return {
+                self.file.extract_name_from_path(data_file): loaded[data_file]
+                for data_file in records
+            }
+
         data_files = self.get_files_of_data_type()
         data_list = {}
-        for data_file in data_files:
-            tmp_data = self.file.load_from_yaml_file(data_file)
+        for data_file, tmp_data in self.load_files(data_files).items():
             name = self.file.extract_name_from_path(data_file)
             add_me = (
                 show_only_visible and tmp_data.get('visible')
@@ -108,12 +272,99 @@ class DataRepository:
         the programm ot be able to get the next invoice number ("code") from
         the filenames with the specified pattern.
 
+        With a CodeAllocator set, the folder only gets scanned, if
+        the stored highest code does not match the files anymore.
+
         Returns:
             str: Returns an code string.
         '''
-        return self.file.get_next_code(
-            self.file.find_of_type(self.file.get_folder(), self.file.get_extension())
-        )
+        if self.code_allocator is not None:
+            return str(
+                self.code_allocator.get_next_code(
+                    self._scan_highest_code, self._generate_filename_for_code
+                )
+            )
+        return str(self._scan_highest_code()[0] + 1)
+
+    def iter_documents(
+        self,
+        visible_only: bool = True,
+        order: Callable[[dict], Any] | None = None,
+    ) -> Iterator[tuple[str, dict]]:
+        '''
+        Iterate over the data objects as (absolute filename, dict)
+        tuples, while only a few files are loaded at once. So unlike
+        get_list() the memory does not grow with the number of files.
+
+        The selection and the sorting happens with the index records
+        only; without an index they are generated by parsing every file
+        once more. Without an index and without an order, the files
+        are simply loaded one after another instead.
+
+        Args:
+            visible_only (bool): \
+                Only iterate over the visible data objects.
+            order (Callable): \
+                Optionally the key function for sorting, which gets \
+                the index record of a file. If None, the files are \
+                iterated in their found order.
+
+        Returns:
+            Iterator: Yields (absolute filename, dict) tuples.
+        '''
+        if self.index is None and order is None:
+            for abs_filename, data in self.iter_files(self.get_files_of_data_type()):
+                if not visible_only or data.get('visible'):
+                    yield abs_filename, data
+            return
+
+        records = self.get_index_records(visible_only)
+        abs_filenames = list(records)
+        if order is not None:
+            abs_filenames.sort(key=lambda abs_filename: order(records[abs_filename]))
+        yield from self.iter_files(abs_filenames)
+
+    def iter_files(self, abs_filenames: list[str]) -> Iterator[tuple[str, dict]]:
+        '''
+        Iterate over the loaded dicts of the given files in the given
+        order. They are loaded in small chunks with load_files(), so
+        that the workers can still be used, while only one chunk is
+        in memory at once.
+
+        Args:
+            abs_filenames (list): The absolute filenames to load.
+
+        Returns:
+            Iterator: Yields (absolute filename, dict) tuples.
+        '''
+        chunk_size = self.workers * self.CHUNK_SIZE_PER_WORKER
+        for start in range(0, len(abs_filenames), chunk_size):
+            end = start + chunk_size
+            yield from self.load_files(abs_filenames[start:end]).items()
+
+    def load_files(self, abs_filenames: list[str]) -> dict[str, dict]:
+        '''
+        Load the given files. If more than one worker is set, they
+        will be loaded in a thread pool. Either way the output has
+        the same order as the given list.
+
+        Args:
+            abs_filenames (list): The absolute filenames to load.
+
+        Returns:
+            dict: Returns the loaded dicts on the absolute filenames.
+        '''
+        if self.workers <= 1 or len(abs_filenames) <= 1:
+            datas = [
+                self.file.load_from_yaml_file(abs_filename)
+                for abs_filename in abs_filenames
+            ]
+        else:
+            with ThreadPoolExecutor(min(self.workers, len(abs_filenames))) as executor:
+                datas = list(executor.map(self.file.load_from_yaml_file, abs_filenames))
+        return {
+            abs_filename: data or {} for abs_filename, data in zip(abs_filenames, datas)
+        }
 
     def load_string_from_name(self, name: str) -> str:
         '''
@@ -132,6 +383,29 @@ class DataRepository:
         else:
             return ''
 
+    def load_base_dict_from_name(self, name: str) -> dict[str, Any]:
+        '''
+        Load only the base variables of the data object with the
+        given name, without parsing its other fields. They are
+        the block "# base variables", which DataModel.to_yaml_string()
+        writes first. If the file does not start with it, the whole
+        file will be loaded instead.
+
+        Args:
+            name (str): The name string of the data object.
+
+        Returns:
+            dict: Returns the loaded dict or otherwise an empty one.
+        '''
+        if not self.file.exists(name):
+            return {}
+        base = self.file.load_head_from_yaml_file(
+            name, '# base variables', ('# fixed fields', '# additional fields')
+        )
+        if base is None:
+            return self.load_dict_from_name(name)
+        return base
+
     def load_dict_from_name(self, name: str) -> dict[str, Any]:
         '''
         Load the data from just the given data name string.
@@ -149,6 +423,21 @@ class DataRepository:
         else:
             return {}
 
+    @staticmethod
+    def project_index_record(abs_filename: str, data: dict) -> dict:
+        '''
+        The default projector for the index. It only stores the
+        base attribute "visible" of the data object.
+
+        Args:
+            abs_filename (str): The absolute filename of the data object.
+            data (dict): The loaded dict of the data object.
+
+        Returns:
+            dict: Returns the index record.
+        '''
+        return {'visible': bool(data.get('visible'))}
+
     def remove(self, name: str) -> bool:
         '''
         Remove the DataModel with the given name.
@@ -162,6 +451,9 @@ class DataRepository:
         if not self.file.exists(name):
             return False
         else:
+            if self.index is not None:
+                self.index.remove(self.file.generate_absolute_filename(name))
+                self.index.save()
             return self.file.remove(name)
 
     def rename(self, old_name: str, new_name: str) -> bool:
@@ -179,6 +471,9 @@ class DataRepository:
         if self.file.exists(new_name):
             return False
         else:
+            if self.index is not None:
+                self.index.remove(self.file.generate_absolute_filename(old_name))
+                self.index.save()
             return self.file.rename(old_name, new_name)
 
     def save(self, data_model: DataModel, name: str = '') -> str:
@@ -203,8 +498,58 @@ class DataRepository:
         content_to_save = data_model.to_yaml_string()
         if self.file.save_to_file(content_to_save, name):
             final_filename = self.file.generate_absolute_filename(name)
+            # the file changed; let the index parse it again on its
+            # next update, even if the mtime did not change visibly
+            if self.index is not None:
+                self.index.remove(final_filename)
+            if self.code_allocator is not None:
+                code = self.file.extract_code_from_filename(
+                    self.file.extract_name_from_path(final_filename, False)
+                )
+                if math_utils.is_convertible_to_int(code):
+                    self.code_allocator.observe(int(code), final_filename)
         return final_filename
 
+    def set_code_allocator(self, code_allocator: CodeAllocator | None) -> None:
+        '''
+        Set the persistent code allocator for this repository.
+
+        Args:
+            code_allocator (CodeAllocator): \
+                The allocator to use or None to scan the folder always.
+        '''
+        self.code_allocator = code_allocator
+
+    def set_index(
+        self,
+        index: DataIndex | None,
+        projector: Callable[[str, dict], dict] | None = None,
+    ) -> None:
+        '''
+        Set the persistent index for this repository.
+
+        Args:
+            index (DataIndex): \
+                The index to use or None to not use an index at all.
+            projector (Callable): \
+                Optionally the callable, which generates a record \
+                from the absolute filename and the loaded dict of \
+                a file. It should contain at least "visible".
+        '''
+        self.index = index
+        self.index_projector = (
+            projector if projector is not None else self.project_index_record
+        )
+
+    def set_workers(self, workers: int) -> None:
+        '''
+        Set the number of workers for loading many files at once.
+
+        Args:
+            workers (int): The number of workers; 1 means sequential.
+        '''
+        self.workers = max(1, workers)
+
     @property
     def set_filename_pattern(self):
         return self.file.set_filename_pattern
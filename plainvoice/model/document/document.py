@@ -39,6 +39,7 @@ Jinja template later directly.
 
 from plainvoice.model.data.data_model import DataModel
 from plainvoice.model.document.document_type import DocumentType
+from plainvoice.model.field.field_conversion_manager import FieldConversionManager
 from plainvoice.model.posting.posting import Posting
 from plainvoice.model.posting.postings_list import PostingsList
 from plainvoice.model.quantity.quantity import Quantity
@@ -49,13 +50,16 @@ from datetime import datetime, timedelta
 from decimal import Decimal
 
 
-def date_to_internal(value: str | None) -> datetime | None:
+def date_to_internal(value: str | None, now: datetime | None = None) -> datetime | None:
     '''
     Convert the readable string (or None) for a date
     type to the internal value.
 
     Args:
         value (str | None): The value to convert.
+        now (datetime): \
+            The point of time, relative dates like "+14" are \
+            calculated from. (default: `datetime.now()`)
 
     Return:
         datetime: Returns the converted datetime object.
@@ -67,9 +71,12 @@ def date_to_internal(value: str | None) -> datetime | None:
             except Exception:
                 # fallback is just "today"
                 days = 0
-            date = datetime.now()
+            date = now if now is not None else datetime.now()
             date = date + timedelta(days=days)
             return date
+        elif len(value) == 10 and value[4] == '-' and value[7] == '-':
+            # the usual zero padded format can be parsed way faster
+            return datetime.fromisoformat(value)
         else:
             return datetime.strptime(value, '%Y-%m-%d')
     else:
@@ -81,6 +88,12 @@ class Document(DataModel):
     Base class which implements the flexible DataModel system.
     '''
 
+    field_types: FieldConversionManager | None = None
+    '''
+    The FieldConversionManager with all field types for documents.
+    It gets created on first use by get_field_types().
+    '''
+
     def __init__(self, doc_typename: str = '', name: str = ''):
         '''
         The document object, which can be any DocumentType
@@ -136,10 +149,60 @@ class Document(DataModel):
         It can also be a list with multiple field names.
         '''
 
+        self.totals_cache: tuple[tuple, dict] | None = None
+        '''
+        The key describing the postings and the totals calculated
+        for them. See Posting.get_totals_key() for the key.
+        '''
+
         self.links: list[str] = []
+        '''
+        The absolute filenames of the linked documents. It is a list,
+        since its order is kept in the file.
+        '''
+
+        self.links_lookup: tuple[list[str], set[str]] | None = None
+        '''
+        The links list together with a set of its absolute filenames
+        for checking a link without scanning the list. The list only
+        gets changed by add_link() and remove_link(), which keep the set
+        up to date; it gets rebuilt, if the list got replaced.
+        '''
 
         self._init_fixed_fields()
 
+    def __eq__(self, other: object) -> bool:
+        '''
+        Documents are equal, if they are the same instance or if they
+        have the same absolute filename; documents without a filename
+        are only equal to themselves.
+
+        Args:
+            other (object): The object to compare with.
+
+        Returns:
+            bool: Returns True, if both are the same document.
+        '''
+        if self is other:
+            return True
+        if not isinstance(other, Document):
+            return NotImplemented
+        return bool(self.abs_filename) and self.abs_filename == other.abs_filename
+
+    def __hash__(self) -> int:
+        '''
+        Hash the document by its absolute filename or by its instance,
+        if it has no filename yet. Since the hash changes, when the
+        filename changes, DocumentLinkManager.rename_document() has to
+        be used for renaming documents, which are linked.
+
+        Returns:
+            int: Returns the hash.
+        '''
+        if self.abs_filename:
+            return hash(self.abs_filename)
+        return object.__hash__(self)
+
     def add_days_to_date(self, fieldname: str, days: int) -> None:
         '''
         Add days to the date, which is supposed to be on the field
@@ -162,8 +225,10 @@ class Document(DataModel):
         Args:
             abs_filename (str): The absolute filename of the other document.
         '''
-        if abs_filename not in self.links:
+        links_set = self._get_links_set()
+        if abs_filename not in links_set:
             self.links.append(abs_filename)
+            links_set.add(abs_filename)
 
     def days_between_dates(self, fieldname_a: str, fieldname_b: str) -> int | None:
         '''
@@ -233,7 +298,7 @@ class Document(DataModel):
         '''
         super()._from_dict_base(values)
         self.doc_typename = values.get('doc_typename', self.doc_typename)
-        self.links = values.get('links', self.links)
+        self.set_links(values.get('links', self.links) or [])
 
     def get_code(self) -> str:
         '''
@@ -283,6 +348,55 @@ class Document(DataModel):
         '''
         return self.get(self.date_due_fieldname, readable)
 
+    @classmethod
+    def get_field_types(cls) -> FieldConversionManager:
+        '''
+        Get the FieldConversionManager with all field types, which
+        can be used for documents. It is created once per class and
+        shared by all documents.
+
+        Returns:
+            FieldConversionManager: Returns the manager with the field types.
+        '''
+        if cls.__dict__.get('field_types') is None:
+            manager = FieldConversionManager()
+
+            # Python basics
+            manager.add_field_type('bool', bool, bool)
+            manager.add_field_type('str', str, str)
+            manager.add_field_type('int', int, int)
+            manager.add_field_type('dict', dict, dict)
+            manager.add_field_type('list', list, list)
+
+            # additional Python modul types
+            # a readable date can be relative like "+14", thus it
+            # always has to be converted, before writing it back
+            manager.add_field_type(
+                'date',
+                lambda x: date_to_internal(x),
+                lambda x: x.strftime('%Y-%m-%d'),
+                False,
+            )
+            manager.add_field_type('Decimal', lambda x: Decimal(str(x)), float)
+
+            # plainvoice types
+            manager.add_field_type('Percentage', lambda x: Percentage(str(x)), str)
+            manager.add_field_type(
+                'Posting',
+                lambda x: Posting().instance_from_dict(x),
+                lambda x: x._to_dict_fixed(True),
+            )
+            manager.add_field_type(
+                'PostingsList',
+                lambda x: PostingsList().instance_from_list(x),
+                lambda x: x.get_postings(True),
+            )
+            manager.add_field_type('Price', lambda x: Price(str(x)), str)
+            manager.add_field_type('Quantity', lambda x: Quantity(str(x)), str)
+
+            cls.field_types = manager
+        return cls.field_types
+
     def get_filename(self) -> str:
         '''
         Get the absolute filename of this document. This will be
@@ -313,12 +427,27 @@ class Document(DataModel):
     def get_links(self) -> list[str]:
         '''
         Get the list with the absolute filenames of the
-        linked documents.
+        linked documents. It is a copy; so the links can only
+        be changed with add_link(), remove_link() or set_links().
 
         Returns:
             str: Returns linked documents filenames list.
         '''
-        return self.links
+        return list(self.links)
+
+    def _get_links_set(self) -> set[str]:
+        '''
+        Get the set of the absolute filenames in the links list. It
+        gets rebuilt, if the list was replaced.
+
+        Returns:
+            set: Returns the set of the linked absolute filenames.
+        '''
+        lookup = self.links_lookup
+        if lookup is None or lookup[0] is not self.links:
+            lookup = (self.links, set(self.links))
+            self.links_lookup = lookup
+        return lookup[1]
 
     def get_now_or_date(self, date_fieldname: str = '') -> datetime | None:
         '''
@@ -419,7 +548,8 @@ class Document(DataModel):
     ) -> Price | str:
         '''
         Get the total, vat or both together summarized for all fields,
-        which are of type PostingsList or Posting.
+        which are of type PostingsList or Posting. The Price is a copy
+        of the cached one.
 
         Args:
             what (str): "total", "vat" or "total_with_vat"
@@ -428,23 +558,11 @@ class Document(DataModel):
         Returns:
             Price | str: The total amount as a Price or Any.
         '''
-        total = Price()
-        for posting in self.get_postings():
-            if what == 'total':
-                posting_total = posting.get_total(False)
-            elif what == 'vat':
-                posting_total = posting.get_vat(False)
-            else:
-                posting_total = posting.get_total_with_vat(False)
-            total = total + posting_total
-            # just set the last fetched currency as the new currency.
-            # the probability is high that only one currency will
-            # be used inside one document anyway.
-            total.set_currency(posting_total.get_currency())
+        total = self._get_totals()[what]
         if readable:
             return str(total)
         else:
-            return total
+            return total.copy()
 
     def get_total_with_vat(self, readable: bool = False) -> Price | str:
         '''
@@ -459,6 +577,48 @@ class Document(DataModel):
         '''
         return self._get_total_vat_and_both('total_with_vat', readable)
 
+    def _get_totals(self) -> dict:
+        '''
+        Get the cached totals of get_totals() without copying them.
+        They must not be changed.
+
+        Returns:
+            dict: Returns the cached totals.
+        '''
+        key = (self.fixed_revision, Posting.get_totals_key(self.get_postings()))
+        if self.totals_cache is not None and self.totals_cache[0] == key:
+            return self.totals_cache[1]
+        totals = {'total': Price(), 'vat': Price(), 'total_with_vat': Price()}
+        by_vat: dict = {}
+        for posting, _ in key[1]:
+            posting_totals = posting._get_totals()
+            for what in totals:
+                totals[what] = totals[what] + posting_totals[what]
+                # just set the last fetched currency as the new currency.
+                # the probability is high that only one currency will
+                # be used inside one document anyway.
+                totals[what].set_currency(posting_totals[what].get_currency())
+            Posting.add_totals_by_vat(by_vat, posting_totals['by_vat'])
+        totals['by_vat'] = by_vat
+        self.totals_cache = (key, totals)
+        return totals
+
+    def get_totals(self) -> dict:
+        '''
+        Get the total, vat and both together summarized for all
+        postings, also grouped by their vat rate, in one pass. The
+        result is cached until a posting or a fixed field of this
+        document changes by set_fixed(); changing a field object
+        in-place, e.g. with set_value(), does not invalidate it.
+        The returned totals are a copy of the cached ones.
+
+        Returns:
+            dict: \
+                Returns the dict with "total", "vat", "total_with_vat" \
+                and "by_vat". See Posting.get_totals() for the format.
+        '''
+        return Posting.copy_totals(self._get_totals())
+
     def get_vat(self, readable: bool = False) -> Price | str:
         '''
         Get the vat summarized for all fields, which are of type
@@ -472,23 +632,48 @@ class Document(DataModel):
         '''
         return self._get_total_vat_and_both('vat', readable)
 
-    def init_internals_with_doctype(self, document_type: DocumentType) -> None:
+    def init_internals_with_doctype(
+        self, document_type: DocumentType, init_defaults: bool = True
+    ) -> None:
         '''
         Init internal attributs etc. with the given DocumentType object.
+        The compiled schema of the document type is used, which is
+        shared by all documents of the type.
 
         Args:
             document_type (DocumentType): \
                 The document type object to get some needed \
                 variables from. It is also a DataModel.
-        '''
-        self.set_fixed_fields_descriptor(document_type.get_descriptor())
-        self.date_issued_fieldname = document_type.get_fixed(
-            'date_issued_fieldname', True
-        )
-        self.date_due_fieldname = document_type.get_fixed('date_due_fieldname', True)
-        self.date_done_fieldname = document_type.get_fixed('date_done_fieldname', True)
-        self.title_fieldname = document_type.get_fixed('title_fieldname', True)
-        self.code_fieldname = document_type.get_fixed('code_fieldname', True)
+            init_defaults (bool): \
+                If True, the fixed fields will be filled with their \
+                defaults. Set it to False, if from_dict() is called \
+                afterwards anyway. (default: `True`)
+        '''
+        if not self.fixed_field_conversion_manager_shared:
+            # this document defined own field types; keep them
+            self.set_fixed_fields_descriptor(document_type.get_descriptor())
+            self.date_issued_fieldname = document_type.get_fixed(
+                'date_issued_fieldname', True
+            )
+            self.date_due_fieldname = document_type.get_fixed(
+                'date_due_fieldname', True
+            )
+            self.date_done_fieldname = document_type.get_fixed(
+                'date_done_fieldname', True
+            )
+            self.title_fieldname = document_type.get_fixed('title_fieldname', True)
+            self.code_fieldname = document_type.get_fixed('code_fieldname', True)
+            return
+
+        schema = document_type.get_schema(self.get_field_types())
+        self.share_fixed_field_conversion_manager(schema.fixed_field_conversion_manager)
+        if init_defaults:
+            self.init_default_fixed_fields()
+        self.date_issued_fieldname = schema.date_issued_fieldname
+        self.date_due_fieldname = schema.date_due_fieldname
+        self.date_done_fieldname = schema.date_done_fieldname
+        self.title_fieldname = schema.title_fieldname
+        self.code_fieldname = schema.code_fieldname
 
     def _init_fixed_fields(self) -> None:
         '''
@@ -497,35 +682,9 @@ class Document(DataModel):
         Since this is the universal Document class, which the user
         can define with DocumentType, I already add all possible
         field types here already to make it as flexible as possible.
+        They are defined once in get_field_types() and shared.
         '''
-
-        # Python basics
-        self.define_fixed_field_type('bool', bool, bool)
-        self.define_fixed_field_type('str', str, str)
-        self.define_fixed_field_type('int', int, int)
-        self.define_fixed_field_type('dict', dict, dict)
-        self.define_fixed_field_type('list', list, list)
-
-        # additional Python modul types
-        self.define_fixed_field_type(
-            'date', lambda x: date_to_internal(x), lambda x: x.strftime('%Y-%m-%d')
-        )
-        self.define_fixed_field_type('Decimal', lambda x: Decimal(str(x)), float)
-
-        # plainvoice types
-        self.define_fixed_field_type('Percentage', lambda x: Percentage(str(x)), str)
-        self.define_fixed_field_type(
-            'Posting',
-            lambda x: Posting().instance_from_dict(x),
-            lambda x: x._to_dict_fixed(True),
-        )
-        self.define_fixed_field_type(
-            'PostingsList',
-            lambda x: PostingsList().instance_from_list(x),
-            lambda x: x.get_postings(True),
-        )
-        self.define_fixed_field_type('Price', lambda x: Price(str(x)), str)
-        self.define_fixed_field_type('Quantity', lambda x: Quantity(str(x)), str)
+        self.share_fixed_field_conversion_manager(self.get_field_types())
 
     def is_done(self) -> bool:
         '''
@@ -595,7 +754,7 @@ class Document(DataModel):
         Returns:
             bool: Returns True if it exists.
         '''
-        return abs_filename in self.links
+        return abs_filename in self._get_links_set()
 
     def remove_link(self, abs_filename: str) -> None:
         '''
@@ -605,8 +764,10 @@ class Document(DataModel):
         Args:
             abs_filename (str): The absolute filename of the other document.
         '''
-        if abs_filename in self.links:
+        links_set = self._get_links_set()
+        if abs_filename in links_set:
             self.links.remove(abs_filename)
+            links_set.discard(abs_filename)
 
     def set_filename(self, abs_filename: str) -> None:
         '''
@@ -655,12 +816,13 @@ class Document(DataModel):
 
     def set_links(self, links: list[str] = []) -> None:
         '''
-        Set the linked documents filenames list.
+        Set the linked documents filenames list. It gets copied,
+        so that changing the given list does not change the links.
 
         Args:
             links (list): The list containing the absolute document filenames.
         '''
-        self.links = links
+        self.links = list(links)
 
     def _to_dict_base(self) -> dict:
         '''
@@ -6,10 +6,25 @@ loaded Documents can be fetched from cache by its absolute
 filename or their "docuemnt type + name" combi. Also this
 cache will be used by DocumentLinkManager to link documents
 in a clean way.
+
+The absolute filename is the one key of a cached document; the
+"document type + name" combi only points to it. The cache holds
+only the recently used documents strongly, up to a maximum number
+(LRU). All other cached documents are held by a weak reference,
+so they stay available as long as they are used somewhere else,
+e.g. by the DocumentLinkManager, but can be freed otherwise. Also
+every entry remembers the mtime and size of its file, so that a
+document, whose file changed on disk meanwhile, is not returned
+anymore, but loaded again.
 '''
 
+from plainvoice.model.data.data_index import DataIndex
 from plainvoice.model.document.document import Document
 
+from collections import OrderedDict
+
+import weakref
+
 
 class DocumentCache:
     '''
@@ -18,34 +33,116 @@ class DocumentCache:
     combination.
     '''
 
-    def __init__(self):
+    DEFAULT_MAX_ENTRIES: int = 512
+    '''
+    The default number of documents, which are held strongly.
+    '''
+
+    total_stats: dict[str, int] = {'hits': 0, 'misses': 0, 'evictions': 0}
+    '''
+    The statistics of all DocumentCache instances of the process
+    together, since the program might use more than one
+    DocumentRepository. See get_total_stats().
+    '''
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
         '''
         This object is a cache for Document instances.
+
+        Args:
+            max_entries (int): \
+                The number of recently used documents, which are \
+                held strongly. (default: `DEFAULT_MAX_ENTRIES`)
+        '''
+        self.by_doc_type_and_name: dict[str, str] = {}
+        '''
+        The dict, which holds the absolute filename of the cached
+        Documents based on their document type and name combination.
+        '''
+
+        self.by_filename: OrderedDict[str, Document] = OrderedDict()
+        '''
+        The recently used Documents based on their absolute filename,
+        the least recently used first. These are held strongly.
+        '''
+
+        self.documents: weakref.WeakValueDictionary[str, Document] = (
+            weakref.WeakValueDictionary()
+        )
+        '''
+        All cached Documents based on their absolute filename, held
+        by a weak reference.
+        '''
+
+        self.max_entries: int = max(1, max_entries)
+        '''
+        The number of recently used documents, which are held strongly.
         '''
-        self.by_filename: dict[str, Document] = {}
+
+        self.names: dict[str, str] = {}
+        '''
+        The document type and name combination of every cached
+        document with its absolute filename as the key; the other
+        direction of by_doc_type_and_name.
+        '''
+
+        self.prune_at: int = 2 * self.max_entries
         '''
-        The cache dict, holding Documents based on their
-        absolute filename.
+        The number of signatures, from which on the entries of freed
+        documents get removed.
         '''
 
-        self.by_doc_type_and_name: dict[str, Document] = {}
+        self.signatures: dict[str, tuple | None] = {}
         '''
-        The cache dict, holding Documents based on their
-        document type and name combination.
+        The (mtime, size) signature of the file of every cached
+        document, when it was added, with its absolute filename
+        as the key.
+        '''
+
+        self.stats: dict[str, int] = {'hits': 0, 'misses': 0, 'evictions': 0}
+        '''
+        The number of hits, misses and evictions of this cache.
         '''
 
     def add_document(
-        self, document: Document, doc_typename: str, name: str, abs_filename: str
+        self,
+        document: Document,
+        doc_typename: str,
+        name: str,
+        abs_filename: str,
+        replace: bool = True,
     ) -> None:
         '''
-        Add a document to the cache.
+        Add a document to the cache. By default it replaces the
+        document, which might be cached for the same absolute filename
+        already, since the given one was loaded or saved just now.
 
         Args:
             document (Document): The document to store to the cache.
+            doc_typename (str): The document type name.
+            name (str): The document name.
+            abs_filename (str): The absolute filename of the document.
+            replace (bool): \
+                If False, keep the document, which is cached for the \
+                absolute filename already, as long as its file did not \
+                change. (default: `True`)
         '''
-        # to the filename cache; only if it's given
-        if abs_filename and abs_filename not in self.by_filename:
-            self.by_filename[abs_filename] = document
+        # the absolute filename is the key; without it the
+        # document cannot be checked against its file
+        if not abs_filename:
+            return
+        signature = DataIndex.file_signature(abs_filename)
+        if (
+            not replace
+            and abs_filename in self.documents
+            and self.signatures.get(abs_filename) == signature
+        ):
+            return
+
+        self.documents[abs_filename] = document
+        self.signatures[abs_filename] = signature
+        self.by_filename[abs_filename] = document
+        self.by_filename.move_to_end(abs_filename)
 
         # also the doc_typename + name combi
         # yet only if there is a doc_typename
@@ -53,8 +150,41 @@ class DocumentCache:
             doc_typename = document.get_document_typename()
         if doc_typename:
             combi_name = self.generate_doc_name_combi(doc_typename, name)
-            if combi_name not in self.by_doc_type_and_name:
-                self.by_doc_type_and_name[combi_name] = document
+            old_combi_name = self.names.get(abs_filename)
+            if old_combi_name is not None and old_combi_name != combi_name:
+                self.by_doc_type_and_name.pop(old_combi_name, None)
+            self.by_doc_type_and_name[combi_name] = abs_filename
+            self.names[abs_filename] = combi_name
+
+        self._evict()
+
+    def _count(self, what: str) -> None:
+        '''
+        Count a hit, miss or eviction for this cache and the totals.
+
+        Args:
+            what (str): "hits", "misses" or "evictions"
+        '''
+        self.stats[what] += 1
+        DocumentCache.total_stats[what] += 1
+
+    def _evict(self) -> None:
+        '''
+        Drop the least recently used documents from the strongly held
+        ones, until the maximum is reached again. They stay in the
+        cache as long as they are used somewhere else. Also forget
+        about the documents, which were freed meanwhile.
+        '''
+        while len(self.by_filename) > self.max_entries:
+            self.by_filename.popitem(last=False)
+            self._count('evictions')
+        # documents in reference cycles are freed by the garbage
+        # collector only; so check again after doubling at the earliest
+        if len(self.signatures) > self.prune_at:
+            for abs_filename in list(self.signatures):
+                if abs_filename not in self.documents:
+                    self.remove_document(abs_filename)
+            self.prune_at = 2 * max(self.max_entries, len(self.signatures))
 
     @staticmethod
     def generate_doc_name_combi(doc_typename: str, name: str) -> str:
@@ -84,14 +214,17 @@ class DocumentCache:
             Document: Returns the Document from the cache.
         '''
         doc_type_name_combi = self.generate_doc_name_combi(doc_typename, name)
-        if doc_type_name_combi in self.by_doc_type_and_name:
-            return self.by_doc_type_and_name[doc_type_name_combi]
-        else:
+        abs_filename = self.by_doc_type_and_name.get(doc_type_name_combi)
+        if abs_filename is None:
+            self._count('misses')
             return None
+        return self.get_by_filename(abs_filename)
 
     def get_by_filename(self, abs_filename: str) -> Document | None:
         '''
-        Get a document instance by filename from the cache.
+        Get a document instance by filename from the cache. If its
+        file changed since it was cached, it gets dropped and None
+        is returned, so that it will be loaded again.
 
         Args:
             abs_filename (str): The absolute filename of the document.
@@ -99,10 +232,54 @@ class DocumentCache:
         Returns:
             Document: Returns the Document from the cache.
         '''
-        if abs_filename in self.by_filename:
-            return self.by_filename[abs_filename]
-        else:
+        document = self.documents.get(abs_filename)
+        if document is None or DataIndex.file_signature(
+            abs_filename
+        ) != self.signatures.get(abs_filename):
+            self.remove_document(abs_filename)
+            self._count('misses')
             return None
+        self._count('hits')
+        self.by_filename[abs_filename] = document
+        self.by_filename.move_to_end(abs_filename)
+        self._evict()
+        return document
+
+    def get_stats(self) -> dict[str, int]:
+        '''
+        Get the statistics of this cache.
+
+        Returns:
+            dict: \
+                Returns the dict with "hits", "misses", "evictions" and \
+                the number of cached "entries".
+        '''
+        return dict(self.stats, entries=len(self.documents))
+
+    @staticmethod
+    def get_total_stats() -> dict[str, int]:
+        '''
+        Get the statistics of all caches of the process together.
+
+        Returns:
+            dict: Returns the dict with "hits", "misses" and "evictions".
+        '''
+        return dict(DocumentCache.total_stats)
+
+    def remove_document(self, abs_filename: str) -> None:
+        '''
+        Remove the document with the given absolute filename from
+        the cache, e.g. since its file was removed.
+
+        Args:
+            abs_filename (str): The absolute filename of the document.
+        '''
+        self.by_filename.pop(abs_filename, None)
+        self.documents.pop(abs_filename, None)
+        self.signatures.pop(abs_filename, None)
+        combi_name = self.names.pop(abs_filename, None)
+        if combi_name is not None:
+            self.by_doc_type_and_name.pop(combi_name, None)
 
     def rename_document(
         self,
@@ -120,15 +297,14 @@ class DocumentCache:
 
         Args:
             document (Document): The document to rename.
-
-        Returns:
-            bool: Returns True on success.
-        '''
-        old_combi = self.generate_doc_name_combi(doc_typename, old_name)
-        new_combi = self.generate_doc_name_combi(doc_typename, new_name)
-        if old_combi in self.by_doc_type_and_name:
-            self.by_doc_type_and_name[new_combi] = self.by_doc_type_and_name.pop(
-                old_combi
-            )
-        if old_abs_filename in self.by_filename:
-            self.by_filename[new_abs_filename] = self.by_filename.pop(old_abs_filename)
+            doc_typename (str): The document type name.
+            old_name (str): The old document name.
+            new_name (str): The new document name.
+            old_abs_filename (str): The old absolute filename.
+            new_abs_filename (str): The new absolute filename.
+        '''
+        if old_abs_filename not in self.documents:
+            return
+        cached = self.documents[old_abs_filename]
+        self.remove_document(old_abs_filename)
+        self.add_document(cached, doc_typename, new_name, new_abs_filename)
@@ -11,6 +11,8 @@ extended.
 '''
 
 from plainvoice.model.document.document import Document
+from plainvoice.model.document.document_summary import DocumentSummary
+from plainvoice.model.posting.posting import Posting
 from plainvoice.model.quantity.price import Price
 
 
@@ -19,12 +21,13 @@ class DocumentCalculator:
     This class is for calculating with a list of Document objects.
     '''
 
-    def __init__(self, docs: list[Document]):
+    def __init__(self, docs: list[Document | DocumentSummary]):
         '''
         This class is for calculating with a list of Document objects.
+        DocumentSummary objects can be used as well.
         '''
 
-        self.docs: list[Document] = docs
+        self.docs: list[Document | DocumentSummary] = docs
         '''
         The raw list with Documents which are being calculated.
         '''
@@ -55,15 +58,7 @@ class DocumentCalculator:
         Returns:
             Price | str: Returns the total as a Price object or string.
         '''
-        total = Price()
-        for doc in self.docs:
-            docs_total = doc._get_total_vat_and_both(what, False)
-            if isinstance(docs_total, Price):
-                total = total + docs_total
-                # just set the last fetched currency as the new currency.
-                # the probability is high that only one currency will
-                # be used inside one document anyway.
-                total.set_currency(docs_total.get_currency())
+        total = self.get_totals()[what]
         if readable:
             return str(total)
         else:
@@ -81,6 +76,33 @@ class DocumentCalculator:
         '''
         return self._get_total_vat_and_both('total_with_vat', readable)
 
+    def get_totals(self) -> dict:
+        '''
+        Get the total, vat and both together summarized for all
+        docs, also grouped by their vat rate, in one pass. The
+        totals of each document are cached by the document itself.
+
+        Returns:
+            dict: \
+                Returns the dict with "total", "vat", "total_with_vat" \
+                and "by_vat". See Posting.get_totals() for the format.
+        '''
+        totals = {'total': Price(), 'vat': Price(), 'total_with_vat': Price()}
+        by_vat: dict = {}
+        for doc in self.docs:
+            docs_totals = doc.get_totals()
+            for what in totals:
+                docs_total = docs_totals[what]
+                if isinstance(docs_total, Price):
+                    totals[what] = totals[what] + docs_total
+                    # just set the last fetched currency as the new currency.
+                    # the probability is high that only one currency will
+                    # be used inside one document anyway.
+                    totals[what].set_currency(docs_total.get_currency())
+            Posting.add_totals_by_vat(by_vat, docs_totals['by_vat'])
+        totals['by_vat'] = by_vat
+        return totals
+
     def get_vat(self, readable: bool = False) -> Price | str:
         '''
         Get the vat summarized for all docs.
@@ -0,0 +1,179 @@
+'''
+DocumentCodeIndex class
+
+This class maps the codes of documents to their name and absolute
+filename per document type, also for hidden documents. That way a
+document can be found by its code without loading all documents of
+its type. The entries are built from the records of the DataIndex of
+each document type and are kept up to date by the DocumentRepository
+on saving, renaming and removing documents.
+
+Every entry also stores the signature (mtime and size) of its file,
+so that a found entry can be verified by checking just this one file.
+'''
+
+from plainvoice.model.data.data_index import DataIndex
+
+
+class DocumentCodeIndex:
+    '''
+    The index, which maps document codes to their name and file.
+    '''
+
+    def __init__(self):
+        '''
+        This object is an index for finding documents by their code.
+        '''
+        self.by_code: dict[str, dict[str, dict]] = {}
+        '''
+        The entries with the document type name as the first key and
+        the code as the second key. An entry is a dict with "name",
+        "abs_filename", "mtime" and "size".
+        '''
+
+        self.refreshed: set[str] = set()
+        '''
+        The document type names, which were refreshed from the files
+        during this run. A code, which cannot be found after that,
+        simply does not exist, unless the file changed.
+        '''
+
+    def build(self, doc_typename: str, entries: list[tuple]) -> None:
+        '''
+        Build the code index for the given document type. If more
+        documents have the same code, the first one will be used.
+
+        Args:
+            doc_typename (str): \
+                The document type name.
+            entries (list): \
+                A sorted list with (code, name, abs_filename, signature) \
+                tuples, while the signature is the (mtime, size) tuple of \
+                the file, when its index record was created.
+        '''
+        by_code = {}
+        for code, name, abs_filename, signature in entries:
+            if code and code not in by_code:
+                by_code[code] = self._create_entry(name, abs_filename, signature)
+        self.by_code[doc_typename] = by_code
+
+    @staticmethod
+    def _create_entry(
+        name: str, abs_filename: str, signature: tuple | None = None
+    ) -> dict:
+        '''
+        Create an entry with the given signature of the file or
+        the actual one, if none is given.
+
+        Args:
+            name (str): The document name.
+            abs_filename (str): The absolute filename of the document.
+            signature (tuple): The (mtime, size) tuple of the file.
+
+        Returns:
+            dict: Returns the entry.
+        '''
+        if signature is None:
+            signature = DataIndex.file_signature(abs_filename) or (None, None)
+        return {
+            'name': name,
+            'abs_filename': abs_filename,
+            'mtime': signature[0],
+            'size': signature[1],
+        }
+
+    def get(self, doc_typename: str, code: str) -> dict | None:
+        '''
+        Get the entry for the given code. This won't check the file.
+
+        Args:
+            doc_typename (str): The document type name.
+            code (str): The code of the document.
+
+        Returns:
+            dict | None: Returns the entry or None.
+        '''
+        return self.by_code.get(doc_typename, {}).get(code)
+
+    def is_built(self, doc_typename: str) -> bool:
+        '''
+        Check if the code index was built for the given document type.
+
+        Args:
+            doc_typename (str): The document type name.
+
+        Returns:
+            bool: Returns True, if it was built.
+        '''
+        return doc_typename in self.by_code
+
+    @staticmethod
+    def is_current(entry: dict) -> bool:
+        '''
+        Check if the file of the given entry did not change since
+        the entry was created.
+
+        Args:
+            entry (dict): The entry to check.
+
+        Returns:
+            bool: Returns True, if the file did not change.
+        '''
+        signature = DataIndex.file_signature(entry['abs_filename'])
+        return signature is not None and signature == (entry['mtime'], entry['size'])
+
+    def remove_filename(self, doc_typename: str, abs_filename: str) -> None:
+        '''
+        Remove all entries of the given absolute filename.
+
+        Args:
+            doc_typename (str): The document type name.
+            abs_filename (str): The absolute filename of the document.
+        '''
+        by_code = self.by_code.get(doc_typename, {})
+        for code in [
+            c for c, e in by_code.items() if e['abs_filename'] == abs_filename
+        ]:
+            del by_code[code]
+
+    def rename_filename(
+        self,
+        doc_typename: str,
+        old_abs_filename: str,
+        new_name: str,
+        new_abs_filename: str,
+    ) -> None:
+        '''
+        Change the entries of the old absolute filename to the new
+        name and absolute filename.
+
+        Args:
+            doc_typename (str): The document type name.
+            old_abs_filename (str): The old absolute filename.
+            new_name (str): The new document name.
+            new_abs_filename (str): The new absolute filename.
+        '''
+        by_code = self.by_code.get(doc_typename, {})
+        for code, entry in list(by_code.items()):
+            if entry['abs_filename'] == old_abs_filename:
+                by_code[code] = self._create_entry(new_name, new_abs_filename)
+
+    def set(self, doc_typename: str, code: str, name: str, abs_filename: str) -> None:
+        '''
+        Set the entry for a saved document. Other codes, which point
+        to the same file, will be removed, since its code might have
+        changed. If the code index was not built for the document type
+        yet, nothing happens, since it will be built from the files
+        anyway.
+
+        Args:
+            doc_typename (str): The document type name.
+            code (str): The code of the document.
+            name (str): The document name.
+            abs_filename (str): The absolute filename of the document.
+        '''
+        if not self.is_built(doc_typename):
+            return
+        self.remove_filename(doc_typename, abs_filename)
+        if code:
+            self.by_code[doc_typename][code] = self._create_entry(name, abs_filename)
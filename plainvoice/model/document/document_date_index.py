@@ -0,0 +1,121 @@
+'''
+DocumentDateIndex class
+
+This class holds the documents of a document type sorted by one of
+their dates (e.g. the due date), so that all documents in a date
+range can be found with a binary search instead of checking every
+document. It is built from the index records, thus no document has
+to be loaded for it.
+
+The dates in the index records are stored raw, like in the files.
+Since they can be relative like "+14", the index converts them
+with one given "now", so that all documents are compared against
+the same point of time.
+'''
+
+from plainvoice.model.document.document import date_to_internal
+
+from bisect import bisect_left
+from datetime import datetime
+from typing import Callable
+
+
+class DocumentDateIndex:
+    '''
+    The documents of a document type sorted by one of their dates.
+    '''
+
+    def __init__(self):
+        '''
+        This object is a sorted index of the documents by a date.
+        '''
+        self.abs_filenames: list[str] = []
+        '''
+        The absolute filenames of the documents in the order of
+        their dates.
+        '''
+
+        self.dates: list[datetime] = []
+        '''
+        The sorted dates; same index as in abs_filenames.
+        '''
+
+        self.relative: bool = False
+        '''
+        Tells if there are relative dates like "+14" in the index,
+        which depend on the point of time, the index was built at.
+        '''
+
+        self.undated: list[str] = []
+        '''
+        The absolute filenames of the documents, which have a value
+        for the date, which is not a valid date, though.
+        '''
+
+    def build(
+        self,
+        records: dict[str, dict],
+        key: str,
+        now: datetime | None = None,
+        record_filter: Callable[[dict], bool] | None = None,
+    ) -> None:
+        '''
+        Build the index from the given index records. Documents without
+        a value for the date are left out.
+
+        Args:
+            records (dict): \
+                The index records with the absolute filenames as keys.
+            key (str): \
+                The key of the date in the records, e.g. "date_due".
+            now (datetime): \
+                The point of time for converting relative dates. \
+                (default: `datetime.now()`)
+            record_filter (Callable): \
+                Optionally a callable, which gets the index record \
+                and returns True, if the document should be indexed.
+        '''
+        if now is None:
+            now = datetime.now()
+        entries = []
+        undated = []
+        relative = False
+        for abs_filename, record in records.items():
+            value = record.get(key)
+            if value is None or (record_filter and not record_filter(record)):
+                continue
+            relative = relative or str(value).startswith(('+', '-'))
+            try:
+                date = date_to_internal(str(value), now)
+            except ValueError:
+                date = None
+            if date is None:
+                undated.append(abs_filename)
+            else:
+                entries.append((date, abs_filename))
+        entries.sort()
+        self.dates = [date for date, _ in entries]
+        self.abs_filenames = [abs_filename for _, abs_filename in entries]
+        self.relative = relative
+        self.undated = undated
+
+    def get_range(
+        self, start: datetime | None = None, end: datetime | None = None
+    ) -> list[tuple[datetime, str]]:
+        '''
+        Get the documents with a date in the given range.
+
+        Args:
+            start (datetime): \
+                The first date of the range (including) or None for \
+                no lower limit.
+            end (datetime): \
+                The date, where the range ends (excluding) or None \
+                for no upper limit.
+
+        Returns:
+            list: Returns (date, absolute filename) tuples in date order.
+        '''
+        low = 0 if start is None else bisect_left(self.dates, start)
+        high = len(self.dates) if end is None else bisect_left(self.dates, end)
+        return list(zip(self.dates[low:high], self.abs_filenames[low:high]))
@@ -0,0 +1,98 @@
+'''
+DocumentFolderIndex class
+
+This class maps absolute filenames to the document type, in whose
+folder they are, without opening the file. Links between documents
+are stored as absolute filenames, so resolving a link would otherwise
+mean to read the file for its "doc_typename" first.
+
+Since the folder of a document type can be inside the folder of
+another one, the deepest folder wins. If more document types share
+the same folder, the file cannot be assigned by its path alone; the
+caller has to read the file then.
+'''
+
+import os
+
+
+class DocumentFolderIndex:
+    '''
+    The index, which maps folders to their document type names.
+    '''
+
+    def __init__(self):
+        '''
+        This object is an index for finding the document type of a file
+        by its path.
+        '''
+        self.by_folder: dict[str, list[str]] = {}
+        '''
+        The document type names with their normalized absolute folder
+        as the key. It's a list, since more document types might
+        share the same folder.
+        '''
+
+        self.extension: str = 'yaml'
+        '''
+        The file extension, which documents have.
+        '''
+
+    def build(self, folders: dict[str, str], extension: str = 'yaml') -> None:
+        '''
+        Build the index from the given folders.
+
+        Args:
+            folders (dict): \
+                The absolute folders with the document type names \
+                as the key.
+            extension (str): \
+                The file extension, which documents have. \
+                (default: `'yaml'`)
+        '''
+        by_folder: dict[str, list[str]] = {}
+        for doc_typename, folder in folders.items():
+            if folder:
+                by_folder.setdefault(self._normalize(folder), []).append(doc_typename)
+        self.by_folder = by_folder
+        self.extension = extension
+
+    def get(self, abs_filename: str) -> str:
+        '''
+        Get the document type name for the given absolute filename by
+        walking up its folders until a known one is found. This does
+        not touch the filesystem.
+
+        Args:
+            abs_filename (str): The absolute filename of the document.
+
+        Returns:
+            str: \
+                Returns the document type name or an empty string, if \
+                the file is outside of all known folders or the folder \
+                is shared by more document types.
+        '''
+        if not abs_filename.endswith(f'.{self.extension}'):
+            return ''
+        path = self._normalize(abs_filename)
+        folder = os.path.dirname(path)
+        while True:
+            doc_typenames = self.by_folder.get(folder)
+            if doc_typenames is not None:
+                return doc_typenames[0] if len(doc_typenames) == 1 else ''
+            parent = os.path.dirname(folder)
+            if parent == folder:
+                return ''
+            folder = parent
+
+    @staticmethod
+    def _normalize(path: str) -> str:
+        '''
+        Normalize the given path, so that equal paths are equal strings.
+
+        Args:
+            path (str): The path to normalize.
+
+        Returns:
+            str: Returns the normalized absolute path.
+        '''
+        return os.path.normpath(os.path.abspath(path))
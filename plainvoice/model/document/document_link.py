@@ -3,7 +3,8 @@ DocumentLink class
 
 This class represents a single link between two documents. It can
 generate a unique id for this link based on the filenames of the
-linked documents. Also it can return the name or even the whole
+linked documents, which is a tuple, so that it can be used as a
+cheap dict key. Also it can return the name or even the whole
 Document object of either of the two linked documents. Also it can
 be used to unconnect the documents and thus deleting the link
 completely.
@@ -39,31 +40,28 @@ class DocumentLink:
         '''
 
     def __str__(self):
-        return self.generate_link_id(self.document_a, self.document_b)
+        return '<->'.join(self.generate_link_id(self.document_a, self.document_b))
 
     def __repr__(self):
         return self.__str__()
 
     @staticmethod
-    def generate_link_id(document_a: Document, document_b: Document) -> str:
+    def generate_link_id(document_a: Document, document_b: Document) -> tuple:
         '''
-        Generate a link id string with two given documents. It will use
-        their absolute filenames, sort them and connect them in a specific
-        string. This way for both sites the id would be the same, due to the
-        alphabetical sorting of the filenames.
+        Generate a link id with two given documents. It will use their
+        absolute filenames in alphabetical order as a tuple. This way for
+        both sites the id would be the same.
 
         Args:
             document_a (Document): The one document.
             document_b (Document): The other document.
 
         Returns:
-            str: Returns a string, which shall represent this link.
+            tuple: Returns a tuple, which shall represent this link.
         '''
-        doc_a = document_a.get_filename()
-        doc_b = document_b.get_filename()
-        both_filenames = [doc_a, doc_b]
-        both_filenames.sort()
-        return '<->'.join(both_filenames)
+        doc_a = document_a.abs_filename
+        doc_b = document_b.abs_filename
+        return (doc_a, doc_b) if doc_a <= doc_b else (doc_b, doc_a)
 
     def get_document_a(self) -> Document:
         '''
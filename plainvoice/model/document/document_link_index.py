@@ -0,0 +1,296 @@
+'''
+DocumentLinkIndex class
+
+This class is a persistent index of the links between all documents
+of the data directory. For every document it stores its document type
+and its links, like they are saved in its file; also the links in the
+other direction are kept in memory. That way the question "which
+documents are linked to this one?" can be answered without loading
+any document, and even for documents, which link to this one, while
+it does not link back.
+
+Every entry also stores the signature (mtime and size) of its file
+when it was indexed, so that an entry can be verified by checking
+just this one file. The DocumentRepository keeps the index up to date
+on saving, renaming and removing documents.
+'''
+
+from plainvoice.model.data.data_index import DataIndex
+
+import json
+import os
+
+
+class DocumentLinkIndex:
+    '''
+    Persistent index with the links of every document.
+    '''
+
+    INDEX_VERSION: int = 1
+    '''
+    The version of the index format. If it changes, older
+    index files will be ignored and rebuilt.
+    '''
+
+    def __init__(self, index_file: str = ''):
+        '''
+        The persistent index for the links between documents.
+
+        Args:
+            index_file (str): \
+                The absolute filename of the index file. If left blank, \
+                the index only lives in memory. (default: `''`)
+        '''
+        self.built: bool = False
+        '''
+        Tells if the index holds all documents; either because it was
+        loaded from its file or because it was built from the files.
+        '''
+
+        self.changed: bool = False
+        '''
+        Tells if the index got changed since it was loaded, so
+        that it only has to be written, if needed.
+        '''
+
+        self.entries: dict[str, dict] = {}
+        '''
+        The entries of the index with the absolute filename of the
+        document as the key and a dict with "doc_typename", "links",
+        "mtime" and "size" as the value.
+        '''
+
+        self.index_file: str = index_file
+        '''
+        The absolute filename of the index file.
+        '''
+
+        self.loaded: bool = False
+        '''
+        Tells if the index file was already tried to be loaded.
+        '''
+
+        self.reverse: dict[str, set[str]] = {}
+        '''
+        The other direction of the links: the absolute filename of
+        a document as the key and the set of absolute filenames of
+        the documents, which link to it, as the value.
+        '''
+
+    def _add_reverse(self, abs_filename: str, links: list[str]) -> None:
+        '''
+        Add the given links of the given document to the reverse links.
+
+        Args:
+            abs_filename (str): The absolute filename of the document.
+            links (list): The links of the document.
+        '''
+        for link in links:
+            self.reverse.setdefault(link, set()).add(abs_filename)
+
+    def get_doc_typename(self, abs_filename: str) -> str:
+        '''
+        Get the stored document type name of the given document.
+
+        Args:
+            abs_filename (str): The absolute filename of the document.
+
+        Returns:
+            str: Returns the document type name or an empty string.
+        '''
+        self.load()
+        entry = self.entries.get(abs_filename)
+        return entry['doc_typename'] if entry is not None else ''
+
+    def get_linked(self, abs_filename: str) -> list[str]:
+        '''
+        Get the absolute filenames of the documents, which are linked
+        with the given document in either direction. The own links of
+        the document come first in their order. This won't check the
+        files.
+
+        Args:
+            abs_filename (str): The absolute filename of the document.
+
+        Returns:
+            list: Returns the linked absolute filenames.
+        '''
+        self.load()
+        entry = self.entries.get(abs_filename)
+        output = list(entry['links']) if entry is not None else []
+        output.extend(sorted(self.reverse.get(abs_filename, set()) - set(output)))
+        return output
+
+    def is_built(self) -> bool:
+        '''
+        Check if the index holds all documents.
+
+        Returns:
+            bool: Returns True, if it was loaded or built.
+        '''
+        self.load()
+        return self.built
+
+    def is_current(self, abs_filename: str) -> bool:
+        '''
+        Check if the entry of the given document exists and its
+        file did not change since it was indexed.
+
+        Args:
+            abs_filename (str): The absolute filename of the document.
+
+        Returns:
+            bool: Returns True, if the entry is up to date.
+        '''
+        self.load()
+        entry = self.entries.get(abs_filename)
+        if entry is None:
+            return False
+        signature = DataIndex.file_signature(abs_filename)
+        return signature is not None and signature == (entry['mtime'], entry['size'])
+
+    def load(self) -> bool:
+        '''
+        Load the index from its file; only once per instance.
+        If the file does not exist or has another version, the
+        index simply starts empty and not built.
+
+        Returns:
+            bool: Returns True, if entries were loaded from the file.
+        '''
+        if self.loaded:
+            return False
+        self.loaded = True
+        if not self.index_file or not os.path.exists(self.index_file):
+            return False
+        try:
+            with open(self.index_file, 'r') as index_file:
+                data = json.load(index_file)
+        except Exception:
+            return False
+        if (
+            not isinstance(data, dict)
+            or data.get('version') != self.INDEX_VERSION
+            or not isinstance(data.get('entries'), dict)
+        ):
+            return False
+        self.entries = data['entries']
+        self.reverse = {}
+        for abs_filename, entry in self.entries.items():
+            self._add_reverse(abs_filename, entry['links'])
+        self.built = True
+        return True
+
+    def remove(self, abs_filename: str) -> None:
+        '''
+        Remove the entry of the given document. Other documents may
+        still link to it, until their entries get updated.
+
+        Args:
+            abs_filename (str): The absolute filename of the document.
+        '''
+        self.load()
+        entry = self.entries.pop(abs_filename, None)
+        if entry is None:
+            return
+        for link in entry['links']:
+            sources = self.reverse.get(link)
+            if sources is not None:
+                sources.discard(abs_filename)
+                if not sources:
+                    del self.reverse[link]
+        self.changed = True
+
+    def rename(self, old_abs_filename: str, new_abs_filename: str) -> None:
+        '''
+        Move the entry of the old absolute filename to the new one and
+        replace the old absolute filename in the links of all documents,
+        which link to it.
+
+        Args:
+            old_abs_filename (str): The old absolute filename.
+            new_abs_filename (str): The new absolute filename.
+        '''
+        self.load()
+        for source in list(self.reverse.get(old_abs_filename, set())):
+            entry = self.entries[source]
+            self.set(
+                source,
+                entry['doc_typename'],
+                [
+                    new_abs_filename if link == old_abs_filename else link
+                    for link in entry['links']
+                ],
+                (entry['mtime'], entry['size']),
+            )
+        entry = self.entries.get(old_abs_filename)
+        if entry is not None:
+            self.remove(old_abs_filename)
+            self.set(new_abs_filename, entry['doc_typename'], entry['links'])
+
+    def save(self) -> bool:
+        '''
+        Save the index to its file, if it changed. The file will be
+        written to a temp file first and then replaced so that a
+        concurrently running program never reads a half written index.
+
+        Returns:
+            bool: Returns True on success.
+        '''
+        if not self.changed or not self.index_file:
+            return False
+        try:
+            directory = os.path.dirname(self.index_file)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory)
+            tmp_file = f'{self.index_file}.{os.getpid()}.tmp'
+            with open(tmp_file, 'w') as index_file:
+                json.dump(
+                    {'version': self.INDEX_VERSION, 'entries': self.entries},
+                    index_file,
+                )
+            os.replace(tmp_file, self.index_file)
+            self.changed = False
+            return True
+        except Exception:
+            return False
+
+    def set(
+        self,
+        abs_filename: str,
+        doc_typename: str,
+        links: list[str],
+        signature: tuple | None = None,
+    ) -> None:
+        '''
+        Set the entry for the given document with the given signature
+        of the file or the actual one, if none is given.
+
+        Args:
+            abs_filename (str): The absolute filename of the document.
+            doc_typename (str): The document type name.
+            links (list): The links of the document.
+            signature (tuple): The (mtime, size) tuple of the file.
+        '''
+        self.load()
+        if signature is None:
+            signature = DataIndex.file_signature(abs_filename)
+        self.remove(abs_filename)
+        if signature is None:
+            return
+        links = [link for link in links if link]
+        self.entries[abs_filename] = {
+            'doc_typename': doc_typename,
+            'links': links,
+            'mtime': signature[0],
+            'size': signature[1],
+        }
+        self._add_reverse(abs_filename, links)
+        self.changed = True
+
+    def set_built(self) -> None:
+        '''
+        Mark the index as built; so it holds all documents now.
+        '''
+        self.built = True
+        self.changed = True
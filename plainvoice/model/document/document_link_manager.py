@@ -3,6 +3,10 @@ DocumentLinkManager class
 
 The class, which will manage and control links between documents.
 It can add, remove or rename documents and links between each other.
+
+The linked documents are kept in sets, so that adding or removing a
+link takes the same time, no matter how many links a document has
+already. A Document is hashed by its absolute filename for this.
 '''
 
 from plainvoice.model.document.document import Document
@@ -18,17 +22,17 @@ class DocumentLinkManager:
         '''
         This object controls links between documents.
         '''
-        self.links_by_id: dict[str, DocumentLink] = {}
+        self.links_by_id: dict[tuple, DocumentLink] = {}
         '''
-        The dict, which holds all the links with their link id string
+        The dict, which holds all the links with their link id tuple
         as a key.
         '''
 
-        self.links_of_doc: dict[str, list[Document]] = {}
+        self.links_of_doc: dict[str, set[Document]] = {}
         '''
         The dict, which holds all the links of a specific document. The
         key is the absolute filename of the document and the value is
-        a list of documents, which are linked to the document with this
+        a set of documents, which are linked to the document with this
         absolute filename.
         '''
 
@@ -45,19 +49,13 @@ class DocumentLinkManager:
         if link_id not in self.links_by_id:
             self.links_by_id[link_id] = DocumentLink(document_a, document_b)
 
-        # also link document b to document a in its list
+        # also link document b to document a in its set
         filename_a = document_a.get_filename()
-        if filename_a not in self.links_of_doc:
-            self.links_of_doc[filename_a] = []
-        if document_b not in self.links_of_doc[filename_a]:
-            self.links_of_doc[filename_a].append(document_b)
+        self.links_of_doc.setdefault(filename_a, set()).add(document_b)
 
-        # and also link document a to document b in its list
+        # and also link document a to document b in its set
         filename_b = document_b.get_filename()
-        if filename_b not in self.links_of_doc:
-            self.links_of_doc[filename_b] = []
-        if document_a not in self.links_of_doc[filename_b]:
-            self.links_of_doc[filename_b].append(document_a)
+        self.links_of_doc.setdefault(filename_b, set()).add(document_a)
 
         # now also update the documents internal variables as well
         document_a.add_link(filename_b)
@@ -82,7 +80,8 @@ class DocumentLinkManager:
 
     def get_links_of_document(self, document: Document) -> list[Document]:
         '''
-        Get the list of linked documents for the given document.
+        Get the list of linked documents for the given document,
+        sorted by their absolute filenames.
 
         Args:
             document (Document): The document to get its links from.
@@ -90,11 +89,8 @@ class DocumentLinkManager:
         Returns:
             list: Returns list containing linked documents.
         '''
-        output = []
-        filename = document.get_filename()
-        if filename in self.links_of_doc:
-            output = self.links_of_doc[filename]
-        return output
+        linked = self.links_of_doc.get(document.get_filename(), set())
+        return sorted(linked, key=lambda linked_doc: linked_doc.get_filename())
 
     def remove_link(self, document_a: Document, document_b: Document) -> bool:
         '''
@@ -119,18 +115,49 @@ class DocumentLinkManager:
             # links_of_doc dict!
             return False
 
-        # also unlink document b from document a in its list
+        # also unlink document b from document a in its set
         filename_a = document_a.get_filename()
-        if document_b in self.links_of_doc[filename_a]:
-            self.links_of_doc[filename_a].remove(document_b)
+        self.links_of_doc.get(filename_a, set()).discard(document_b)
 
-        # and also unlink document a from document b in its list
+        # and also unlink document a from document b in its set
         filename_b = document_b.get_filename()
-        if document_a in self.links_of_doc[filename_b]:
-            self.links_of_doc[filename_b].remove(document_a)
+        self.links_of_doc.get(filename_b, set()).discard(document_a)
 
         # now also update the documents internal variables as well
         document_a.remove_link(filename_b)
         document_b.remove_link(filename_a)
 
         return True
+
+    def rename_document(self, document: Document, new_abs_filename: str) -> None:
+        '''
+        Set the new absolute filename on the given document and move
+        its links to it. Since documents are hashed by their absolute
+        filename, the sets and link ids holding the document have to
+        be rebuilt with its new filename. The links of the documents
+        themselves are not changed here.
+
+        Args:
+            document (Document): The document to rename.
+            new_abs_filename (str): The new absolute filename.
+        '''
+        # take the document out of everything, which is keyed by
+        # its old filename, while it still has its old hash
+        old_abs_filename = document.get_filename()
+        linked = self.links_of_doc.pop(old_abs_filename, set())
+        moved_links = []
+        for linked_doc in linked:
+            self.links_of_doc.get(linked_doc.get_filename(), set()).discard(document)
+            link_id = DocumentLink.generate_link_id(document, linked_doc)
+            moved_links.append((linked_doc, self.links_by_id.pop(link_id, None)))
+
+        # now put it back with its new filename
+        document.set_filename(new_abs_filename)
+        if linked:
+            self.links_of_doc[new_abs_filename] = linked
+        for linked_doc, link in moved_links:
+            self.links_of_doc.setdefault(linked_doc.get_filename(), set()).add(document)
+            link_id = DocumentLink.generate_link_id(document, linked_doc)
+            if link is None:
+                link = DocumentLink(document, linked_doc)
+            self.links_by_id[link_id] = link
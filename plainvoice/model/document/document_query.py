@@ -0,0 +1,494 @@
+'''
+DocumentQuery class
+
+This class holds a parsed query for listing documents, like:
+
+    code~"2024-*" and date>=2024-01-01 and total>1000
+
+A query consists of conditions "field operator value", which are
+joined with "and" and "or" ("and" binds stronger). The operators are
+=, !=, >, >=, <, <= and ~ / !~ for matching with wildcards like "*".
+
+The conditions are checked against the index records of the documents
+first. Fields, which are in the index (the dates, code, visibility,
+document type, title and totals), are decided there without loading
+any document. Only if the result still depends on other fields, the
+document has to be loaded and checked again with it. Sorting is done
+by indexed fields only, so that it never needs the documents.
+'''
+
+from plainvoice.model.document.document import date_to_internal
+from plainvoice.model.quantity.price import Price
+from plainvoice.model.quantity.quantity import Quantity
+from plainvoice.utils import data_utils
+
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from fnmatch import fnmatchcase
+from typing import Any
+
+import re
+
+
+class DocumentQuery:
+    '''
+    A parsed query with the conditions, the sorting and the limit
+    for listing documents.
+    '''
+
+    CONDITION_PATTERN: re.Pattern = re.compile(
+        r'\s*(?P<fieldname>[A-Za-z_][\w.]*)\s*'
+        r'(?P<operator>>=|<=|!=|!~|==|=|>|<|~)\s*'
+        r'(?P<value>"(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\'|[^\s"\']+)\s*'
+    )
+    '''
+    The pattern for one condition of a query.
+    '''
+
+    DATE_KEYS: tuple = ('date_issued', 'date_due', 'date_done')
+    '''
+    The keys of the index records, which hold dates.
+    '''
+
+    INDEX_FIELDS: dict[str, str] = {
+        'visible': 'visible',
+        'doc_typename': 'doc_typename',
+        'type': 'doc_typename',
+        'name': 'name',
+        'date_issued': 'date_issued',
+        'issued': 'date_issued',
+        'date_due': 'date_due',
+        'due': 'date_due',
+        'date_done': 'date_done',
+        'done': 'date_done',
+        'code': 'code',
+        'title': 'title',
+        'total': 'total',
+        'vat': 'vat',
+        'total_with_vat': 'total_with_vat',
+    }
+    '''
+    The fieldnames, which can be used in a query for the keys of the
+    index records, with the fieldname as the key and the key of the
+    index record as the value. The DocumentRepository adds the
+    fieldnames of the document type, like its date fields.
+    '''
+
+    JOINER_PATTERN: re.Pattern = re.compile(r'(and|or)\s+', re.IGNORECASE)
+    '''
+    The pattern for joining two conditions.
+    '''
+
+    PRICE_KEYS: tuple = ('total', 'vat', 'total_with_vat')
+    '''
+    The keys of the index records, which hold readable prices.
+    '''
+
+    def __init__(self, where: str = '', sort: str = '', limit: int = 0):
+        '''
+        The query for listing documents.
+
+        Args:
+            where (str): \
+                The conditions like 'code~"2024-*" and total>1000'. \
+                If left blank, all documents match. (default: `''`)
+            sort (str): \
+                The comma separated fieldnames to sort by; with a \
+                leading "-" for descending, like "-date,code". If left \
+                blank, the default order is used. (default: `''`)
+            limit (int): \
+                The maximum number of documents or 0 for all of them. \
+                (default: `0`)
+        '''
+        self.conditions: list[list[tuple[str, str, str]]] = self.parse_where(where)
+        '''
+        The conditions as (fieldname, operator, value) tuples. The
+        inner lists are joined with "and", the outer list with "or".
+        '''
+
+        self.converted: dict[tuple[str, str], Any] = {}
+        '''
+        The values of the conditions, which got converted for comparing
+        already, with the value and the kind of conversion as the key.
+        '''
+
+        self.limit: int = max(0, limit)
+        '''
+        The maximum number of documents or 0 for all of them.
+        '''
+
+        self.sort: list[tuple[str, bool]] = self.parse_sort(sort)
+        '''
+        The fieldnames to sort by as (fieldname, descending) tuples.
+        '''
+
+    def add_condition(self, fieldname: str, operator: str, value: str) -> None:
+        '''
+        Add a condition, which has to be met in any case; so it gets
+        added to every group of conditions, which are joined with "and".
+
+        Args:
+            fieldname (str): The fieldname of the condition.
+            operator (str): The operator like ">=".
+            value (str): The value to compare with.
+        '''
+        if not self.conditions:
+            self.conditions = [[]]
+        for conjunction in self.conditions:
+            conjunction.append((fieldname, operator, value))
+
+    def _check(
+        self,
+        condition: tuple[str, str, str],
+        record: dict,
+        fieldnames: dict[str, str],
+        document: Any = None,
+        now: datetime | None = None,
+    ) -> bool | None:
+        '''
+        Check the given condition against the index record or, if the
+        field is not in the index, against the document.
+
+        Args:
+            condition (tuple): The (fieldname, operator, value) tuple.
+            record (dict): The index record of the document.
+            fieldnames (dict): \
+                The fieldnames, which are in the index, with the key \
+                of the index record as the value.
+            document (Document): \
+                The loaded document or None, if it is not loaded.
+            now (datetime): \
+                The point of time for relative dates.
+
+        Returns:
+            bool | None: \
+                Returns the result or None, if it cannot be decided \
+                without the document.
+        '''
+        fieldname, operator, value = condition
+        key = fieldnames.get(fieldname)
+        if key is not None:
+            if key not in record:
+                return None
+            field_value = self.get_record_value(key, record, now)
+        elif document is None:
+            return None
+        else:
+            field_value = document.get(fieldname)
+        return self._compare(field_value, operator, value, now)
+
+    def _compare(
+        self, field_value: Any, operator: str, value: str, now: datetime | None
+    ) -> bool:
+        '''
+        Compare the value of a field with the value of a condition. The
+        value of the condition gets converted to the type of the field.
+
+        Args:
+            field_value (Any): The value of the field.
+            operator (str): The operator like ">=".
+            value (str): The value of the condition.
+            now (datetime): The point of time for relative dates.
+
+        Returns:
+            bool: Returns True, if the condition is met.
+        '''
+        if isinstance(field_value, Quantity):
+            field_value = field_value.value
+        if field_value is None or field_value == '':
+            # a missing value only equals an empty value
+            if operator in ('~', '!~'):
+                return fnmatchcase('', value) == (operator == '~')
+            elif operator in ('=', '=='):
+                return value == ''
+            elif operator == '!=':
+                return value != ''
+            return False
+
+        if operator in ('~', '!~'):
+            if isinstance(field_value, datetime):
+                field_value = field_value.strftime('%Y-%m-%d')
+            return fnmatchcase(str(field_value), value) == (operator == '~')
+
+        if isinstance(field_value, datetime):
+            field_value = field_value.date()
+            value = self._convert(value, 'date', now)
+        elif isinstance(field_value, bool):
+            value = self._convert(value, 'bool', now)
+        elif isinstance(field_value, (int, float, Decimal)):
+            field_value = Decimal(str(field_value))
+            value = self._convert(value, 'number', now)
+        else:
+            field_value = str(field_value)
+
+        if operator in ('=', '=='):
+            return field_value == value
+        elif operator == '!=':
+            return field_value != value
+        elif isinstance(field_value, bool):
+            raise ValueError(f'Operator not possible for yes/no values: {operator}')
+        elif operator == '>':
+            return field_value > value
+        elif operator == '>=':
+            return field_value >= value
+        elif operator == '<':
+            return field_value < value
+        else:
+            return field_value <= value
+
+    def _convert(self, value: str, kind: str, now: datetime | None) -> Any:
+        '''
+        Convert the value of a condition to a date, yes/no value or
+        a number. The result is kept, since the same value gets
+        compared with many documents.
+
+        Args:
+            value (str): The value of the condition.
+            kind (str): "date", "bool" or "number"
+            now (datetime): The point of time for relative dates.
+
+        Returns:
+            Any: Returns the converted value.
+        '''
+        if (value, kind) in self.converted:
+            return self.converted[(value, kind)]
+        output: Any = None
+        if kind == 'date':
+            if value.startswith(('+', '-')):
+                output = date_to_internal(value, now)
+            elif data_utils.is_valid_date(value):
+                output = date_to_internal(data_utils.is_valid_date(value))
+            if output is None:
+                raise ValueError(f'Not a valid date: {value}')
+            output = output.date()
+        elif kind == 'bool':
+            output = value.lower() in ('true', 'yes', 'y', '1')
+        else:
+            try:
+                output = Decimal(value)
+            except InvalidOperation:
+                try:
+                    output = Quantity(value).value
+                except Exception:
+                    raise ValueError(f'Not a valid number: {value}')
+        self.converted[(value, kind)] = output
+        return output
+
+    def _get_sort_value(
+        self,
+        fieldname: str,
+        item: tuple[str, str, dict],
+        fieldnames_of_types: dict[str, dict[str, str]],
+        now: datetime | None,
+    ) -> Any:
+        '''
+        Get the value of the given field for sorting the given index
+        record. Only fields, which are in the index, are possible.
+
+        Args:
+            fieldname (str): The fieldname to sort by.
+            item (tuple): The (doc_typename, abs_filename, record) tuple.
+            fieldnames_of_types (dict): \
+                The fieldnames, which are in the index, per document \
+                type name.
+            now (datetime): The point of time for relative dates.
+
+        Returns:
+            Any: Returns the value or None.
+        '''
+        key = fieldnames_of_types.get(item[0], {}).get(fieldname)
+        if key is None:
+            raise ValueError(f'Sorting not possible by: {fieldname}')
+        value = self.get_record_value(key, item[2], now)
+        if isinstance(value, datetime):
+            return value.date()
+        elif value is None or isinstance(value, (bool, Decimal)):
+            return value
+        return str(value)
+
+    def get_record_value(
+        self, key: str, record: dict, now: datetime | None = None
+    ) -> Any:
+        '''
+        Get the value of the given key of the index record in the type,
+        which can be compared. The dates are stored raw in the index
+        and the totals readable, so they get converted.
+
+        Args:
+            key (str): The key of the index record.
+            record (dict): The index record of the document.
+            now (datetime): The point of time for relative dates.
+
+        Returns:
+            Any: Returns the value or None.
+        '''
+        value = record.get(key)
+        if value is None:
+            return None
+        try:
+            if key in self.DATE_KEYS:
+                return date_to_internal(str(value), now)
+            elif key in self.PRICE_KEYS:
+                return Price(str(value)).value
+        except ValueError:
+            return None
+        return value
+
+    def is_empty(self) -> bool:
+        '''
+        Check if the query neither has conditions, a sorting nor a limit.
+
+        Returns:
+            bool: Returns True, if the query is empty.
+        '''
+        return not self.conditions and not self.sort and not self.limit
+
+    def matches(
+        self,
+        record: dict,
+        fieldnames: dict[str, str],
+        document: Any = None,
+        now: datetime | None = None,
+    ) -> bool | None:
+        '''
+        Check if the document of the given index record matches the
+        conditions. Without the document only the fields of the index
+        can be checked; if the result depends on other fields, None
+        is returned and the check has to be done again with the
+        loaded document.
+
+        Args:
+            record (dict): \
+                The index record of the document. It can also be just \
+                a part of it, e.g. only the "doc_typename".
+            fieldnames (dict): \
+                The fieldnames, which are in the index, with the key \
+                of the index record as the value.
+            document (Document): \
+                The loaded document or None, if it is not loaded.
+            now (datetime): \
+                The point of time for relative dates. \
+                (default: `datetime.now()`)
+
+        Returns:
+            bool | None: \
+                Returns True or False or None, if it cannot be decided \
+                without the document.
+        '''
+        if not self.conditions:
+            return True
+        undecided = False
+        for conjunction in self.conditions:
+            result: bool | None = True
+            for condition in conjunction:
+                checked = self._check(condition, record, fieldnames, document, now)
+                if checked is False:
+                    result = False
+                    break
+                elif checked is None:
+                    result = None
+            if result is True:
+                return True
+            elif result is None:
+                undecided = True
+        return None if undecided else False
+
+    @classmethod
+    def parse_sort(cls, sort: str) -> list[tuple[str, bool]]:
+        '''
+        Parse the comma separated fieldnames to sort by.
+
+        Args:
+            sort (str): The fieldnames like "-date,code".
+
+        Returns:
+            list: Returns (fieldname, descending) tuples.
+        '''
+        output = []
+        for fieldname in sort.split(','):
+            fieldname = fieldname.strip()
+            if not fieldname:
+                continue
+            descending = fieldname.startswith('-')
+            fieldname = fieldname.lstrip('+-').strip()
+            if not fieldname:
+                raise ValueError(f'Sorting not possible by: {sort}')
+            output.append((fieldname, descending))
+        return output
+
+    @classmethod
+    def parse_where(cls, where: str) -> list[list[tuple[str, str, str]]]:
+        '''
+        Parse the conditions of a query.
+
+        Args:
+            where (str): The conditions like 'code~"2024-*" and total>1000'.
+
+        Returns:
+            list: \
+                Returns the lists of (fieldname, operator, value) tuples, \
+                which are joined with "and", in a list, which is joined \
+                with "or".
+        '''
+        output: list[list[tuple[str, str, str]]] = []
+        if not where.strip():
+            return output
+        conjunction: list[tuple[str, str, str]] = []
+        position = 0
+        while True:
+            match = cls.CONDITION_PATTERN.match(where, position)
+            if match is None:
+                raise ValueError(f'Query not possible at: {where[position:].strip()}')
+            value = match.group('value')
+            if value[0] in '"\'':
+                value = re.sub(r'\\(.)', r'\1', value[1:-1])
+            conjunction.append(
+                (match.group('fieldname'), match.group('operator'), value)
+            )
+            position = match.end()
+            if position >= len(where):
+                break
+            joiner = cls.JOINER_PATTERN.match(where, position)
+            if joiner is None:
+                raise ValueError(f'Query not possible at: {where[position:].strip()}')
+            if joiner.group(1).lower() == 'or':
+                output.append(conjunction)
+                conjunction = []
+            position = joiner.end()
+        output.append(conjunction)
+        return output
+
+    def sort_records(
+        self,
+        records: list[tuple[str, str, dict]],
+        fieldnames_of_types: dict[str, dict[str, str]],
+        now: datetime | None = None,
+    ) -> list[tuple[str, str, dict]]:
+        '''
+        Sort the given index records by the fields of the query.
+        Documents without a value come last.
+
+        Args:
+            records (list): \
+                The (doc_typename, abs_filename, record) tuples.
+            fieldnames_of_types (dict): \
+                The fieldnames, which are in the index, per document \
+                type name.
+            now (datetime): The point of time for relative dates.
+
+        Returns:
+            list: Returns the sorted (doc_typename, abs_filename, record) tuples.
+        '''
+        output = list(records)
+        # a stable sort per field, starting with the least important
+        for fieldname, descending in reversed(self.sort):
+            keyed = [
+                (self._get_sort_value(fieldname, item, fieldnames_of_types, now), item)
+                for item in output
+            ]
+            present = [entry for entry in keyed if entry[0] is not None]
+            present.sort(key=lambda entry: entry[0], reverse=descending)
+            output = [item for _, item in present] + [
+                item for value, item in keyed if value is None
+            ]
+        return output
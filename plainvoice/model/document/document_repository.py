@@ -8,12 +8,29 @@ then.
 '''
 
 from plainvoice.model.config import Config
+from plainvoice.model.data.code_allocator import CodeAllocator
+from plainvoice.model.data.data_index import DataIndex
 from plainvoice.model.data.data_repository import DataRepository
-from plainvoice.model.document.document import Document
+from plainvoice.model.document.document import Document, date_to_internal
 from plainvoice.model.document.document_cache import DocumentCache
+from plainvoice.model.document.document_code_index import DocumentCodeIndex
+from plainvoice.model.document.document_date_index import DocumentDateIndex
+from plainvoice.model.document.document_folder_index import DocumentFolderIndex
+from plainvoice.model.document.document_link_index import DocumentLinkIndex
+from plainvoice.model.document.document_query import DocumentQuery
+from plainvoice.model.document.document_summary import DocumentSummary
 from plainvoice.model.document.document_type import DocumentType
 from plainvoice.model.document.document_type_repository import DocumentTypeRepository
 from plainvoice.model.document.document_link_manager import DocumentLinkManager
+from plainvoice.model.file.file import File
+
+from datetime import date, datetime, timedelta
+from itertools import groupby
+from typing import Any, Callable, Iterator
+
+import hashlib
+import json
+import os
 
 
 class DocumentRepository:
@@ -21,12 +38,29 @@ class DocumentRepository:
     The DocumentRepository, which can save and load Documents.
     '''
 
+    DATE_KEYS: dict[str, str] = {
+        'issued': 'date_issued',
+        'due': 'date_due',
+        'done': 'date_done',
+    }
+    '''
+    The keys of the dates in the index records with the names of
+    the dates as the key, as they can be used for date queries.
+    '''
+
     DEFAULT_DOC_TYPES_FOLDER: str = '{app_dir}/types'
     '''
     The folder, in which the document types are stored
     by default.
     '''
 
+    INDEX_RECORD_VERSION: int = 2
+    '''
+    The version of the index records, generated by
+    _project_index_record(). If it changes, the indexes
+    of all document types will be rebuilt.
+    '''
+
     def __init__(self, doc_types_folder: str = DEFAULT_DOC_TYPES_FOLDER):
         '''
         The DocumentRepository is for loading and saving Document objects.
@@ -38,6 +72,19 @@ class DocumentRepository:
         its document type + name combination.
         '''
 
+        self.code_index: DocumentCodeIndex = DocumentCodeIndex()
+        '''
+        The index for finding documents by their code without
+        loading all documents of their document type.
+        '''
+
+        self.date_indexes: dict[tuple[str, str], tuple[int, DocumentDateIndex]] = {}
+        '''
+        The built DocumentDateIndex objects with the document type name
+        and the date key of the records as the key. They are stored with
+        the revision of the DataIndex, they were built from.
+        '''
+
         self.doc_types: dict[str, DocumentType] = {}
         '''
         The document type objects instantiated as a value on the
@@ -49,6 +96,12 @@ class DocumentRepository:
         The repository for loading document type objects.
         '''
 
+        self.folder_index: DocumentFolderIndex = DocumentFolderIndex()
+        '''
+        The index for getting the document type of an absolute
+        filename by its folder, without opening the file.
+        '''
+
         self.repositories: dict[str, DataRepository] = {}
         '''
         All available data repositories with the document type name
@@ -60,6 +113,12 @@ class DocumentRepository:
         The manager for handling document links.
         '''
 
+        self.link_index: DocumentLinkIndex = DocumentLinkIndex()
+        '''
+        The persistent index of the saved links between all documents,
+        for finding linked documents without loading them.
+        '''
+
         self._init_repositories_and_doc_types()
 
     def _init_repositories_and_doc_types(self) -> None:
@@ -70,6 +129,10 @@ class DocumentRepository:
         the key and the DataRepository as the value.
         '''
         doc_type_dicts = self.doc_type_repo.get_list(False)
+        try:
+            workers = int(str(Config.get_instance().get('load_workers')))
+        except ValueError:
+            workers = 1
         self.doc_types = {}
         self.repositories = {}
         for doc_typename in doc_type_dicts:
@@ -87,11 +150,182 @@ class DocumentRepository:
                 ),
             )
             self.doc_types[doc_typename] = self.doc_type_repo.load_by_name(doc_typename)
+            self.repositories[doc_typename].set_workers(workers)
+            self.repositories[doc_typename].set_code_allocator(
+                self._create_code_allocator(doc_typename)
+            )
+            self.repositories[doc_typename].set_index(
+                self._create_index(doc_typename),
+                lambda abs_filename, data, doc_typename=doc_typename: (
+                    self._project_index_record(doc_typename, abs_filename, data)
+                ),
+            )
+        self.folder_index.build(
+            {
+                doc_typename: data_repo.get_folder()
+                for doc_typename, data_repo in self.repositories.items()
+            }
+        )
+        self.link_index = self._create_link_index()
 
     @property
     def add_link(self):
         return self.links.add_link
 
+    def _build_document(
+        self, doc_typename: str, name: str, data: dict, abs_filename: str = ''
+    ) -> Document:
+        '''
+        Build a document of the given document type from the given
+        loaded dict. It won't be added to the cache; use
+        _build_and_cache_document() for this.
+
+        Args:
+            doc_typename (str): The document type name.
+            name (str): The name of the document.
+            data (dict): The loaded dict of the document.
+            abs_filename (str): The absolute filename of the document.
+
+        Returns:
+            Document: Returns the new Document instance.
+        '''
+        document = Document(doc_typename, name)
+        document.init_internals_with_doctype(self.doc_types[doc_typename], False)
+        document.set_lazy_fixed()
+        document.from_dict(data)
+        document.set_filename(abs_filename)
+        return document
+
+    def _build_and_cache_document(
+        self,
+        doc_typename: str,
+        name: str,
+        abs_filename: str,
+        data: dict | None = None,
+    ) -> Document:
+        '''
+        Build a document of the given document type from the given
+        loaded dict or its file and add it to the cache.
+
+        Args:
+            doc_typename (str): The document type name.
+            name (str): The name of the document.
+            abs_filename (str): The absolute filename of the document.
+            data (dict): \
+                The loaded dict of the document, if it is loaded already. \
+                Otherwise the file gets loaded.
+
+        Returns:
+            Document: Returns the new Document instance.
+        '''
+        if data is None:
+            data = self.repositories[doc_typename].file.load_from_yaml_file(
+                abs_filename
+            )
+        document = self._build_document(doc_typename, name, data, abs_filename)
+        self.cache.add_document(document, doc_typename, name, abs_filename)
+        return document
+
+    def _create_code_allocator(self, doc_typename: str) -> CodeAllocator:
+        '''
+        Create the persistent code allocator for the given document
+        type. Its state file is stored in the cache folder, set in the
+        config, next to the index of the document type. Its fingerprint
+        is the folder and the filename pattern, since the codes depend
+        on them.
+
+        Args:
+            doc_typename (str): The document type name.
+
+        Returns:
+            CodeAllocator: Returns the CodeAllocator instance.
+        '''
+        data_repo = self.repositories[doc_typename]
+        fingerprint = json.dumps(
+            [
+                data_repo.get_folder(),
+                data_repo.file.file_path_generator.filename_pattern,
+            ]
+        )
+        return CodeAllocator(
+            self._get_cache_filename('codes', doc_typename), fingerprint
+        )
+
+    def _create_index(self, doc_typename: str) -> DataIndex:
+        '''
+        Create the persistent index for the given document type. Its
+        file is stored in the cache folder, set in the config. Also
+        the index gets a fingerprint of the document type, so that
+        it will be rebuilt, if the document type changes.
+
+        Args:
+            doc_typename (str): The document type name.
+
+        Returns:
+            DataIndex: Returns the DataIndex instance.
+        '''
+        folder = self.repositories[doc_typename].get_folder()
+        index_file = self._get_cache_filename('index', doc_typename)
+        fingerprint = hashlib.sha1(
+            json.dumps(
+                [
+                    self.INDEX_RECORD_VERSION,
+                    folder,
+                    self.doc_types[doc_typename].to_dict(True),
+                ],
+                sort_keys=True,
+                default=str,
+            ).encode()
+        ).hexdigest()
+        return DataIndex(index_file, fingerprint)
+
+    def _create_link_index(self) -> DocumentLinkIndex:
+        '''
+        Create the persistent link index for all document types. Its
+        file is stored in the cache folder, set in the config. The name
+        of the file contains a hash of the folders of all document
+        types, since the index holds the documents of all of them.
+
+        Returns:
+            DocumentLinkIndex: Returns the DocumentLinkIndex instance.
+        '''
+        cache_folder = File(str(Config.get_instance().get('cache_folder'))).get_folder()
+        folders_hash = hashlib.sha1(
+            json.dumps(
+                {
+                    doc_typename: data_repo.get_folder()
+                    for doc_typename, data_repo in self.repositories.items()
+                },
+                sort_keys=True,
+            ).encode()
+        ).hexdigest()[:12]
+        return DocumentLinkIndex(
+            os.path.join(cache_folder, f'links_{folders_hash}.json')
+        )
+
+    def _get_cache_filename(self, prefix: str, doc_typename: str) -> str:
+        '''
+        Get the absolute filename of a cache file for the given
+        document type in the cache folder, set in the config. The
+        name of the file contains a hash of the documents folder so
+        that document types with the same name, yet from different
+        document types folders, do not share the same cache file.
+
+        Args:
+            prefix (str): The prefix of the filename; e.g. "index".
+            doc_typename (str): The document type name.
+
+        Returns:
+            str: Returns the absolute filename.
+        '''
+        cache_folder = File(str(Config.get_instance().get('cache_folder'))).get_folder()
+        folder = self.repositories[doc_typename].get_folder()
+        folder_hash = hashlib.sha1(folder.encode()).hexdigest()[:12]
+        safe_typename = doc_typename.replace(os.sep, '_')
+        return os.path.join(
+            cache_folder, f'{prefix}_{safe_typename}_{folder_hash}.json'
+        )
+
     def create_document(self, doc_typename: str, name: str = '') -> Document:
         '''
         Create a new document for the given document type, save it and
@@ -170,8 +404,11 @@ class DocumentRepository:
         doc_typename = doc.get_document_typename()
 
         if name == '':
-            name = self.generate_next_name(doc_typename)
-            next_code = self.get_next_code(doc_typename)
+            # allocate the code, so that a concurrently created
+            # document will not get the same one
+            data_repo = self.repositories[doc_typename]
+            next_code = data_repo.allocate_next_code()
+            name = data_repo.file.generate_name({'code': next_code})
         else:
             next_code = None
 
@@ -215,12 +452,116 @@ class DocumentRepository:
             Document: \
                 Returns a client as a document or a blank one as a fallback.
         '''
-        client_type = Config().get('client_type')
-        links_of_doc = self.get_links_of_document(document)
-        for link in links_of_doc:
-            if link.get_document_typename() == client_type:
-                return link
-        return Document()
+        client_type = str(Config.get_instance().get('client_type'))
+        # the own links of the document come first, since they might
+        # not be saved yet and do not need the link index, which has to
+        # read all the documents, if it was not built yet
+        client = self._get_first_document_of_type(
+            [link for link in document.get_links() if link], client_type
+        )
+        if client is None and document.get_filename():
+            client = self._get_first_document_of_type(
+                self.get_linked_filenames(document.get_filename(), client_type),
+                client_type,
+            )
+        return client if client is not None else Document()
+
+    def _get_date_index(
+        self,
+        doc_typename: str,
+        date_key: str,
+        now: datetime | None = None,
+        loaded: dict | None = None,
+    ) -> tuple[DocumentDateIndex, dict[str, dict]]:
+        '''
+        Get the DocumentDateIndex of the given document type for the
+        given date key of the index records together with all the
+        records of the document type. The date index is built only
+        again, if the records changed meanwhile or if it contains
+        relative dates, which depend on the given point of time.
+
+        Args:
+            doc_typename (str): \
+                The document type name.
+            date_key (str): \
+                The key of the date in the records, e.g. "date_due".
+            now (datetime): \
+                The point of time for relative dates. \
+                (default: `datetime.now()`)
+            loaded (dict): \
+                Optionally a dict, which will be filled with the dicts \
+                of the files, which had to be parsed for the index.
+
+        Returns:
+            tuple: \
+                Returns the DocumentDateIndex and the records with the \
+                absolute filenames as the key.
+        '''
+        data_repo = self.repositories[doc_typename]
+        records = data_repo.get_index_records(False, loaded)
+        revision = data_repo.get_index_revision()
+        built = self.date_indexes.get((doc_typename, date_key))
+        if built is not None and built[0] == revision and not built[1].relative:
+            return built[1], records
+        date_index = DocumentDateIndex()
+        date_index.build(records, date_key, now)
+        if revision is not None:
+            self.date_indexes[(doc_typename, date_key)] = (revision, date_index)
+        return date_index, records
+
+    def _get_records_by_date(
+        self,
+        doc_typename: str,
+        date_name: str = 'issued',
+        start: datetime | None = None,
+        end: datetime | None = None,
+        show_only_visible: bool = True,
+        loaded: dict | None = None,
+    ) -> list[tuple[str, str, dict]]:
+        '''
+        Get the index records of the documents of the given type (or
+        all types, if not specified), which have the given date in the
+        given range. The range is searched in the DocumentDateIndex,
+        so only the matching records are touched.
+
+        Args:
+            doc_typename (str): \
+                The document type name or '' for all types.
+            date_name (str): \
+                "issued", "due" or "done". (default: `'issued'`)
+            start (datetime): \
+                The first date of the range (including) or None.
+            end (datetime): \
+                The date, where the range ends (excluding) or None.
+            show_only_visible (bool): \
+                Only get the visible documents.
+            loaded (dict): \
+                Optionally a dict, which will be filled with the dicts \
+                of the files, which had to be parsed for the index.
+
+        Returns:
+            list: \
+                Returns (doc_typename, abs_filename, record) tuples, \
+                sorted like get_list_of_docs() per type.
+        '''
+        if date_name not in self.DATE_KEYS:
+            raise ValueError(f'Date not possible: {date_name}')
+        now = datetime.now()
+        output = []
+        for doc_type in self._get_doc_typenames(doc_typename):
+            if doc_type not in self.repositories:
+                continue
+            date_index, records = self._get_date_index(
+                doc_type, self.DATE_KEYS[date_name], now, loaded
+            )
+            entries = [
+                (doc_type, abs_filename, records[abs_filename])
+                for _, abs_filename in date_index.get_range(start, end)
+                if not show_only_visible or records[abs_filename].get('visible')
+            ]
+            entries.sort(key=lambda entry: self._sort_key_of_record(entry[2], now))
+            output.extend(entries)
+        return output
 
     def get_descriptor(self, doc_typename: str) -> dict:
         '''
@@ -238,9 +579,109 @@ class DocumentRepository:
         else:
             return {}
 
+    def _get_code_index_entry(self, doc_typename: str, code: str) -> dict | None:
+        '''
+        Get the entry of the code index for the given code. The code
+        index will be built from the stored DataIndex first, which does
+        not need to check any file. A found entry gets verified by its
+        file. If it changed or if the code cannot be found, the code
+        index will be refreshed from the files; yet for not found codes
+        only once per run, since the DocumentRepository keeps the code
+        index up to date itself afterwards.
+
+        Args:
+            doc_typename (str): Document type name.
+            code (str): The code to search for.
+
+        Returns:
+            dict | None: Returns the entry or None.
+        '''
+        if not self.code_index.is_built(doc_typename):
+            self._refresh_code_index(doc_typename, False)
+        entry = self.code_index.get(doc_typename, code)
+        if entry is not None and self.code_index.is_current(entry):
+            return entry
+        if entry is None and doc_typename in self.code_index.refreshed:
+            return None
+        self._refresh_code_index(doc_typename)
+        entry = self.code_index.get(doc_typename, code)
+        if entry is not None and self.code_index.is_current(entry):
+            return entry
+        return None
+
+    def get_docs_by_date(
+        self,
+        doc_typename: str,
+        date_name: str = 'issued',
+        start: datetime | None = None,
+        end: datetime | None = None,
+        show_only_visible: bool = True,
+    ) -> list[Document]:
+        '''
+        Get the documents of the given type (or all types, if not
+        specified), which have the given date in the given range;
+        e.g. all invoices issued in a quarter. Only the files of the
+        matching documents are opened, if they are not cached.
+
+        Args:
+            doc_typename (str): \
+                The document type name or '' for all types.
+            date_name (str): \
+                "issued", "due" or "done". (default: `'issued'`)
+            start (datetime): \
+                The first date of the range (including) or None.
+            end (datetime): \
+                The date, where the range ends (excluding) or None.
+            show_only_visible (bool): \
+                Only get the visible documents.
+
+        Returns:
+            list: Returns a sorted list with Document objects.
+        '''
+        loaded: dict = {}
+        return self._get_documents_of_records(
+            self._get_records_by_date(
+                doc_typename, date_name, start, end, show_only_visible, loaded
+            ),
+            loaded,
+        )
+
+    def get_docs_by_query(
+        self, doc_typename: str, query: DocumentQuery, show_only_visible: bool = True
+    ) -> list[Document]:
+        '''
+        Get the documents of the given type (or all types, if not
+        specified), which match the given query; sorted and limited
+        like the query says. The conditions on indexed fields are
+        checked with the index records, so only the documents, which
+        might match, get loaded.
+
+        Args:
+            doc_typename (str): \
+                The document type name or '' for all types.
+            query (DocumentQuery): \
+                The query with the conditions, sorting and limit.
+            show_only_visible (bool): \
+                Only get the visible documents.
+
+        Returns:
+            list: Returns a sorted list with Document objects.
+        '''
+        loaded: dict = {}
+        matches = self._query_records(doc_typename, query, show_only_visible, loaded)
+        # the documents, which had to be loaded for the query, are known already
+        missing = iter(
+            self._get_documents_of_records(
+                [entry[:3] for entry in matches if entry[3] is None], loaded
+            )
+        )
+        return [
+            entry[3] if entry[3] is not None else next(missing) for entry in matches
+        ]
+
     def get_document_by_code(self, doc_typename: str, code: str) -> Document | None:
         '''
-        Get a document by its code.
+        Get a document by its code; also hidden ones.
 
         Args:
             doc_typename (str): Document type name.
@@ -252,17 +693,15 @@ class DocumentRepository:
         if not (doc_typename in self.repositories and doc_typename in self.doc_types):
             return None
 
-        doc_type = self.doc_types[doc_typename]
-        code_fieldname = doc_type.get_fixed('code_fieldname')
-
-        # iter through all documents of the type; also the
-        # hidden ones
-        for doc in self.get_list_of_docs(doc_typename, False):
-            if code == doc.get_fixed(code_fieldname):
-                return doc
-
-        # return None if nothing found
-        return None
+        # find the document in the code index, which only
+        # has to check the one found file
+        entry = self._get_code_index_entry(doc_typename, code)
+        if entry is None:
+            return None
+        cache_loading = self.cache.get_by_filename(entry['abs_filename'])
+        if cache_loading is not None:
+            return cache_loading
+        return self._load_by_doc_typename_name_combi(entry['name'], doc_typename)
 
     def get_document_by_name_type_combi(
         self, name: str, doc_typename: str | None
@@ -304,10 +743,16 @@ class DocumentRepository:
         Returns:
             str: Returns the document type as a string.
         '''
+        # a file inside the folder of a document type is of this
+        # type; this needs no file access at all
+        doc_typename = self.folder_index.get(abs_filename)
+        if doc_typename:
+            return doc_typename
         # generate a temp DataRepository
         tmp_data_repo = DataRepository()
-        # with it load basically the plain dict first
-        loaded_dict = tmp_data_repo.load_dict_from_name(abs_filename)
+        # with it load only the base variables of the file, which
+        # hold the doc_typename; so the fields are not parsed
+        loaded_dict = tmp_data_repo.load_base_dict_from_name(abs_filename)
         # and get the doc_typename
         doc_typename = loaded_dict.get('doc_typename')
         return doc_typename if doc_typename else ''
@@ -343,7 +788,9 @@ class DocumentRepository:
         self, doc_typename: str, code: str
     ) -> tuple:
         '''
-        Make something.
+        Get the document type name and the document name of the
+        document with the given code. It only uses the code index,
+        so no document has to be loaded for this.
 
         Args:
             doc_typename (str): The document type name.
@@ -352,14 +799,139 @@ class DocumentRepository:
         Returns:
             tuple: Returns final document type as string, final document name.
         '''
-        doc = self.get_document_by_code(doc_typename, code)
-        if doc:
-            return doc.get_document_typename(), doc.get_name()
+        entry = None
+        if doc_typename in self.repositories and doc_typename in self.doc_types:
+            entry = self._get_code_index_entry(doc_typename, code)
+        if entry is not None:
+            return doc_typename, entry['name']
         else:
             # otherwise it might be no code, but its name;
             # return it as this then
             return doc_typename, code
 
+    def _get_doc_typenames(self, doc_typename: str) -> list[str]:
+        '''
+        Get the document type names to list: the given one, if it
+        exists, or all document type names, if none is given.
+
+        Args:
+            doc_typename (str): The document type name or ''.
+
+        Returns:
+            list: Returns the list with the document type names.
+        '''
+        if doc_typename == '':
+            return list(self.doc_types.keys())
+        elif doc_typename in self.repositories:
+            return [doc_typename]
+        else:
+            return []
+
+    def _classify_due(
+        self,
+        doc_typename: str,
+        show_only_visible: bool = True,
+        loaded: dict | None = None,
+    ) -> list[tuple[str, str, dict, int | None, bool]]:
+        '''
+        Classify the documents of the given type (or all types, if
+        not specified) as due or overdue in a single pass over their
+        index records, with one point of time for all of them. In the
+        DocumentDateIndex of the due dates all candidates (see
+        _is_due_candidate()) before tomorrow are overdue, the later
+        ones are due. So no document has to be loaded for this.
+
+        Args:
+            doc_typename (str): \
+                The document type name or '' for all types.
+            show_only_visible (bool): \
+                Only classify the visible documents.
+            loaded (dict): \
+                Optionally a dict, which will be filled with the dicts \
+                of the files, which had to be parsed for the index.
+
+        Returns:
+            list: \
+                Returns (doc_typename, abs_filename, record, days till \
+                due, overdue) tuples, sorted like get_list_of_docs() per \
+                type. The \
+                days are None, if the due date is not a valid date; such \
+                documents count as due.
+        '''
+        now = datetime.now()
+        today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        tomorrow = today + timedelta(days=1)
+        output = []
+        for doc_type in self._get_doc_typenames(doc_typename):
+            if doc_type not in self.repositories:
+                continue
+            date_index, records = self._get_date_index(
+                doc_type, 'date_due', now, loaded
+            )
+
+            def is_candidate(abs_filename: str) -> bool:
+                record = records[abs_filename]
+                return self._is_due_candidate(record) and (
+                    not show_only_visible or bool(record.get('visible'))
+                )
+
+            # all before tomorrow are overdue (0 days or less till due)
+            entries = [
+                (
+                    doc_type,
+                    abs_filename,
+                    records[abs_filename],
+                    (due_date - today).days,
+                    overdue,
+                )
+                for overdue, start, end in (
+                    (True, None, tomorrow),
+                    (False, tomorrow, None),
+                )
+                for due_date, abs_filename in date_index.get_range(start, end)
+                if is_candidate(abs_filename)
+            ]
+            entries.extend(
+                (doc_type, abs_filename, records[abs_filename], None, False)
+                for abs_filename in date_index.undated
+                if is_candidate(abs_filename)
+            )
+            entries.sort(key=lambda entry: self._sort_key_of_record(entry[2], now))
+            output.extend(entries)
+        return output
+
+    def get_due_buckets(
+        self, doc_typename: str, show_only_visible: bool = True
+    ) -> dict[str, list[tuple[DocumentSummary, int | None]]]:
+        '''
+        Get the due and the overdue documents of the given type (or
+        all types, if not specified) as lightweight DocumentSummary
+        objects together with their days till due, calculated in
+        a single pass at the same point of time.
+
+        Args:
+            doc_typename (str): \
+                The document type name or '' for all types.
+            show_only_visible (bool): \
+                Only get the visible documents.
+
+        Returns:
+            dict: \
+                Returns the (DocumentSummary, days till due) tuples \
+                in the lists on "due" and "overdue".
+        '''
+        buckets: dict[str, list[tuple[DocumentSummary, int | None]]] = {
+            'due': [],
+            'overdue': [],
+        }
+        for _, abs_filename, record, days, overdue in self._classify_due(
+            doc_typename, show_only_visible
+        ):
+            buckets['overdue' if overdue else 'due'].append(
+                (DocumentSummary.from_record(abs_filename, record), days)
+            )
+        return buckets
+
     def get_due_docs(
         self,
         doc_typename: str,
@@ -385,39 +957,46 @@ class DocumentRepository:
         Returns:
             list: Returns a list with document objects.
         '''
-        all_doc_dicts: list[Document] = []
-
-        # a doc type is given and exists
-        if doc_typename != '' and doc_typename in self.repositories:
-            all_doc_dicts.extend(self.get_list_of_docs(doc_typename, show_only_visible))
-
-        # no doc type given, use all doc types
-        elif doc_typename == '':
-            for doc_type in self.doc_types.keys():
-                all_doc_dicts.extend(self.get_list_of_docs(doc_type, show_only_visible))
+        loaded: dict = {}
+        return self._get_documents_of_records(
+            [
+                (doc_type, abs_filename, record)
+                for doc_type, abs_filename, record, _, overdue in self._classify_due(
+                    doc_typename, show_only_visible, loaded
+                )
+                if (include_overdue if overdue else include_due)
+            ],
+            loaded,
+        )
 
-        # only use docs for output, if they are not done, thus
-        # due or even overdue - but also only according to the
-        # set parameters include_due and include_overdue
-        output = []
-        for doc in all_doc_dicts:
-            is_due = doc.is_due()
-            is_overdue = doc.is_overdue()
+    def get_due_summaries(
+        self,
+        doc_typename: str,
+        include_due: bool = True,
+        include_overdue: bool = True,
+        show_only_visible: bool = True,
+    ) -> list[DocumentSummary]:
+        '''
+        Like get_due_docs(), but get lightweight DocumentSummary
+        objects, which are created from the index records only.
 
-            only_due = (
-                include_due and not include_overdue and (is_due and not is_overdue)
-            )
+        Args:
+            doc_typename (str): The document type name.
+            include_due (bool): include the docuemnts which are due.
+            include_overdue (bool): include the docuemnts which are overdue.
+            show_only_visible (bool): \
+                Show only the visible documents.
 
-            only_overdue = (
-                not include_due and include_overdue and (is_due and is_overdue)
+        Returns:
+            list: Returns a list with DocumentSummary objects.
+        '''
+        return [
+            DocumentSummary.from_record(abs_filename, record)
+            for _, abs_filename, record, _, overdue in self._classify_due(
+                doc_typename, show_only_visible
             )
-
-            due_and_overdue = include_due and include_overdue and (is_due or is_overdue)
-            if only_due or only_overdue or due_and_overdue:
-                if not show_only_visible or doc.is_visible():
-                    output.append(doc)
-
-        return output
+            if (include_overdue if overdue else include_due)
+        ]
 
     def get_filename(self, doc_typename: str, name: str) -> str:
         '''
@@ -449,6 +1028,27 @@ class DocumentRepository:
         else:
             return ''
 
+    def _get_first_document_of_type(
+        self, abs_filenames: list[str], doc_typename: str
+    ) -> Document | None:
+        '''
+        Get the first loadable document of the given absolute filenames,
+        which is of the given document type.
+
+        Args:
+            abs_filenames (list): The absolute filenames to browse.
+            doc_typename (str): The document type name to look for.
+
+        Returns:
+            Document | None: Returns the document or None, if none was found.
+        '''
+        for abs_filename in abs_filenames:
+            if self.get_document_type_from_file(abs_filename) == doc_typename:
+                document = self.load(abs_filename)
+                if document.get_filename():
+                    return document
+        return None
+
     def get_folder(self, doc_typename: str) -> str:
         '''
         Get the absolute path of the document type.
@@ -512,28 +1112,188 @@ class DocumentRepository:
         Returns:
             list: Returns a sorted list with Document objects.
         '''
-        docs_dict = self.get_list(doc_typename, show_only_visible)
-        docs_list = []
-        for doc_name, doc_dict in docs_dict.items():
-            doc = Document(doc_typename, doc_name)
-            doc.init_internals_with_doctype(self.doc_types[doc_typename])
-            doc.from_dict(doc_dict)
-            docs_list.append(doc)
-
-        # sort documents by:
-        # - date issued
-        # - code
-        # - name
-        docs_list = sorted(
-            docs_list,
-            key=lambda doc: (
-                doc.get_issued_date() or '9999-12-31',
-                doc.get_code() or 'ZZZZ',
-                doc.get_name() or '',
-            ),
+        return self._get_list_of_docs_from_index(doc_typename, show_only_visible)
+
+    def _get_documents_of_records(
+        self, records: list[tuple[str, str, dict]], loaded: dict | None = None
+    ) -> list[Document]:
+        '''
+        Get the documents for the given index records from the cache
+        or build them and add them to the cache.
+
+        Args:
+            records (list): \
+                The (doc_typename, abs_filename, record) tuples of \
+                the documents.
+            loaded (dict): \
+                Optionally the dicts of the files, which were parsed \
+                for the index already.
+
+        Returns:
+            list: Returns the Document objects in the same order.
+        '''
+        loaded = loaded if loaded is not None else {}
+        # get all cached documents first, before the newly built
+        # ones could push them out of the cache
+        cached = [
+            self.cache.get_by_filename(abs_filename) for _, abs_filename, _ in records
+        ]
+        return [
+            (
+                document
+                if document is not None
+                else self._build_and_cache_document(
+                    doc_typename, record['name'], abs_filename, loaded.get(abs_filename)
+                )
+            )
+            for document, (doc_typename, abs_filename, record) in zip(cached, records)
+        ]
+
+    def _get_list_of_docs_from_index(
+        self,
+        doc_typename: str,
+        show_only_visible: bool = True,
+        record_filter: Callable[[dict], bool] | None = None,
+    ) -> list[Document]:
+        '''
+        Get a sorted list of document objects, while the selection and
+        the sorting is done with the index records of the documents.
+        So only the documents, which will be in the output, have to be
+        parsed and converted; and only if they are not in the cache and
+        the index does not hold their loaded dict already. The built
+        documents are added to the cache.
+
+        Args:
+            doc_typename (str): \
+                The document type name.
+            show_only_visible (bool): \
+                Only get the visible documents.
+            record_filter (Callable): \
+                Optionally a callable, which gets the index record \
+                and returns True, if the document should be in the \
+                output.
+
+        Returns:
+            list: Returns a sorted list with Document objects.
+        '''
+        loaded: dict = {}
+        return self._get_documents_of_records(
+            [
+                (doc_typename, abs_filename, record)
+                for abs_filename, record in self._get_sorted_records(
+                    doc_typename, show_only_visible, record_filter, loaded
+                )
+            ],
+            loaded,
         )
 
-        return docs_list
+    def get_list_of_summaries(
+        self, doc_typename: str, show_only_visible: bool = True
+    ) -> list[DocumentSummary]:
+        '''
+        Like get_list_of_docs(), but get lightweight DocumentSummary
+        objects, which are created from the index records only. So
+        no document has to be built for listing; and with an up to
+        date index no file has to be parsed either.
+
+        Args:
+            doc_typename (str): \
+                The document type name.
+            show_only_visible (bool): \
+                Show only the visible documents.
+
+        Returns:
+            list: Returns a sorted list with DocumentSummary objects.
+        '''
+        return self._get_list_of_summaries_from_index(doc_typename, show_only_visible)
+
+    def _get_list_of_summaries_from_index(
+        self,
+        doc_typename: str,
+        show_only_visible: bool = True,
+        record_filter: Callable[[dict], bool] | None = None,
+    ) -> list[DocumentSummary]:
+        '''
+        Get a sorted list of DocumentSummary objects from the index
+        records of the documents.
+
+        Args:
+            doc_typename (str): \
+                The document type name.
+            show_only_visible (bool): \
+                Only get the visible documents.
+            record_filter (Callable): \
+                Optionally a callable, which gets the index record \
+                and returns True, if the document should be in the \
+                output.
+
+        Returns:
+            list: Returns a sorted list with DocumentSummary objects.
+        '''
+        return [
+            DocumentSummary.from_record(abs_filename, record)
+            for abs_filename, record in self._get_sorted_records(
+                doc_typename, show_only_visible, record_filter
+            )
+        ]
+
+    def get_linked_filenames(
+        self, abs_filename: str, doc_typename: str = ''
+    ) -> list[str]:
+        '''
+        Get the absolute filenames of the documents, which are linked
+        with the given document in either direction, by the link index;
+        so without loading any document. The entries of the given and
+        of the found documents get verified by their files and only
+        their base variables get read again, if they changed.
+
+        Args:
+            abs_filename (str): \
+                The absolute filename of the document.
+            doc_typename (str): \
+                Optionally only get the linked documents of this \
+                document type.
+
+        Returns:
+            list: Returns the linked absolute filenames.
+        '''
+        link_index = self._get_link_index()
+        self._refresh_link_index_entry(abs_filename)
+        for linked in link_index.get_linked(abs_filename):
+            self._refresh_link_index_entry(linked)
+        link_index.save()
+        return [
+            linked
+            for linked in link_index.get_linked(abs_filename)
+            if link_index.get_doc_typename(linked)
+            and (
+                not doc_typename or link_index.get_doc_typename(linked) == doc_typename
+            )
+        ]
+
+    def _get_link_index(self) -> DocumentLinkIndex:
+        '''
+        Get the link index. If it was not built yet, it will be built
+        from the index records of all document types first.
+
+        Returns:
+            DocumentLinkIndex: Returns the built DocumentLinkIndex.
+        '''
+        if not self.link_index.is_built():
+            for doc_typename, data_repo in self.repositories.items():
+                data_repo.get_index_records(False)
+                if data_repo.index is None:
+                    continue
+                for abs_filename, entry in data_repo.index.get_entries().items():
+                    self.link_index.set(
+                        abs_filename,
+                        doc_typename,
+                        entry['record'].get('links', []),
+                        (entry['mtime'], entry['size']),
+                    )
+            self.link_index.set_built()
+            self.link_index.save()
+        return self.link_index
 
     def get_links_of_document(self, document: Document) -> list[Document]:
         '''
@@ -554,6 +1314,34 @@ class DocumentRepository:
         # now get the links
         return self.links.get_links_of_document(document)
 
+    @staticmethod
+    def _get_order_key(order: str) -> Callable[[dict], Any] | None:
+        '''
+        Get the key function for sorting index records by the given
+        order name.
+
+        Args:
+            order (str): \
+                "date" (date issued, code, name), "code" (code, name), \
+                "name" or "" for no sorting.
+
+        Returns:
+            Callable | None: Returns the key function or None.
+        '''
+        if order == '':
+            return None
+        elif order == 'date':
+            return DocumentRepository._sort_key_of_record
+        elif order == 'code':
+            return lambda record: (
+                record.get('code') or 'ZZZZ',
+                record.get('name') or '',
+            )
+        elif order == 'name':
+            return lambda record: record.get('name') or ''
+        else:
+            raise ValueError(f'Order not possible: {order}')
+
     def get_next_code(self, doc_typename: str = '') -> str:
         '''
         Get the next code for the document type with the given name.
@@ -568,6 +1356,143 @@ class DocumentRepository:
             doc_repo = self.repositories[doc_typename]
         return doc_repo.get_next_code()
 
+    def _get_query_fieldnames(self, doc_typename: str) -> dict[str, str]:
+        '''
+        Get the fieldnames, which can be checked with the index records
+        of the given document type in a query, with the key of the index
+        record as the value. Next to the general ones, these are the date
+        and code fields of the document type. A fixed field of the document
+        type, which is no such field, is not in the index, though, even if
+        it has the name of a general one (like "title").
+
+        Args:
+            doc_typename (str): The document type name.
+
+        Returns:
+            dict: Returns the fieldnames with the keys of the index records.
+        '''
+        fieldnames = dict(DocumentQuery.INDEX_FIELDS)
+        if doc_typename not in self.doc_types:
+            return fieldnames
+        for fieldname in self.get_descriptor(doc_typename):
+            fieldnames.pop(fieldname, None)
+        doc_type = self.doc_types[doc_typename]
+        for key, typename_field in (
+            ('date_issued', 'date_issued_fieldname'),
+            ('date_due', 'date_due_fieldname'),
+            ('date_done', 'date_done_fieldname'),
+            ('code', 'code_fieldname'),
+        ):
+            fieldname = doc_type.get_fixed(typename_field, True)
+            if fieldname:
+                fieldnames[fieldname] = key
+        return fieldnames
+
+    def _get_sorted_records(
+        self,
+        doc_typename: str,
+        show_only_visible: bool = True,
+        record_filter: Callable[[dict], bool] | None = None,
+        loaded: dict | None = None,
+    ) -> list[tuple[str, dict]]:
+        '''
+        Get the filtered index records of the given document type,
+        sorted by (prioritizing):
+          - date issued
+          - code
+          - name
+
+        Args:
+            doc_typename (str): \
+                The document type name.
+            show_only_visible (bool): \
+                Only get the visible documents.
+            record_filter (Callable): \
+                Optionally a callable, which gets the index record \
+                and returns True, if the document should be in the \
+                output.
+            loaded (dict): \
+                Optionally a dict, which will be filled with the dicts \
+                of the files, which had to be parsed for the index.
+
+        Returns:
+            list: Returns a sorted list with (abs_filename, record) tuples.
+        '''
+        if doc_typename not in self.repositories:
+            return []
+        records = self.repositories[doc_typename].get_index_records(
+            show_only_visible, loaded
+        )
+        return sorted(
+            (
+                (abs_filename, record)
+                for abs_filename, record in records.items()
+                if record_filter is None or record_filter(record)
+            ),
+            key=lambda item: self._sort_key_of_record(item[1]),
+        )
+
+    def get_summaries_by_date(
+        self,
+        doc_typename: str,
+        date_name: str = 'issued',
+        start: datetime | None = None,
+        end: datetime | None = None,
+        show_only_visible: bool = True,
+    ) -> list[DocumentSummary]:
+        '''
+        Like get_docs_by_date(), but get lightweight DocumentSummary
+        objects, which are created from the index records only.
+
+        Args:
+            doc_typename (str): \
+                The document type name or '' for all types.
+            date_name (str): \
+                "issued", "due" or "done". (default: `'issued'`)
+            start (datetime): \
+                The first date of the range (including) or None.
+            end (datetime): \
+                The date, where the range ends (excluding) or None.
+            show_only_visible (bool): \
+                Only get the visible documents.
+
+        Returns:
+            list: Returns a sorted list with DocumentSummary objects.
+        '''
+        return [
+            DocumentSummary.from_record(abs_filename, record)
+            for _, abs_filename, record in self._get_records_by_date(
+                doc_typename, date_name, start, end, show_only_visible
+            )
+        ]
+
+    def get_summaries_by_query(
+        self, doc_typename: str, query: DocumentQuery, show_only_visible: bool = True
+    ) -> list[DocumentSummary]:
+        '''
+        Like get_docs_by_query(), but get lightweight DocumentSummary
+        objects, which are created from the index records only. Only
+        the documents, whose match depends on fields, which are not
+        in the index, get loaded.
+
+        Args:
+            doc_typename (str): \
+                The document type name or '' for all types.
+            query (DocumentQuery): \
+                The query with the conditions, sorting and limit.
+            show_only_visible (bool): \
+                Only get the visible documents.
+
+        Returns:
+            list: Returns a sorted list with DocumentSummary objects.
+        '''
+        return [
+            DocumentSummary.from_record(abs_filename, record)
+            for _, abs_filename, record, _ in self._query_records(
+                doc_typename, query, show_only_visible
+            )
+        ]
+
     def get_user_by_username(self, user_name: str = '') -> Document:
         '''
         Return the user according to the given user name. If none
@@ -581,10 +1506,100 @@ class DocumentRepository:
             Document: Returns the user Document.
         '''
         if not user_name:
-            user_name = str(Config().get('user_default_name'))
-        user = self.load(user_name, str(Config().get('user_type')))
+            user_name = str(Config.get_instance().get('user_default_name'))
+        user = self.load(user_name, str(Config.get_instance().get('user_type')))
         return user
 
+    @staticmethod
+    def _index_value(value: Any) -> Any:
+        '''
+        Convert the given value to something, which can be stored
+        in the index; so basically a JSON compatible value.
+
+        Args:
+            value (Any): The value to convert.
+
+        Returns:
+            Any: Returns the JSON compatible value.
+        '''
+        if value is None or isinstance(value, (bool, int, float, str)):
+            return value
+        elif isinstance(value, date):
+            return value.strftime('%Y-%m-%d')
+        else:
+            return str(value)
+
+    @staticmethod
+    def _is_due_candidate(record: dict) -> bool:
+        '''
+        Check by the index record, if the document can be due at all.
+        With the index only those documents have to be loaded, which
+        have a due date, yet no done date; all others cannot be due or
+        overdue anyway.
+
+        Args:
+            record (dict): The index record of the document.
+
+        Returns:
+            bool: Returns True, if the document might be due.
+        '''
+        return record.get('date_due') is not None and record.get('date_done') is None
+
+    def iter_documents(
+        self, doc_typename: str = '', visible_only: bool = True, order: str = 'date'
+    ) -> Iterator[Document]:
+        '''
+        Iterate over the documents of the given type (or all types, if
+        none is given), while only a few of them are in memory at once.
+        The selection and the sorting happens with the index records,
+        so only the yielded documents get parsed and built. Documents,
+        which are in the cache already, are used from it, yet the built
+        ones are not added to it, to keep the memory low.
+
+        Args:
+            doc_typename (str): \
+                The document type name or '' for all types.
+            visible_only (bool): \
+                Only iterate over the visible documents.
+            order (str): \
+                "date" (date issued, code, name; like get_list_of_docs()), \
+                "code" (code, name), "name" or "" for no sorting. \
+                (default: `'date'`)
+
+        Returns:
+            Iterator: Yields the Document objects.
+        '''
+        order_key = self._get_order_key(order)
+        entries = [
+            (doc_type, abs_filename, record)
+            for doc_type in self._get_doc_typenames(doc_typename)
+            if doc_type in self.repositories
+            for abs_filename, record in self.repositories[doc_type]
+            .get_index_records(visible_only)
+            .items()
+        ]
+        if order_key is not None:
+            entries.sort(key=lambda entry: order_key(entry[2]))
+
+        # load the files of a document type in chunks, as long as
+        # the following documents in the order are of the same type
+        for doc_type, group in groupby(entries, key=lambda entry: entry[0]):
+            names = {abs_filename: record['name'] for _, abs_filename, record in group}
+            cached = {}
+            for abs_filename in names:
+                document = self.cache.get_by_filename(abs_filename)
+                if document is not None:
+                    cached[abs_filename] = document
+            loaded = self.repositories[doc_type].iter_files(
+                [abs_filename for abs_filename in names if abs_filename not in cached]
+            )
+            for abs_filename, name in names.items():
+                if abs_filename in cached:
+                    yield cached[abs_filename]
+                else:
+                    _, data = next(loaded)
+                    yield self._build_document(doc_type, name, data, abs_filename)
+
     def load(self, name: str, doc_typename: str = '') -> Document:
         '''
         Load a Document instance by just its name and document type
@@ -657,7 +1672,14 @@ class DocumentRepository:
         # did exist in the first place. otherwise the extract_name_from_path()
         # method won't be able to extract the name correctly
         name = tmp_data_repo.file.extract_name_from_path(abs_filename)
-        return self.load(name, str(doc_typename))
+        # the name comes from the filename and is no code; so it does not
+        # have to be looked up in the code index of the document type,
+        # which would read all its documents, if it was not built yet
+        cache_loading = self.cache.get_by_doc_type_and_name(str(doc_typename), name)
+        if cache_loading is not None:
+            return cache_loading
+        else:
+            return self._load_by_doc_typename_name_combi(name, str(doc_typename))
 
     def _load_by_doc_typename_name_combi(
         self, name: str, doc_typename: str = ''
@@ -694,7 +1716,7 @@ class DocumentRepository:
             # get the respecting DataRepository and DocumentType
             data_repo = self.repositories[doc_typename]
             document.set_document_typename(doc_typename)
-            document.init_internals_with_doctype(self.doc_types[doc_typename])
+            document.init_internals_with_doctype(self.doc_types[doc_typename], False)
             document.set_filename(data_repo.file.generate_absolute_filename(name))
         else:
             # this DataRepository without an existing
@@ -702,6 +1724,7 @@ class DocumentRepository:
             # to load an absolute filename
             data_repo = DataRepository()
 
+        document.set_lazy_fixed()
         document.from_dict(data_repo.load_dict_from_name(name))
 
         # also add to the cache
@@ -730,6 +1753,213 @@ class DocumentRepository:
             document.init_internals_with_doctype(self.doc_types[doc_typename])
         return document
 
+    def _project_index_record(
+        self, doc_typename: str, abs_filename: str, data: dict
+    ) -> dict:
+        '''
+        Generate the index record for a document of the given type. It
+        holds the data, which is needed for listing the documents without
+        loading them. The dates are stored in their readable format as
+        they are in the file (or the default of the document type), since
+        they can also be relative like "+14", which has to be calculated
+        on runtime.
+
+        Args:
+            doc_typename (str): The document type name.
+            abs_filename (str): The absolute filename of the document.
+            data (dict): The loaded dict of the document.
+
+        Returns:
+            dict: Returns the index record.
+        '''
+        name = self.repositories[doc_typename].file.extract_name_from_path(abs_filename)
+        # build it from the file content, since a cached document might
+        # have unsaved changes; yet keep it, if it is not cached already
+        document = self._build_document(doc_typename, name, data, abs_filename)
+        self.cache.add_document(document, doc_typename, name, abs_filename, False)
+        descriptor = self.get_descriptor(doc_typename)
+
+        # the due and done dates are only read from fixed fields by
+        # the Document, while the issued date can also be additional
+        def raw_value(fieldname: str, fixed_only: bool = True) -> Any:
+            if fieldname in descriptor:
+                return self._index_value(
+                    data[fieldname]
+                    if fieldname in data
+                    else descriptor[fieldname].get('default')
+                )
+            elif fieldname and not fixed_only:
+                return self._index_value(data.get(fieldname))
+            else:
+                return None
+
+        return {
+            # same as DataRepository.get_list(): no "visible" means hidden
+            'visible': bool(data.get('visible')),
+            'doc_typename': document.get_document_typename(),
+            'name': name,
+            'date_issued': raw_value(document.date_issued_fieldname, False),
+            'date_due': raw_value(document.date_due_fieldname),
+            'date_done': raw_value(document.date_done_fieldname),
+            'code': self._index_value(document.get_code()),
+            'title': self._index_value(document.get_title()),
+            'total': document.get_total(True),
+            'vat': document.get_vat(True),
+            'total_with_vat': document.get_total_with_vat(True),
+            'links': [link for link in document.get_links() if link],
+        }
+
+    def _query_records(
+        self,
+        doc_typename: str,
+        query: DocumentQuery,
+        show_only_visible: bool = True,
+        loaded: dict | None = None,
+    ) -> list[tuple[str, str, dict, Document | None]]:
+        '''
+        Get the index records of the documents of the given type (or
+        all types, if not specified), which match the given query. The
+        query is checked with the index records first; only documents,
+        which cannot be decided by them, get loaded and checked again.
+        Those are checked in the final order, so that no more documents
+        get loaded than the limit needs.
+
+        Args:
+            doc_typename (str): \
+                The document type name or '' for all types.
+            query (DocumentQuery): \
+                The query with the conditions, sorting and limit.
+            show_only_visible (bool): \
+                Only get the visible documents.
+            loaded (dict): \
+                Optionally a dict, which will be filled with the dicts \
+                of the files, which had to be parsed for the index.
+
+        Returns:
+            list: \
+                Returns (doc_typename, abs_filename, record, document) \
+                tuples; the document is only set, if it had to be loaded.
+        '''
+        loaded = loaded if loaded is not None else {}
+        now = datetime.now()
+        fieldnames_of_types = {}
+        candidates = []
+        undecided = set()
+        for doc_type in self._get_doc_typenames(doc_typename):
+            if doc_type not in self.repositories:
+                continue
+            fieldnames = self._get_query_fieldnames(doc_type)
+            fieldnames_of_types[doc_type] = fieldnames
+            # skip the whole document type, if it cannot match anyway
+            if (
+                query.matches({'doc_typename': doc_type}, fieldnames, None, now)
+                is False
+            ):
+                continue
+            entries = []
+            records = self.repositories[doc_type].get_index_records(
+                show_only_visible, loaded
+            )
+            for abs_filename, record in records.items():
+                result = query.matches(record, fieldnames, None, now)
+                if result is None:
+                    undecided.add(abs_filename)
+                if result is not False:
+                    entries.append((doc_type, abs_filename, record))
+            if not query.sort:
+                entries.sort(key=lambda entry: self._sort_key_of_record(entry[2], now))
+            candidates.extend(entries)
+        if query.sort:
+            candidates = query.sort_records(candidates, fieldnames_of_types, now)
+
+        output: list[tuple[str, str, dict, Document | None]] = []
+        for doc_type, abs_filename, record in candidates:
+            if query.limit and len(output) >= query.limit:
+                break
+            document = None
+            if abs_filename in undecided:
+                document = self._get_documents_of_records(
+                    [(doc_type, abs_filename, record)], loaded
+                )[0]
+                if not query.matches(
+                    record, fieldnames_of_types[doc_type], document, now
+                ):
+                    continue
+            output.append((doc_type, abs_filename, record, document))
+        return output
+
+    def _refresh_link_index_entry(self, abs_filename: str) -> bool:
+        '''
+        Bring the entry of the given document in the link index up to
+        date, if its file changed. Only the base variables of the file
+        get read for this.
+
+        Args:
+            abs_filename (str): The absolute filename of the document.
+
+        Returns:
+            bool: Returns True, if the document exists.
+        '''
+        if self.link_index.is_current(abs_filename):
+            return True
+        if not os.path.exists(abs_filename):
+            self.link_index.remove(abs_filename)
+            return False
+        base = DataRepository().load_base_dict_from_name(abs_filename)
+        self.link_index.set(
+            abs_filename,
+            self.folder_index.get(abs_filename) or str(base.get('doc_typename') or ''),
+            base.get('links') or [],
+        )
+        return True
+
+    def _refresh_code_index(self, doc_typename: str, check_files: bool = True) -> None:
+        '''
+        Build the code index for the given document type from the
+        records of its DataIndex.
+
+        Args:
+            doc_typename (str): \
+                The document type name.
+            check_files (bool): \
+                If True, the DataIndex will be updated from the files \
+                first; otherwise only the stored DataIndex will be used.
+        '''
+        data_repo = self.repositories[doc_typename]
+        if data_repo.index is None:
+            records = data_repo.get_index_records(False)
+            signatures = {abs_filename: None for abs_filename in records}
+            self.code_index.refreshed.add(doc_typename)
+        else:
+            if check_files:
+                data_repo.get_index_records(False)
+                self.code_index.refreshed.add(doc_typename)
+            index_entries = data_repo.index.get_entries()
+            records = {
+                abs_filename: entry['record']
+                for abs_filename, entry in index_entries.items()
+            }
+            signatures = {
+                abs_filename: (entry['mtime'], entry['size'])
+                for abs_filename, entry in index_entries.items()
+            }
+        abs_filenames = sorted(
+            records,
+            key=lambda abs_filename: self._sort_key_of_record(records[abs_filename]),
+        )
+        self.code_index.build(
+            doc_typename,
+            [
+                (
+                    str(records[abs_filename].get('code') or ''),
+                    str(records[abs_filename].get('name') or ''),
+                    abs_filename,
+                    signatures[abs_filename],
+                )
+                for abs_filename in abs_filenames
+            ],
+        )
+
     def remove(self, doc_typename: str, name: str) -> bool:
         '''
         Checkif the given document of the given document type
@@ -756,7 +1986,14 @@ class DocumentRepository:
             self.save(unlink_doc)
 
         # finally remove the document, which has to be deleted
-        return doc_repo.remove(name)
+        if not doc_repo.remove(name):
+            return False
+        self.code_index.remove_filename(doc_typename, doc_to_remove.get_filename())
+        self.cache.remove_document(doc_to_remove.get_filename())
+        if self.link_index.is_built():
+            self.link_index.remove(doc_to_remove.get_filename())
+            self.link_index.save()
+        return True
 
     def remove_link(self, document_a: Document, document_b: Document) -> bool:
         '''
@@ -802,6 +2039,14 @@ class DocumentRepository:
 
         doc_rename_success = data_repo.rename(old_name, new_name)
         new_path = data_repo.file.generate_absolute_filename(new_name)
+        if doc_rename_success:
+            self.code_index.rename_filename(doc_typename, old_path, new_name, new_path)
+            if self.link_index.is_built():
+                self.link_index.rename(old_path, new_path)
+                self.link_index.save()
+            # the document is hashed by its filename; so the link
+            # manager has to set it, since it holds it in sets
+            self.links.rename_document(document, new_path)
 
         self.cache.rename_document(
             document, doc_typename, old_name, new_name, old_path, new_path
@@ -835,12 +2080,52 @@ class DocumentRepository:
             return ''
         output = data_repo.save(document, name)
         if output:
-            document.set_filename(output)
-            # only add it to the cache, if saving
-            # was successful
-            self.cache.add_document(document, doc_typename, name, output)
+            old_abs_filename = document.get_filename()
+            if old_abs_filename and old_abs_filename != output:
+                # the document is hashed by its filename; so the link
+                # manager has to set it, since it holds it in sets
+                self.links.rename_document(document, output)
+                self.cache.remove_document(old_abs_filename)
+            else:
+                document.set_filename(output)
+            # only add it to the cache, if saving was successful; with
+            # the name of the file, since "name" can be the filename
+            saved_name = data_repo.file.extract_name_from_path(output)
+            self.cache.add_document(document, doc_typename, saved_name, output)
+            self.code_index.set(
+                doc_typename,
+                str(self._index_value(document.get_code()) or ''),
+                saved_name,
+                output,
+            )
+            # without a built link index, it will get the saved links
+            # from the index records anyway, when it gets built
+            if self.link_index.is_built():
+                self.link_index.set(output, doc_typename, document.get_links())
+                self.link_index.save()
         return output
 
+    @staticmethod
+    def _sort_key_of_record(record: dict, now: datetime | None = None) -> tuple:
+        '''
+        Get the key for sorting documents by their index record, which
+        is (prioritizing): date issued, code, name.
+
+        Args:
+            record (dict): The index record of the document.
+            now (datetime): \
+                The point of time for relative dates. \
+                (default: `datetime.now()`)
+
+        Returns:
+            tuple: Returns the sort key.
+        '''
+        return (
+            date_to_internal(record.get('date_issued'), now) or datetime.max,
+            record.get('code') or 'ZZZZ',
+            record.get('name') or '',
+        )
+
     def _update_new_doc_name_in_its_links(
         self, document: Document, old_name: str, new_name: str
     ) -> bool:
@@ -879,10 +2164,12 @@ class DocumentRepository:
         links = self.links.get_links_of_document(document)
         for linked_doc in links:
             # update the old documents path in the linked documents link list
-            linked_doc.links = [
-                new_path if item == old_path else item
-                for item in linked_doc.get_links()
-            ]
+            linked_doc.set_links(
+                [
+                    new_path if item == old_path else item
+                    for item in linked_doc.get_links()
+                ]
+            )
 
             # save the linked document directly
             linked_doc_typename = linked_doc.get_document_typename()
@@ -893,5 +2180,12 @@ class DocumentRepository:
                 linked_doc.get_filename()
             )
             linked_doc_data_repo.save(linked_doc, linked_doc_name)
+            # its file changed; so refresh its signature in the cache
+            self.cache.add_document(
+                linked_doc,
+                linked_doc_typename,
+                linked_doc_name,
+                linked_doc.get_filename(),
+            )
 
         return True
@@ -0,0 +1,111 @@
+'''
+DocumentSchema class
+
+This class is the compiled form of a DocumentType. It holds the
+FieldConversionManager with all field types and the descriptor of
+the document type set up, and the field names for dates, title and
+code. It gets created once per DocumentType (see its get_schema()
+method) and is shared by all documents of this type, so that loading
+many documents does not set up the same conversion tables for each
+of them again.
+
+The schema must not be changed after its creation. A document, which
+wants to change its fields, copies the FieldConversionManager first.
+Its FieldConversionManager uses compiled converters for whole dicts.
+'''
+
+from plainvoice.model.data.data_model import DataModel
+from plainvoice.model.field.field_conversion_manager import FieldConversionManager
+
+
+class DocumentSchema:
+    '''
+    The compiled and shared form of a DocumentType.
+    '''
+
+    def __init__(self, document_type: DataModel, field_types: FieldConversionManager):
+        '''
+        Compile the given DocumentType with the given field types.
+
+        Args:
+            document_type (DocumentType): \
+                The document type to compile.
+            field_types (FieldConversionManager): \
+                The manager, which holds all field types, which \
+                can be used in the descriptor of the document type.
+        '''
+        self.code_fieldname: str = document_type.get_fixed('code_fieldname', True)
+        '''
+        The field name, describing on which fixed field the code is.
+        '''
+
+        self.date_done_fieldname: str = document_type.get_fixed(
+            'date_done_fieldname', True
+        )
+        '''
+        The field name which will hold the done / paid date.
+        '''
+
+        self.date_due_fieldname: str = document_type.get_fixed(
+            'date_due_fieldname', True
+        )
+        '''
+        The field name which will hold the due date.
+        '''
+
+        self.date_issued_fieldname: str = document_type.get_fixed(
+            'date_issued_fieldname', True
+        )
+        '''
+        The field name which will hold the issued date.
+        '''
+
+        self.field_types: FieldConversionManager = field_types
+        '''
+        The manager with the field types, the schema was compiled with.
+        '''
+
+        self.fixed_field_conversion_manager: FieldConversionManager = field_types.copy()
+        '''
+        The FieldConversionManager with the field types and the
+        descriptor set up. It is shared by all documents of the type.
+        '''
+
+        self.revision: int = document_type.fixed_revision
+        '''
+        The fixed revision of the document type, when it was compiled.
+        If the document type changes afterwards, the schema is outdated.
+        '''
+
+        self.title_fieldname: str | list = document_type.get_fixed(
+            'title_fieldname', True
+        )
+        '''
+        The field name (or list of field names), describing on which
+        fixed field the readable title is.
+        '''
+
+        descriptor = document_type.get_fixed('fixed_fields', False)
+        self.fixed_field_conversion_manager.set_descriptor(
+            {fieldname: dict(field) for fieldname, field in descriptor.items()}
+        )
+        self.fixed_field_conversion_manager.set_compiled()
+
+    def is_current(
+        self, document_type: DataModel, field_types: FieldConversionManager
+    ) -> bool:
+        '''
+        Check if this schema still describes the given document type
+        with the given field types.
+
+        Args:
+            document_type (DocumentType): The document type.
+            field_types (FieldConversionManager): The field types.
+
+        Returns:
+            bool: Returns True, if the schema can still be used.
+        '''
+        return (
+            self.revision == document_type.fixed_revision
+            and self.field_types is field_types
+        )
@@ -0,0 +1,394 @@
+'''
+DocumentSummary class
+
+This class is a small read-only stand-in for a Document, which is
+used for listing documents. It only holds the projected fields of
+an index record (type, name, dates, code, title and the totals), so
+that a listing does not have to build the whole Document with all
+its fields, postings and conversion managers, just to print some
+lines of a table.
+
+It offers the same getters as the Document for these fields, thus
+the IOFacade tables and the DocumentCalculator can use both. The
+dates are stored raw like in the file and get converted on access,
+since they can be relative like "+14", which is calculated on runtime.
+'''
+
+from plainvoice.model.document.document import date_to_internal
+from plainvoice.model.quantity.price import Price
+
+from datetime import datetime
+
+
+class DocumentSummary:
+    '''
+    The lightweight summary of a document for listings.
+    '''
+
+    __slots__ = (
+        'abs_filename',
+        'code',
+        'date_done',
+        'date_due',
+        'date_issued',
+        'doc_typename',
+        'name',
+        'title',
+        'total',
+        'total_with_vat',
+        'vat',
+        'visible',
+    )
+
+    def __init__(
+        self,
+        doc_typename: str = '',
+        name: str = '',
+        abs_filename: str = '',
+        visible: bool = False,
+        date_issued: str | None = None,
+        date_due: str | None = None,
+        date_done: str | None = None,
+        code: str | None = None,
+        title: str = '',
+        total: str = '',
+        vat: str = '',
+        total_with_vat: str = '',
+    ):
+        '''
+        The summary of a document with only the projected fields.
+
+        Args:
+            doc_typename (str): The document type name.
+            name (str): The name of the document.
+            abs_filename (str): The absolute filename of the document.
+            visible (bool): The visibility of the document.
+            date_issued (str): The raw issued date.
+            date_due (str): The raw due date.
+            date_done (str): The raw done date.
+            code (str): The code of the document.
+            title (str): The readable title of the document.
+            total (str): The readable total.
+            vat (str): The readable vat.
+            total_with_vat (str): The readable total with vat.
+        '''
+        self.abs_filename: str = abs_filename
+        '''
+        The absolute filename of the document.
+        '''
+
+        self.code: str | None = code
+        '''
+        The code of the document.
+        '''
+
+        self.date_done: str | None = date_done
+        '''
+        The raw done date as it is in the file.
+        '''
+
+        self.date_due: str | None = date_due
+        '''
+        The raw due date as it is in the file.
+        '''
+
+        self.date_issued: str | None = date_issued
+        '''
+        The raw issued date as it is in the file.
+        '''
+
+        self.doc_typename: str = doc_typename
+        '''
+        The document type name.
+        '''
+
+        self.name: str = name
+        '''
+        The name of the document.
+        '''
+
+        self.title: str = title
+        '''
+        The readable title of the document.
+        '''
+
+        self.total: str | Price = total
+        '''
+        The total as a readable string. It gets replaced by its
+        Price object on the first calculation with it.
+        '''
+
+        self.total_with_vat: str | Price = total_with_vat
+        '''
+        The total with vat as a readable string. It gets replaced by
+        its Price object on the first calculation with it.
+        '''
+
+        self.vat: str | Price = vat
+        '''
+        The vat as a readable string. It gets replaced by its Price
+        object on the first calculation with it.
+        '''
+
+        self.visible: bool = visible
+        '''
+        The visibility of the document.
+        '''
+
+    def days_till_due_date(self) -> int | None:
+        '''
+        Get the days as an integer till due from today on; like
+        Document.days_till_due_date() without a from-date fieldname.
+
+        Returns:
+            int | None: Returns days as integer or None.
+        '''
+        due_date = self.get_due_date()
+        if not isinstance(due_date, datetime):
+            return None
+        now = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        return (due_date - now).days
+
+    @classmethod
+    def from_record(cls, abs_filename: str, record: dict) -> 'DocumentSummary':
+        '''
+        Create the summary from an index record, as it is created by
+        DocumentRepository._project_index_record().
+
+        Args:
+            abs_filename (str): The absolute filename of the document.
+            record (dict): The index record of the document.
+
+        Returns:
+            DocumentSummary: Returns the new DocumentSummary instance.
+        '''
+        return cls(
+            record.get('doc_typename', ''),
+            record.get('name', ''),
+            abs_filename,
+            bool(record.get('visible')),
+            record.get('date_issued'),
+            record.get('date_due'),
+            record.get('date_done'),
+            record.get('code'),
+            record.get('title') or record.get('name', ''),
+            record.get('total', ''),
+            record.get('vat', ''),
+            record.get('total_with_vat', ''),
+        )
+
+    def get_code(self) -> str | None:
+        '''
+        Get the code of the document.
+
+        Returns:
+            str | None: Returns the code.
+        '''
+        return self.code
+
+    @staticmethod
+    def _get_date(value: str | None, readable: bool) -> datetime | str | None:
+        '''
+        Convert the raw date to its internal or readable value.
+
+        Args:
+            value (str | None): The raw date.
+            readable (bool): If True get readbale, else internal.
+
+        Returns:
+            datetime | str | None: Returns the date or None.
+        '''
+        internal = date_to_internal(value)
+        if readable and internal is not None:
+            return internal.strftime('%Y-%m-%d')
+        return internal
+
+    def get_document_typename(self) -> str:
+        '''
+        Get the document type name.
+
+        Returns:
+            str: Returns the document type name.
+        '''
+        return self.doc_typename
+
+    def get_done_date(self, readable: bool = False) -> datetime | str | None:
+        '''
+        Get the done / paid date.
+
+        Args:
+            readable (bool): If True get readbale, else internal.
+
+        Returns:
+            datetime: Returns the datetime or None.
+        '''
+        return self._get_date(self.date_done, readable)
+
+    def get_due_date(self, readable: bool = False) -> datetime | str | None:
+        '''
+        Get the due date.
+
+        Args:
+            readable (bool): If True get readbale, else internal.
+
+        Returns:
+            datetime: Returns the datetime or None.
+        '''
+        return self._get_date(self.date_due, readable)
+
+    def get_filename(self) -> str:
+        '''
+        Get the absolute filename of the document.
+
+        Returns:
+            str: Returns the absolute filename as a string.
+        '''
+        return self.abs_filename
+
+    def get_issued_date(self, readable: bool = False) -> datetime | str | None:
+        '''
+        Get the issued date.
+
+        Args:
+            readable (bool): If True get readbale, else internal.
+
+        Returns:
+            datetime: Returns the datetime or None.
+        '''
+        return self._get_date(self.date_issued, readable)
+
+    def get_name(self) -> str:
+        '''
+        Get the name of the document.
+
+        Returns:
+            str: Returns the name.
+        '''
+        return self.name
+
+    def get_title(self) -> str:
+        '''
+        Get the readable title of the document. Like for the
+        Document, it falls back to the name.
+
+        Returns:
+            str: Returns the readable title string.
+        '''
+        return self.title
+
+    def get_total(self, readable: bool = False) -> Price | str:
+        '''
+        Get the total of the document.
+
+        Args:
+            readable (bool): Convert the output to a readable.
+
+        Returns:
+            Price | str: The total amount as a Price or string.
+        '''
+        return self._get_total_vat_and_both('total', readable)
+
+    def _get_total_vat_and_both(
+        self, what: str = 'total', readable: bool = False
+    ) -> Price | str:
+        '''
+        Get the total, vat or both together. The readable string
+        gets parsed into a Price only, if it is needed.
+
+        Args:
+            what (str): "total", "vat" or "total_with_vat"
+            readable (bool): Convert the output to a readable.
+
+        Returns:
+            Price | str: Returns the total as a Price object or string.
+        '''
+        total = getattr(self, what)
+        if readable:
+            return str(total)
+        if not isinstance(total, Price):
+            total = Price(total) if total else Price()
+            setattr(self, what, total)
+        return total
+
+    def get_total_with_vat(self, readable: bool = False) -> Price | str:
+        '''
+        Get the total with vat of the document.
+
+        Args:
+            readable (bool): Convert the output to a readable.
+
+        Returns:
+            Price | str: The total amount as a Price or string.
+        '''
+        return self._get_total_vat_and_both('total_with_vat', readable)
+
+    def get_totals(self) -> dict:
+        '''
+        Get the total, vat and both together in the format of
+        Document.get_totals(). The summary does not know the single
+        postings, thus "by_vat" is always empty.
+
+        Returns:
+            dict: \
+                Returns the dict with "total", "vat", "total_with_vat" \
+                and "by_vat".
+        '''
+        return {
+            'total': self.get_total(),
+            'vat': self.get_vat(),
+            'total_with_vat': self.get_total_with_vat(),
+            'by_vat': {},
+        }
+
+    def get_vat(self, readable: bool = False) -> Price | str:
+        '''
+        Get the vat of the document.
+
+        Args:
+            readable (bool): Convert the output to a readable.
+
+        Returns:
+            Price | str: The total amount as a Price or string.
+        '''
+        return self._get_total_vat_and_both('vat', readable)
+
+    def is_done(self) -> bool:
+        '''
+        Check if the document is done; so if it has a done date or
+        no due date at all.
+
+        Returns:
+            bool: Returns True if the document is done.
+        '''
+        return self.date_due is None or self.date_done is not None
+
+    def is_due(self) -> bool:
+        '''
+        Check if the document is due according to is_done().
+
+        Returns:
+            bool: Returns True if document is due.
+        '''
+        return not self.is_done()
+
+    def is_overdue(self) -> bool:
+        '''
+        Check if the document is overdue from today on; like
+        Document.is_overdue() without a from-date fieldname.
+
+        Returns:
+            bool: Returns True if document is overdue.
+        '''
+        days = self.days_till_due_date()
+        if days is None:
+            return False
+        return days <= 0 and self.date_done is None
+
+    def is_visible(self) -> bool:
+        '''
+        Get the visibility of the document.
+
+        Returns:
+            bool: Returns True, if the document is visible.
+        '''
+        return self.visible
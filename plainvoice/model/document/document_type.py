@@ -9,6 +9,8 @@ documents are being stored (e.g. folder).
 '''
 
 from plainvoice.model.data.data_model import DataModel
+from plainvoice.model.document.document_schema import DocumentSchema
+from plainvoice.model.field.field_conversion_manager import FieldConversionManager
 
 
 class DocumentType(DataModel):
@@ -38,6 +40,13 @@ class DocumentType(DataModel):
 
         '''
         super().__init__()
+
+        self.schema: DocumentSchema | None = None
+        '''
+        The compiled schema of this document type. It will be compiled
+        again, if the fixed fields of the document type changed.
+        '''
+
         self._init_fixed_fields()
         self.set_fixed('folder', folder, True)
         self.set_fixed('filename_pattern', filename_pattern, True)
@@ -66,6 +75,7 @@ class DocumentType(DataModel):
             'type': typename,
             'default': default,
         }
+        self.fixed_revision += 1
 
     def get_descriptor(self) -> dict:
         '''
@@ -95,6 +105,23 @@ class DocumentType(DataModel):
         '''
         return self.get_fixed('folder', False)
 
+    def get_schema(self, field_types: FieldConversionManager) -> DocumentSchema:
+        '''
+        Get the compiled schema of this document type. It will only
+        be compiled, if it does not exist yet or is outdated.
+
+        Args:
+            field_types (FieldConversionManager): \
+                The manager, which holds all field types, which \
+                can be used in the descriptor.
+
+        Returns:
+            DocumentSchema: Returns the schema.
+        '''
+        if self.schema is None or not self.schema.is_current(self, field_types):
+            self.schema = DocumentSchema(self, field_types)
+        return self.schema
+
     def _init_fixed_fields(self) -> None:
         '''
         Initialize the fixed fields for this special DataModel child.
@@ -42,7 +42,7 @@ class DocumentTypeRepository(DataRepository):
         Returns:
             bool: Returns True on success.
         '''
-        project_path = Config().project_path
+        project_path = Config.get_instance().project_path
         default_template_filename = f'{project_path}/assets/invoice_type.yaml'
 
         return self.file.copy(
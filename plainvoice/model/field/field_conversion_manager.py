@@ -9,6 +9,14 @@ in the YAML or convert it back from it.
 It is also for filling missing fields. E.g. if the user did not enter
 some field, yet the descriptor knows this field. Then it will just
 added to the dict with its defined default value.
+
+Optionally the dict conversion can be compiled: then for a given order
+of keys in the input dict a specialized Python function gets generated,
+which converts every field in a single straight-line pass, similar to
+what dataclasses does for __init__. These functions are cached by the
+fingerprint of the fields, so managers with the same fields and the same
+converter functions share them; also the ones of different
+DocumentRepository instances.
 '''
 
 from plainvoice.model.field.field_type_converter import FieldTypeConverter
@@ -69,6 +77,13 @@ class FieldConversionManager:
     readable; thus to_internal (from YAML) or to_readable (to YAML).
     '''
 
+    compiled_cache: dict[tuple, Callable] = {}
+    '''
+    The compiled converters of all managers. The key is the
+    fingerprint, the order of keys of the input dict and if it
+    converts to readable.
+    '''
+
     def __init__(self):
         '''
         Create an instance of this class with the given fields,
@@ -85,6 +100,24 @@ class FieldConversionManager:
         name_to_default if the variable on that dict is None or if it
         does not even exist in the dict.
         '''
+        self.compiled: bool = False
+        '''
+        If True, convert_dict() uses compiled converters.
+        '''
+
+        self.compiled_converters: dict[tuple, Callable] = {}
+        '''
+        The compiled converters of this manager. The key is the order
+        of keys of the input dict and if it converts to readable. It
+        gets cleared, when the fields change.
+        '''
+
+        self.fingerprint: tuple = ()
+        '''
+        The fingerprint of the fields and their converters and defaults.
+        It gets created on demand and cleared, when the fields change.
+        '''
+
         self.name_to_default: dict[str, object] = {}
         '''
         The dict with field names as key and the respecting readable default
@@ -120,7 +153,11 @@ class FieldConversionManager:
         '''
 
     def add_field_type(
-        self, field_type_str: str, to_internal: Callable, to_readable: Callable
+        self,
+        field_type_str: str,
+        to_internal: Callable,
+        to_readable: Callable,
+        keep_readable: bool = True,
     ) -> None:
         '''
         Basically this method will instantiate a new FieldTypeConverter
@@ -138,13 +175,17 @@ class FieldConversionManager:
             to_readable (Callable): \
                 The callable with which the fields data gets \
                 converted to readbale from internal.
+            keep_readable (bool): \
+                If True, a readable value, which was never converted, \
+                can be written back as it is. (default: `True`)
         '''
         field_type_converter = FieldTypeConverter(
-            field_type_str, to_internal, to_readable
+            field_type_str, to_internal, to_readable, keep_readable
         )
         field_type_str = str(field_type_converter)
 
         self.type_to_field_type_converter[field_type_str] = field_type_converter
+        self._reset_compiled()
 
     def add_field_descriptor(self, fieldname: str, typename: str, default: Any) -> None:
         '''
@@ -169,6 +210,71 @@ class FieldConversionManager:
             self.name_to_field_type_converter[fieldname] = (
                 self.type_to_field_type_converter[typename]
             )
+        self._reset_compiled()
+
+    def can_keep_readable(self, fieldname: str) -> bool:
+        '''
+        Check if a readable value of the given field, which was never
+        converted, can be written back as it is.
+
+        Args:
+            fieldname (str): The field name.
+
+        Returns:
+            bool: Returns True, if it can be kept as it is.
+        '''
+        field_type_converter = self.name_to_field_type_converter.get(fieldname)
+        return field_type_converter is not None and field_type_converter.keep_readable
+
+    def _compile_converter(self, keys: tuple, readable: bool) -> Callable:
+        '''
+        Generate a function, which converts a dict with the given order
+        of keys like convert_dict() does, yet in one straight-line pass
+        without looking up the converters and defaults of each field.
+
+        Args:
+            keys (tuple): The keys of the input dict in their order.
+            readable (bool): Converts to readable if True.
+
+        Returns:
+            Callable: Returns the function, which gets the dict.
+        '''
+        namespace: dict[str, Any] = {}
+        lines = ['def convert(data):', '    output = {}']
+        present = set()
+        for i, fieldname in enumerate(keys):
+            if fieldname not in self.name_to_field_type_converter:
+                continue
+            present.add(fieldname)
+            converter = self.name_to_field_type_converter[fieldname]
+            namespace[f'k_{i}'] = fieldname
+            namespace[f'c_{i}'] = (
+                converter.to_readable if readable else converter.to_internal
+            )
+            lines.append(f'    value = data[k_{i}]')
+            lines.append(f'    output[k_{i}] = None if value is None else c_{i}(value)')
+
+        # the missing fields get their default in the order of the descriptor
+        for i, fieldname in enumerate(self.user_descriptor, len(keys)):
+            if fieldname in present or fieldname in keys:
+                continue
+            if fieldname not in self.name_to_default:
+                continue
+            default = self.name_to_default[fieldname]
+            converter = self.name_to_field_type_converter.get(fieldname)
+            namespace[f'k_{i}'] = fieldname
+            namespace[f'd_{i}'] = default
+            if readable or converter is None:
+                lines.append(f'    output[k_{i}] = d_{i}')
+            elif default is None:
+                lines.append(f'    output[k_{i}] = None')
+            else:
+                namespace[f'c_{i}'] = converter.to_internal
+                lines.append(f'    output[k_{i}] = c_{i}(d_{i})')
+
+        lines.append('    return output')
+        exec('\n'.join(lines), namespace)
+        return namespace['convert']
 
     def convert_dict(self, data: dict, readable: bool = False) -> dict:
         '''
@@ -182,6 +288,8 @@ class FieldConversionManager:
         Returns:
             dict: Returns the converted dict.
         '''
+        if self.compiled:
+            return self._get_compiled_converter(tuple(data), readable)(data)
         output = {}
         for fieldname in data:
             if fieldname in self.name_to_field_type_converter:
@@ -360,6 +468,23 @@ class FieldConversionManager:
         '''
         return self.convert_value(value, typename, True)
 
+    def copy(self) -> 'FieldConversionManager':
+        '''
+        Create a copy of this manager. The FieldTypeConverter objects
+        are the same, since they never change, yet the dicts are new
+        so that the copy can be changed without changing this one.
+
+        Returns:
+            FieldConversionManager: Returns the copy.
+        '''
+        output = FieldConversionManager()
+        output.compiled = self.compiled
+        output.name_to_default = dict(self.name_to_default)
+        output.name_to_field_type_converter = dict(self.name_to_field_type_converter)
+        output.type_to_field_type_converter = dict(self.type_to_field_type_converter)
+        output.user_descriptor = dict(self.user_descriptor)
+        return output
+
     def fill_missing_fieldnames(
         self, data: dict, missing_field_names: list, to_internal: bool
     ) -> None:
@@ -382,6 +507,29 @@ class FieldConversionManager:
                 else:
                     data[missing_field] = self.name_to_default[missing_field]
 
+    def _get_compiled_converter(self, keys: tuple, readable: bool) -> Callable:
+        '''
+        Get the compiled converter for the given order of keys. It
+        will only be compiled, if no manager with the same fingerprint
+        compiled it before.
+
+        Args:
+            keys (tuple): The keys of the input dict in their order.
+            readable (bool): Converts to readable if True.
+
+        Returns:
+            Callable: Returns the compiled converter.
+        '''
+        converter = self.compiled_converters.get((keys, readable))
+        if converter is None:
+            key = (self.get_fingerprint(), keys, readable)
+            converter = FieldConversionManager.compiled_cache.get(key)
+            if converter is None:
+                converter = self._compile_converter(keys, readable)
+                FieldConversionManager.compiled_cache[key] = converter
+            self.compiled_converters[(keys, readable)] = converter
+        return converter
+
     def get_default_for_fieldname(self, fieldname: str, readable: bool = False) -> Any:
         '''
         Get the default value for the given fieldname.
@@ -425,6 +573,59 @@ class FieldConversionManager:
                 output.append(fieldname)
         return output
 
+    def get_fingerprint(self) -> tuple:
+        '''
+        Get the fingerprint of the fields, their converters and their
+        defaults. The converters are in it as the function objects
+        themselves, since the compiled converters call exactly them;
+        e.g. two closures of the same code can convert differently.
+        As a key of the compiled_cache the fingerprint also keeps them
+        alive. The defaults are in it by their type and repr(), so
+        managers with the same field types, e.g. of different
+        DocumentRepository instances, share the compiled converters.
+
+        Returns:
+            tuple: Returns the fingerprint.
+        '''
+        if not self.fingerprint:
+            self.fingerprint = tuple(
+                [
+                    (
+                        'c',
+                        fieldname,
+                        converter.field_type_str,
+                        converter.to_internal,
+                        converter.to_readable,
+                    )
+                    for fieldname, converter in (
+                        self.name_to_field_type_converter.items()
+                    )
+                ]
+                + [
+                    ('d', f, type(d).__qualname__, repr(d))
+                    for f, d in self.name_to_default.items()
+                ]
+                + [('u', f) for f in self.user_descriptor]
+            )
+        return self.fingerprint
+
+    def _reset_compiled(self) -> None:
+        '''
+        Clear the fingerprint and the compiled converters of this
+        manager, since its fields changed.
+        '''
+        self.fingerprint = ()
+        self.compiled_converters = {}
+
+    def set_compiled(self, compiled: bool = True) -> None:
+        '''
+        Set if convert_dict() should use compiled converters.
+
+        Args:
+            compiled (bool): Compiled converters on or off. (default: `True`)
+        '''
+        self.compiled = compiled
+
     def set_descriptor(self, descriptor: dict) -> None:
         '''
         Set the internal descriptor dict. It should be something
@@ -452,6 +653,7 @@ class FieldConversionManager:
             descriptor (dict): The descriptor dict.
         '''
         self.user_descriptor = descriptor
+        self._reset_compiled()
         for fieldname in self.user_descriptor:
             # just add the default straight ahead
             default = self.user_descriptor[fieldname]['default']
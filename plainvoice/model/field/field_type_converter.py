@@ -45,7 +45,11 @@ class FieldTypeConverter:
     '''
 
     def __init__(
-        self, field_type_str: str, to_internal: Callable, to_readable: Callable
+        self,
+        field_type_str: str,
+        to_internal: Callable,
+        to_readable: Callable,
+        keep_readable: bool = True,
     ):
         '''
         This class describes a field with its type, default value,
@@ -62,10 +66,16 @@ class FieldTypeConverter:
             to_readable (Callable): \
                 The callable with which the fields data gets \
                 converted to readbale from internal.
+            keep_readable (bool): \
+                If True, a readable value, which was never converted, \
+                can be written back as it is. Set it to False, if the \
+                conversion changes its meaning; e.g. a relative date. \
+                (default: `True`)
         '''
         self.field_type_str = field_type_str
         self.to_internal = to_internal
         self.to_readable = to_readable
+        self.keep_readable = keep_readable
 
     def __str__(self):
         '''
@@ -47,6 +47,10 @@ class File:
     def exist_check(self):
         return self.file_manager.exist_check
 
+    @property
+    def extract_code_from_filename(self):
+        return self.file_path_generator.extract_code_from_filename
+
     @property
     def extract_name_from_path(self):
         return self.file_path_generator.extract_name_from_path
@@ -75,6 +79,10 @@ class File:
     def get_folder(self):
         return self.file_path_generator.get_folder
 
+    @property
+    def get_highest_code(self):
+        return self.file_path_generator.get_highest_code
+
     @property
     def get_next_code(self):
         return self.file_path_generator.get_next_code
@@ -87,6 +95,10 @@ class File:
     def load_from_yaml_file(self):
         return self.file_manager.load_from_yaml_file
 
+    @property
+    def load_head_from_yaml_file(self):
+        return self.file_manager.load_head_from_yaml_file
+
     @property
     def remove(self):
         return self.file_manager.remove
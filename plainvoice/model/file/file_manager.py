@@ -1,7 +1,7 @@
 from .file_path_generator import FilePathGenerator
+from plainvoice.utils import yaml_utils
 
 import os
-import yaml
 
 
 class FileManager:
@@ -162,10 +162,56 @@ class FileManager:
         self.exist_check(name)
 
         with open(name, 'r') as yaml_file:
-            data = yaml.load(yaml_file, Loader=yaml.SafeLoader)
+            data = yaml_utils.load(yaml_file)
 
         return data
 
+    def load_head_from_yaml_file(
+        self, name: str, first_line: str, end_lines: tuple[str, ...]
+    ) -> dict | None:
+        '''
+        Loads only the head of the given YAML file: the block, which
+        starts with the given first line (ignoring empty lines before
+        it) and ends before one of the given end lines. The rest of
+        the file will not be read at all.
+
+        Args:
+            name (str): \
+                Uses name as a relative filename relative to \
+                the programs data dir. Also it is not neccessary \
+                to use .yaml as an extension for the filename.
+            first_line (str): \
+                The line, with which the file has to start, \
+                e.g. a comment like "# base variables".
+            end_lines (tuple): \
+                The lines, before which the head ends.
+
+        Returns:
+            dict | None: \
+                The dict with the data loaded from the head or None, \
+                if the file does not start with the first line.
+        '''
+        name = self.file_path_generator.generate_absolute_filename(name)
+        self.exist_check(name)
+
+        lines: list[str] = []
+        with open(name, 'r') as yaml_file:
+            for line in yaml_file:
+                stripped = line.rstrip()
+                if not lines:
+                    if not stripped:
+                        continue
+                    if stripped != first_line:
+                        return None
+                elif stripped in end_lines:
+                    break
+                lines.append(line)
+        if not lines:
+            return None
+
+        data = yaml_utils.load(''.join(lines))
+        return data if isinstance(data, dict) else {}
+
     def remove(self, name: str) -> bool:
         '''
         Remove the given name, which will generate
@@ -70,7 +70,7 @@ class FilePathGenerator:
                 The extension with which the FileManager should work. \
                 (default: `'yaml'`)
         '''
-        self.datadir = Config().data_dir
+        self.datadir = Config.get_instance().data_dir
         '''
         The path to the data dir of plainvoice. Probably it will be
         ~/.plainvoice by default.
@@ -105,6 +105,12 @@ class FilePathGenerator:
         data dir of the program.
         '''
 
+        self._regex_cache: tuple[str, re.Pattern] | None = None
+        '''
+        The compiled regex for the filename pattern, on which it
+        was built, so that it only has to be built once per pattern.
+        '''
+
     def auto_append_extension(self, filename: str) -> str:
         '''
         With this method you can append a file extension to
@@ -184,7 +190,9 @@ class FilePathGenerator:
         Returns:
             str: Returns the extracted code string.
         '''
-        id_match = re.search(self._build_regex(), filename)
+        if self._regex_cache is None or self._regex_cache[0] != self.filename_pattern:
+            self._regex_cache = (self.filename_pattern, re.compile(self._build_regex()))
+        id_match = self._regex_cache[1].search(filename)
         if id_match and id_match.groupdict():
             return id_match.group('code')
         else:
@@ -288,6 +296,28 @@ class FilePathGenerator:
                 )
             return os.path.abspath(output)
 
+    def get_highest_code(self, filenames: list) -> tuple[int, str]:
+        '''
+        Get a list with filenames and exttract their codes according
+        to the filename pattern and then get the highest code and
+        the filename, which carries it.
+
+        Args:
+            filenames (list): The list containing the filename strings.
+
+        Returns:
+            tuple: Returns (code, filename) or (0, '') if there is none.
+        '''
+        highest = (0, '')
+        for filename in filenames:
+            plain_filename = self.extract_name_from_path(filename, False)
+            id_only = self.extract_code_from_filename(plain_filename)
+            if math_utils.is_convertible_to_int(id_only) and (
+                not highest[1] or int(id_only) > highest[0]
+            ):
+                highest = (int(id_only), filename)
+        return highest
+
     def get_next_code(self, filenames: list) -> str:
         '''
         Get a list with filenames and exttract their codes according
@@ -300,13 +330,7 @@ class FilePathGenerator:
         Returns:
             str: Returns the next possible id string.
         '''
-        ids = []
-        for filename in filenames:
-            plain_filename = self.extract_name_from_path(filename, False)
-            id_only = self.extract_code_from_filename(plain_filename)
-            if math_utils.is_convertible_to_int(id_only):
-                ids.append(int(id_only))
-        return str(max(ids) + 1 if ids else 1)
+        return str(self.get_highest_code(filenames)[0] + 1)
 
     def generate_name(self, replace_dict: dict = {'code': None}) -> str:
         '''
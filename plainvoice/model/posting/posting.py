@@ -29,6 +29,15 @@ class Posting(DataModel):
                 format. (Default '`''`')
         '''
         super().__init__()
+
+        self.totals_cache: tuple[int, dict] | None = None
+        '''
+        The fixed revision and the totals calculated for it. The
+        totals are only calculated again, if the fixed fields were
+        written since; so only set_fixed() invalidates them, not
+        changing a field object in-place.
+        '''
+
         self._init_fixed_fields()
         self.set_fixed('title', title, True)
 
@@ -57,17 +66,60 @@ class Posting(DataModel):
         '''
         quantity = self.get_fixed('quantity', True)
         title = self.get_fixed('title', True)
-        net_total = self.get_total(False)
-        vat = self.get_vat(False)
         total = self.fixed_field_conversion_manager.convert_value_to_readable(
-            net_total + vat, 'Price'
+            self._get_totals()['total_with_vat'], 'Price'
         )
         vat_str = self.get_vat(True)
         return f'{quantity}, {title}: {total} ({vat_str} VAT)'
 
+    @staticmethod
+    def add_totals_by_vat(by_vat: dict, other_by_vat: dict) -> None:
+        '''
+        Add the totals grouped by vat rate of other_by_vat to the
+        ones in by_vat. Groups, which do not exist in by_vat yet,
+        will be added.
+
+        Args:
+            by_vat (dict): \
+                The totals grouped by vat rate to add to. The keys are \
+                the raw Decimal vat rates and the values are dicts with \
+                "vat_rate", "total", "vat" and "total_with_vat".
+            other_by_vat (dict): \
+                The totals grouped by vat rate to add.
+        '''
+        for rate, other in other_by_vat.items():
+            group = by_vat.get(rate)
+            if group is None:
+                by_vat[rate] = dict(other)
+                continue
+            for what in ('total', 'vat', 'total_with_vat'):
+                group[what] = other[what] + group[what]
+
+    @staticmethod
+    def copy_totals(totals: Any) -> Any:
+        '''
+        Copy the given totals or a single total of them with new
+        Price and Percentage objects, so that changing the copy does
+        not change the cached totals.
+
+        Args:
+            totals (Any): \
+                The totals like get_totals() returns them or \
+                a single value of them.
+
+        Returns:
+            Any: Returns the copied totals.
+        '''
+        if isinstance(totals, dict):
+            return {key: Posting.copy_totals(value) for key, value in totals.items()}
+        elif isinstance(totals, Quantity):
+            return totals.copy()
+        return totals
+
     def get_total(self, readable: bool = False) -> Price | Any:
         '''
-        Calculate and return the total net value.
+        Calculate and return the total net value. The Price is a
+        copy of the cached one.
 
         Args:
             readable (bool): Convert the output to a readable.
@@ -75,9 +127,7 @@ class Posting(DataModel):
         Returns:
             Price | Any: Returns the net total as a Price or Any object.
         '''
-        total_price = self.get_fixed('unit_price', False) * self.get_fixed(
-            'quantity', False
-        )
+        total_price = self._get_totals()['total'].copy()
         if readable:
             total_price = self.fixed_field_conversion_manager.convert_value_to_readable(
                 total_price, 'Price'
@@ -86,7 +136,8 @@ class Posting(DataModel):
 
     def get_total_with_vat(self, readable: bool = False) -> Price | Any:
         '''
-        Calculate and return the total + vat value.
+        Calculate and return the total + vat value. The Price is a
+        copy of the cached one.
 
         Args:
             readable (bool): Convert the output to a readable.
@@ -94,9 +145,7 @@ class Posting(DataModel):
         Returns:
             Price | Any: Returns the total + vat as a Price or Any object.
         '''
-        total_price = self.get_total(False)
-        vat_price = self.get_vat(False)
-        total_with_vat = total_price + vat_price
+        total_with_vat = self._get_totals()['total_with_vat'].copy()
         if readable:
             total_with_vat = (
                 self.fixed_field_conversion_manager.convert_value_to_readable(
@@ -105,9 +154,71 @@ class Posting(DataModel):
             )
         return total_with_vat
 
+    def _get_totals(self) -> dict:
+        '''
+        Get the cached totals of get_totals() without copying them.
+        They must not be changed.
+
+        Returns:
+            dict: Returns the cached totals.
+        '''
+        if (
+            self.totals_cache is not None
+            and self.totals_cache[0] == self.fixed_revision
+        ):
+            return self.totals_cache[1]
+        total_price = self.get_fixed('unit_price', False) * self.get_fixed(
+            'quantity', False
+        )
+        vat_rate = self.get_fixed('vat', False)
+        vat_price = total_price * vat_rate
+        totals = {
+            'total': total_price,
+            'vat': vat_price,
+            'total_with_vat': total_price + vat_price,
+        }
+        totals['by_vat'] = {vat_rate.value: dict(totals, vat_rate=vat_rate)}
+        self.totals_cache = (self.fixed_revision, totals)
+        return totals
+
+    def get_totals(self) -> dict:
+        '''
+        Get the net total, the vat and the total with vat. They
+        are calculated once per revision of the fixed fields and
+        the net total is only multiplied once for all of them.
+        So only set_fixed() invalidates them; changing a field
+        object in-place, e.g. with set_value(), does not. The
+        returned totals are a copy of the cached ones.
+
+        Returns:
+            dict: \
+                Returns the dict with "total", "vat", "total_with_vat" \
+                and "by_vat", which holds the same totals grouped by \
+                the vat rate. See add_totals_by_vat() for its format.
+        '''
+        return Posting.copy_totals(self._get_totals())
+
+    @staticmethod
+    def get_totals_key(postings: list) -> tuple:
+        '''
+        Get a key describing the given postings and the revisions
+        of their fixed fields. If the key stays the same, totals
+        calculated from these postings are still valid. The key
+        holds the postings themselves, so that it cannot match new
+        postings, which just got the same id().
+
+        Args:
+            postings (list): The list with Posting objects.
+
+        Returns:
+            tuple: Returns the key.
+        '''
+        return tuple((posting, posting.fixed_revision) for posting in postings)
+
     def get_vat(self, readable: bool = False) -> Price:
         '''
-        Calculate the vat from the total and return it.
+        Calculate the vat from the total and return it. The Price
+        is a copy of the cached one.
 
         readable (bool): \
                 Convert the output to a readable.
@@ -115,7 +226,7 @@ class Posting(DataModel):
         Returns:
             Price: Returns the vat of the total as a Price object.
         '''
-        vat_price = self.get_total(False) * self.get_fixed('vat', False)
+        vat_price = self._get_totals()['vat'].copy()
         if readable:
             vat_price = self.fixed_field_conversion_manager.convert_value_to_readable(
                 vat_price, 'Price'
@@ -15,6 +15,13 @@ class PostingsList(DataModel):
         This class controlls the list for postings.
         '''
         super().__init__()
+
+        self.totals_cache: tuple[tuple, dict] | None = None
+        '''
+        The key describing the postings and the totals calculated
+        for them. See get_totals_key() for the key.
+        '''
+
         self._init_fixed_fields()
 
     def __iter__(self):
@@ -78,6 +85,7 @@ class PostingsList(DataModel):
     def get_total(self, readable: bool = False) -> Price | Any:
         '''
         Calculate and return the total summarized of all postings.
+        The Price is a copy of the cached one.
 
         Args:
             readable (bool): Convert the output to a readable.
@@ -85,9 +93,7 @@ class PostingsList(DataModel):
         Returns:
             Price | Any: The total amount as a Price or Any.
         '''
-        output = 0
-        for posting in self.get_fixed('postings', False):
-            output = posting.get_total(False) + output
+        output = Posting.copy_totals(self._get_totals()['total'])
         if readable:
             output = self.fixed_field_conversion_manager.convert_value_to_readable(
                 output, 'Price'
@@ -97,6 +103,7 @@ class PostingsList(DataModel):
     def get_total_with_vat(self, readable: bool = False) -> Price | Any:
         '''
         Calculate and return the total + vat value summarized of all postings.
+        The Price is a copy of the cached one.
 
         Args:
             readable (bool): Convert the output to a readable.
@@ -104,9 +111,7 @@ class PostingsList(DataModel):
         Returns:
             Price | Any: Returns the total + vat as a Price or Any object.
         '''
-        total_price = self.get_total(False)
-        vat_price = self.get_vat(False)
-        total_with_vat = total_price + vat_price
+        total_with_vat = Posting.copy_totals(self._get_totals()['total_with_vat'])
         if readable:
             total_with_vat = (
                 self.fixed_field_conversion_manager.convert_value_to_readable(
@@ -115,6 +120,51 @@ class PostingsList(DataModel):
             )
         return total_with_vat
 
+    def _get_totals(self) -> dict:
+        '''
+        Get the cached totals of get_totals() without copying them.
+        They must not be changed.
+
+        Returns:
+            dict: Returns the cached totals.
+        '''
+        postings = self.get_fixed('postings', False)
+        key = (self.fixed_revision, Posting.get_totals_key(postings))
+        if self.totals_cache is not None and self.totals_cache[0] == key:
+            return self.totals_cache[1]
+        total_price = 0
+        vat_price = 0
+        by_vat: dict = {}
+        for posting in postings:
+            posting_totals = posting._get_totals()
+            total_price = posting_totals['total'] + total_price
+            vat_price = posting_totals['vat'] + vat_price
+            Posting.add_totals_by_vat(by_vat, posting_totals['by_vat'])
+        totals = {
+            'total': total_price,
+            'vat': vat_price,
+            'total_with_vat': total_price + vat_price,
+            'by_vat': by_vat,
+        }
+        self.totals_cache = (key, totals)
+        return totals
+
+    def get_totals(self) -> dict:
+        '''
+        Get the net total, the vat and the total with vat of all
+        postings, also grouped by their vat rate. They are summed up
+        in one pass and only again, if a posting or the list itself
+        changed since; so by set_fixed() on them, not by changing a
+        field object in-place. The returned totals are a copy of the
+        cached ones.
+
+        Returns:
+            dict: \
+                Returns the dict with "total", "vat", "total_with_vat" \
+                and "by_vat". See Posting.get_totals() for the format.
+        '''
+        return Posting.copy_totals(self._get_totals())
+
     def get_posting(self, id_or_title: int | str) -> Posting:
         '''
         Get a posting by its index in the internal list or
@@ -166,7 +216,7 @@ class PostingsList(DataModel):
     def get_vat(self, readable: bool = False) -> Price | Any:
         '''
         Calculates and returns just the vat amount from the total
-        of all postings.
+        of all postings. The Price is a copy of the cached one.
 
         Args:
             readable (bool): Convert the output to a readable.
@@ -174,9 +224,7 @@ class PostingsList(DataModel):
         Returns:
             Price | Any: The vat amount as a Price or Any.
         '''
-        output = 0
-        for posting in self.get_fixed('postings', False):
-            output = posting.get_vat(False) + output
+        output = Posting.copy_totals(self._get_totals()['vat'])
         if readable:
             output = self.fixed_field_conversion_manager.convert_value_to_readable(
                 output, 'Price'
@@ -18,6 +18,8 @@ class Percentage(Quantity):
     value divided by 100 internally
     '''
 
+    __slots__ = ()
+
     def __init__(self, value: str = '0 %'):
         '''
         The percentage class is based on the Quantity class and is
@@ -4,11 +4,18 @@ Price class
 It is a special kind derived from the Quantity class. It is for
 representing the currency. Basically the currency is just the
 suffix so it is using this instead.
+
+Next to the Decimal value, a price holds its value as integer cents,
+if it is exactly representable by them. Adding and substracting
+such prices is done with plain integers then, and the Decimal value
+only gets created, when it is accessed. Rounding still happens only
+where a new value gets normalized, so the results stay the same.
 '''
 
 from plainvoice.model.quantity.quantity import Quantity
 
 from decimal import Decimal, ROUND_HALF_UP
+from typing import Any
 
 
 class Price(Quantity):
@@ -16,6 +23,8 @@ class Price(Quantity):
     A special Quantity class, which is used for prices.
     '''
 
+    __slots__ = ('cents',)
+
     def __init__(self, value: str = '0.00 €'):
         '''
         The price class is based on the Quantity class and is
@@ -26,8 +35,68 @@ class Price(Quantity):
         Args:
             value (str): The price as a readbale str. (default: `'0.00 €'`)
         '''
+        self.cents: int | None = None
+        '''
+        The value as integer cents or None, if the value is not
+        exactly representable by cents, like a parsed "1.005".
+        '''
+
         super().__init__(value)
 
+    def __add__(self, other: Any):
+        cents = self._other_cents(other)
+        if self.cents is not None and cents is not None:
+            return self._create_from_cents(self.cents + cents)
+        return super().__add__(other)
+
+    def __sub__(self, other: Any):
+        cents = self._other_cents(other)
+        if self.cents is not None and cents is not None:
+            return self._create_from_cents(self.cents - cents)
+        return super().__sub__(other)
+
+    @staticmethod
+    def _cents_from_value(value: Decimal) -> int | None:
+        '''
+        Get the integer cents for the given value, if it is exactly
+        representable by them.
+
+        Args:
+            value (Decimal): The value.
+
+        Returns:
+            int | None: Returns the cents or None.
+        '''
+        exponent = value.as_tuple().exponent
+        if not isinstance(exponent, int) or exponent < -2:
+            return None
+        if value.is_zero() and value.is_signed():
+            # keep a negative zero in the Decimal value
+            return None
+        return int(value.scaleb(2))
+
+    def _create_from_cents(self, cents: int) -> 'Price':
+        '''
+        Return a new instance with the given cents and the
+        suffix and flags of this instance. The Decimal value
+        will be created on its first access.
+
+        Args:
+            cents (int): The value in integer cents.
+
+        Returns:
+            Price: Returns the new Price instance.
+        '''
+        output = self.__class__.__new__(self.__class__)
+        output.between_number_and_suffix = self.between_number_and_suffix
+        output.has_colon = self.has_colon
+        output.suffix_string = self.suffix_string
+        output.cents = cents
+        output._value = None
+        output._full_string = None
+        output._number_string = None
+        return output
+
     def get_currency(self) -> str:
         '''
         Gets the currency, which technically is just
@@ -38,28 +107,45 @@ class Price(Quantity):
         '''
         return self.get_suffix()
 
-    def set_currency(self, currency: str) -> None:
+    def _normalize_value(self, value: Decimal) -> Decimal:
         '''
-        Set the currency string, so basically a new suffic.
+        Normalize a new internal value so that it will only use
+        up to two digits after comma.
 
         Args:
-            currency (str): The currenc string.
+            value (Decimal): The new internal value.
+
+        Returns:
+            Decimal: Returns the rounded value.
         '''
-        self.set_suffix(currency)
+        return value.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
 
-    def set_value(self, value: str = '0') -> None:
+    @staticmethod
+    def _other_cents(other: Any) -> int | None:
+        '''
+        Get the integer cents of the other operand of a math
+        operation, if it has some.
+
+        Args:
+            other (Any): The other operand.
+
+        Returns:
+            int | None: Returns the cents or None.
         '''
-        Change the internal value string with a new Decimal, parsed
-        from a given string.
+        if isinstance(other, Price):
+            return other.cents
+        elif type(other) is int:
+            return other * 100
+        return None
 
-        This overrides the Quantity method so that the internal
-        Decimal will only use up to two digits after comma.
+    def set_currency(self, currency: str) -> None:
+        '''
+        Set the currency string, so basically a new suffic.
 
         Args:
-            value (Decimal): The new input value Decimal.
+            currency (str): The currenc string.
         '''
-        self.value = Decimal(value).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
-        self._strings_from_value()
+        self.set_suffix(currency)
 
     def _strings_from_value(self) -> None:
         '''
@@ -73,3 +159,21 @@ class Price(Quantity):
         self.full_string = (
             self.number_string + self.between_number_and_suffix + self.suffix_string
         )
+
+    @property
+    def value(self) -> Decimal:
+        '''
+        The actual value to calculate with. If it only exists as
+        cents yet, the Decimal will be created now.
+
+        Returns:
+            Decimal: Returns the value.
+        '''
+        if self._value is None:
+            self._value = Decimal(self.cents).scaleb(-2)
+        return self._value
+
+    @value.setter
+    def value(self, value: Decimal) -> None:
+        self._value = value
+        self.cents = self._cents_from_value(value)
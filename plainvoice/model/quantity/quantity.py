@@ -18,6 +18,15 @@ class Quantity:
     The class which can represent an invoice quantity.
     '''
 
+    __slots__ = (
+        'between_number_and_suffix',
+        '_full_string',
+        'has_colon',
+        '_number_string',
+        'suffix_string',
+        '_value',
+    )
+
     def __init__(self, value: str = '0'):
         '''
         The Quantity class can represent an invoice quantity or
@@ -35,9 +44,11 @@ class Quantity:
         quantity string.
         '''
 
-        self.full_string = str(value)
+        self._full_string: str | None = str(value)
         '''
-        The original value string from the input.
+        The formatted value string or None, if it has to be formatted
+        from the value again. It gets formatted lazily on access of
+        full_string, since most instances are only calculated with.
         '''
 
         self.has_colon = False
@@ -46,9 +57,10 @@ class Quantity:
         a colon like e.g. in "1:30" or so.
         '''
 
-        self.number_string = ''
+        self._number_string: str | None = ''
         '''
-        The number string part of the original_string value.
+        The number string part of the full string or None, if it has
+        to be formatted from the value again.
         '''
 
         self.suffix_string = ''
@@ -56,9 +68,10 @@ class Quantity:
         The suffix string part of the original_string value.
         '''
 
-        self.value = Decimal(1)
+        self._value = Decimal(1)
         '''
-        The actual value to calculate with.
+        The actual value to calculate with. Use the value property
+        to access it, since child classes might store it differently.
         '''
 
         self.parse(value)
@@ -66,14 +79,14 @@ class Quantity:
     def __add__(self, other: Any):
         if isinstance(other, Quantity):
             return self._create_instance(
-                str(self.get_value() + other.get_value()),
+                self.get_value() + other.get_value(),
                 self.suffix_string,
                 self.between_number_and_suffix,
                 self.has_colon,
             )
         elif isinstance(other, (int, float, Decimal)):
             return self._create_instance(
-                str(self.get_value() + Decimal(str(other))),
+                self.get_value() + Decimal(str(other)),
                 self.suffix_string,
                 self.between_number_and_suffix,
                 self.has_colon,
@@ -124,14 +137,14 @@ class Quantity:
     def __sub__(self, other: Any):
         if isinstance(other, Quantity):
             return self._create_instance(
-                str(self.get_value() - other.get_value()),
+                self.get_value() - other.get_value(),
                 self.suffix_string,
                 self.between_number_and_suffix,
                 self.has_colon,
             )
         elif isinstance(other, (int, float, Decimal)):
             return self._create_instance(
-                str(self.get_value() - Decimal(str(other))),
+                self.get_value() - Decimal(str(other)),
                 self.suffix_string,
                 self.between_number_and_suffix,
                 self.has_colon,
@@ -142,14 +155,14 @@ class Quantity:
     def __mul__(self, other: Any):
         if isinstance(other, Quantity):
             return self._create_instance(
-                str(self.get_value() * other.get_value()),
+                self.get_value() * other.get_value(),
                 self.suffix_string,
                 self.between_number_and_suffix,
                 self.has_colon,
             )
         elif isinstance(other, (int, float, Decimal)):
             return self._create_instance(
-                str(self.get_value() * Decimal(str(other))),
+                self.get_value() * Decimal(str(other)),
                 self.suffix_string,
                 self.between_number_and_suffix,
                 self.has_colon,
@@ -160,14 +173,14 @@ class Quantity:
     def __truediv__(self, other: Any):
         if isinstance(other, Quantity):
             return self._create_instance(
-                str(self.get_value() / other.get_value()),
+                self.get_value() / other.get_value(),
                 self.suffix_string,
                 self.between_number_and_suffix,
                 self.has_colon,
             )
         elif isinstance(other, (int, float, Decimal)):
             return self._create_instance(
-                str(self.get_value() / Decimal(str(other))),
+                self.get_value() / Decimal(str(other)),
                 self.suffix_string,
                 self.between_number_and_suffix,
                 self.has_colon,
@@ -182,30 +195,68 @@ class Quantity:
         '''
         return self.full_string
 
+    def copy(self) -> Self:
+        '''
+        Create a copy of this instance, so that changing the copy, e.g.
+        with set_value(), does not change this one.
+
+        Returns:
+            Quantity: Returns the new instance.
+        '''
+        output = self.__class__.__new__(self.__class__)
+        for cls in self.__class__.__mro__:
+            for slot in cls.__dict__.get('__slots__', ()):
+                setattr(output, slot, getattr(self, slot))
+        return output
+
     @classmethod
     def _create_instance(
-        cls, value: str, suffix: str, between_string: str, has_colon: bool
+        cls, value: Decimal, suffix: str, between_string: str, has_colon: bool
     ) -> Self:
         '''
-        Return a new instance with given values
+        Return a new instance with given values. Other than creating
+        the instance with a string, this does not parse anything and
+        formats the strings only, when they are accessed.
 
         Args:
-            value (str): \
-                The internal finally parsed Decimal value, yet \
-                parsed from a string.
+            value (Decimal): \
+                The internal Decimal value. It gets normalized like \
+                with set_value().
             suffix (str): \
                 The suffix of the original_string.
+            between_string (str): \
+                The string between number and suffix.
+            has_colon (bool): \
+                If the number shall be represented with a colon.
 
         Returns:
             Quantity: Returns a new Quantity instance.
         '''
-        output = cls()
-        output.set_has_colon(has_colon)
-        output.set_suffix(suffix)
-        output.set_between(between_string)
-        output.set_value(value)
+        output = cls.__new__(cls)
+        output.between_number_and_suffix = between_string
+        output.has_colon = has_colon
+        output.suffix_string = suffix
+        output.value = output._normalize_value(value)
+        output._full_string = None
+        output._number_string = None
         return output
 
+    @property
+    def full_string(self) -> str:
+        '''
+        The full string, formatted from the value, if needed.
+
+        Returns:
+            str: Returns the full string.
+        '''
+        if self._full_string is None:
+            self._strings_from_value()
+        return str(self._full_string)
+
+    @full_string.setter
+    def full_string(self, full_string: str) -> None:
+        self._full_string = full_string
+
     def get_between(self) -> str:
         '''
         Get the string between number and suffix as a string.
@@ -233,6 +284,35 @@ class Quantity:
         '''
         return self.value
 
+    def _normalize_value(self, value: Decimal) -> Decimal:
+        '''
+        Normalize a new internal value. A Quantity takes it as it is,
+        yet child classes might round it, for example.
+
+        Args:
+            value (Decimal): The new internal value.
+
+        Returns:
+            Decimal: Returns the normalized value.
+        '''
+        return value
+
+    @property
+    def number_string(self) -> str:
+        '''
+        The number string, formatted from the value, if needed.
+
+        Returns:
+            str: Returns the number string.
+        '''
+        if self._number_string is None:
+            self._strings_from_value()
+        return str(self._number_string)
+
+    @number_string.setter
+    def number_string(self, number_string: str) -> None:
+        self._number_string = number_string
+
     def parse(self, original_string: str) -> None:
         '''
         Parse a given string to internal values accordingly. It
@@ -244,7 +324,15 @@ class Quantity:
         self.full_string = str(original_string)
         self._split_quantity_string()
         self._time_string_to_decimal()
-        self._strings_from_value()
+        self._reset_strings()
+
+    def _reset_strings(self) -> None:
+        '''
+        Mark the strings as outdated, so that they will be formatted
+        from the value again on their next access.
+        '''
+        self._full_string = None
+        self._number_string = None
 
     def set_between(self, between_string: str) -> None:
         '''
@@ -255,7 +343,7 @@ class Quantity:
             between_string (str): The string between number and suffix.
         '''
         self.between_number_and_suffix = str(between_string)
-        self._strings_from_value()
+        self._reset_strings()
 
     def set_has_colon(self, has_colon: bool) -> None:
         '''
@@ -268,7 +356,7 @@ class Quantity:
             has_colon (bool): Sets if the shall be a colon or not.
         '''
         self.has_colon = bool(has_colon)
-        self._strings_from_value()
+        self._reset_strings()
 
     def set_suffix(self, suffix: str) -> None:
         '''
@@ -278,7 +366,7 @@ class Quantity:
             suffix (str): The suffix string.
         '''
         self.suffix_string = str(suffix)
-        self._strings_from_value()
+        self._reset_strings()
 
     def set_value(self, value: str = '0') -> None:
         '''
@@ -288,8 +376,8 @@ class Quantity:
         Args:
             value (Decimal): The new input value Decimal.
         '''
-        self.value = Decimal(value)
-        self._strings_from_value()
+        self.value = self._normalize_value(Decimal(value))
+        self._reset_strings()
 
     def _split_quantity_string(self) -> None:
         '''
@@ -383,3 +471,17 @@ class Quantity:
         seconds = (decimal_value - minutes) * 60
         seconds = int(round(seconds))
         return f'{minutes}:{seconds:02d}'
+
+    @property
+    def value(self) -> Decimal:
+        '''
+        The actual value to calculate with.
+
+        Returns:
+            Decimal: Returns the value.
+        '''
+        return self._value
+
+    @value.setter
+    def value(self, value: Decimal) -> None:
+        self._value = value
@@ -57,7 +57,7 @@ class Script:
                 At least regarding the main program.
         '''
         try:
-            config = Config()
+            config = Config.get_instance()
             doc_repo = doc_utils.get_doc_repo()
             if isinstance(data, Document):
                 client = doc_repo.get_client_of_document(data)
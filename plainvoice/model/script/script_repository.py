@@ -44,7 +44,7 @@ class ScriptRepository(DataRepository):
         Returns:
             bool: Returns True on success.
         '''
-        project_path = Config().project_path
+        project_path = Config.get_instance().project_path
         default_script_filename = f'{project_path}/assets/script_template.py'
 
         return self.file.copy(
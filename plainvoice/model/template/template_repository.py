@@ -40,7 +40,7 @@ class TemplateRepository(DataRepository):
         Returns:
             bool: Returns True on success.
         '''
-        project_path = Config().project_path
+        project_path = Config.get_instance().project_path
         default_template_filename = f'{project_path}/assets/invoice_template.jinja'
 
         return self.file.copy(
@@ -16,4 +16,4 @@ def get_doc_repo() -> DocumentRepository:
     Returns:
         DocumentRepository: Returns the DocumentRepository instance.
     '''
-    return DocumentRepository(str(Config().get('types_folder')))
+    return DocumentRepository(str(Config.get_instance().get('types_folder')))
@@ -15,7 +15,7 @@ def open_in_editor(file_name: str) -> None:
     Args:
         file_name (str): The file name to open.
     '''
-    config = Config()
+    config = Config.get_instance()
     try:
         subprocess.run([str(config.get('editor')), file_name])
     except Exception:
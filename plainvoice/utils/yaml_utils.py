@@ -0,0 +1,86 @@
+'''
+Some functions for loading and dumping YAML.
+
+This is the one place, where the YAML codec gets chosen. If PyYAML
+was built with libyaml, its C based loader and dumper will be used,
+which are a lot faster than the pure Python ones. Otherwise it falls
+back to the pure Python implementation automatically. The output is
+the same either way.
+'''
+
+from typing import IO, Any
+
+import yaml
+
+try:
+    from yaml import CSafeDumper as _BaseDumper
+    from yaml import CSafeLoader as Loader
+
+    BACKEND = 'libyaml'
+except ImportError:  # pragma: no cover
+    from yaml import SafeDumper as _BaseDumper  # type: ignore
+    from yaml import SafeLoader as Loader  # type: ignore
+
+    BACKEND = 'python'
+
+
+def represent_multiline_str(dumper, data):
+    '''
+    Define a custom represent function for multiline strings.
+    This way multiline strings will get dumped by YAML with
+    the pipe newline style.
+    '''
+    if '\n' in data:
+        return dumper.represent_scalar('tag:yaml.org,2002:str', data, style='|')
+    return dumper.represent_scalar('tag:yaml.org,2002:str', data)
+
+
+class Dumper(_BaseDumper):
+    '''
+    The dumper of the active backend with the multiline string
+    representer added. Being a subclass, the representer does
+    not change the global PyYAML dumpers.
+    '''
+
+
+Dumper.add_representer(str, represent_multiline_str)
+
+
+def dump(data: Any, stream: IO | None = None, **kwargs) -> str | None:
+    '''
+    Dump the given data as YAML with the active backend.
+
+    Args:
+        data (Any): The data to dump.
+        stream (IO): \
+            Optionally a stream to write to. If None, the YAML string \
+            will be returned instead. (default: `None`)
+        **kwargs: Further keyword arguments for yaml.dump().
+
+    Returns:
+        str | None: Returns the YAML string, if no stream was given.
+    '''
+    return yaml.dump(data, stream, Dumper=Dumper, **kwargs)
+
+
+def get_backend() -> str:
+    '''
+    Get the name of the active YAML backend.
+
+    Returns:
+        str: Returns "libyaml" or "python".
+    '''
+    return BACKEND
+
+
+def load(stream: IO | str) -> Any:
+    '''
+    Load YAML from the given stream or string with the active backend.
+
+    Args:
+        stream (IO | str): The stream or string to load.
+
+    Returns:
+        Any: Returns the loaded data.
+    '''
+    return yaml.load(stream, Loader=Loader)
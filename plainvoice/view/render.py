@@ -89,7 +89,7 @@ class Render:
                 client = doc_repo.get_client_of_document(data)
             else:
                 client = Document()
-            config = Config()
+            config = Config.get_instance()
             html_out = template.render(
                 data=data, client=client, config=config, user=user
             )
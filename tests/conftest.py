@@ -1,5 +1,6 @@
 import pytest
 import os
+import shutil
 
 
 @pytest.fixture(autouse=True)
@@ -9,8 +10,18 @@ def set_test_config_dir(monkeypatch, test_data_folder):
     globally, but only for the runtime of the respective tests. This way
     my Config class won't use the systems dot folder as the data dir, but
     the config dir, I set up for the tests only.
+
+    The cache folder of this config dir (e.g. with the document indexes)
+    gets removed before and after every test, so that no test depends
+    on the caches, which an earlier test or test run left.
     '''
     monkeypatch.setenv('PLAINVOICE_DATA_DIR', test_data_folder('config'))
+    cache_folder = test_data_folder('config/cache')
+    shutil.rmtree(cache_folder, ignore_errors=True)
+
+    yield
+
+    shutil.rmtree(cache_folder, ignore_errors=True)
 
 
 @pytest.fixture
@@ -0,0 +1,76 @@
+from plainvoice.model.data.code_allocator import CodeAllocator
+from plainvoice.model.data.data_repository import DataRepository
+
+from concurrent.futures import ThreadPoolExecutor
+
+import os
+import pytest
+import shutil
+
+
+def test_code_allocator(test_data_folder):
+    # set up a temporary folder with some files with codes
+    test_folder = test_data_folder('code_allocator')
+    os.makedirs(test_folder, exist_ok=True)
+    data_repo = DataRepository(test_folder, 'doc_{code}')
+    for i in range(1, 4):
+        with open(os.path.join(test_folder, f'doc_{i}.yaml'), 'w') as f:
+            f.write(f'code: {i}\n')
+
+    # count the scans of the folder
+    scans = []
+    scan_highest_code = data_repo._scan_highest_code
+
+    def scan():
+        scans.append(True)
+        return scan_highest_code()
+
+    data_repo._scan_highest_code = scan  # type: ignore
+    data_repo.set_code_allocator(
+        CodeAllocator(os.path.join(test_folder, 'state', 'codes.json'), 'test')
+    )
+
+    # the first call has to scan the folder, the next ones not
+    assert data_repo.get_next_code() == '4'
+    assert data_repo.get_next_code() == '4'
+    assert len(scans) == 1
+
+    # an allocated code is reserved, even without its file
+    assert data_repo.allocate_next_code() == '4'
+    assert data_repo.get_next_code() == '5'
+    assert len(scans) == 1
+
+    # a file with the next code, which was not created by the
+    # program, does not match the state and leads to a scan
+    with open(os.path.join(test_folder, 'doc_5.yaml'), 'w') as f:
+        f.write('code: 5\n')
+    assert data_repo.get_next_code() == '6'
+    assert len(scans) == 2
+
+    # concurrent allocations all get different codes
+    with ThreadPoolExecutor(8) as executor:
+        codes = list(executor.map(lambda _: data_repo.allocate_next_code(), range(16)))
+    assert sorted(int(code) for code in codes) == list(range(6, 22))
+
+    # while another allocator holds the lock, no unreserved code is
+    # given out; the lock is released, when the lock file gets closed
+    other = CodeAllocator(os.path.join(test_folder, 'state', 'codes.json'), 'test')
+    other.LOCK_TIMEOUT = 0.05
+    lock_handle = data_repo.code_allocator.lock()  # type: ignore
+    assert lock_handle is not None
+    assert other.lock() is None
+    with pytest.raises(TimeoutError):
+        other.allocate(data_repo._scan_highest_code, lambda code: f'doc_{code}')
+    lock_handle.close()
+    assert (
+        other.allocate(data_repo._scan_highest_code, lambda code: f'doc_{code}') == 22
+    )
+
+    # a file, which was added without the program and continues the
+    # codes with a gap, does not match the state and leads to a scan
+    with open(os.path.join(test_folder, 'doc_27.yaml'), 'w') as f:
+        f.write('code: 27\n')
+    assert data_repo.get_next_code() == '28'
+
+    # finally remove the temporary test folder
+    shutil.rmtree(test_folder)
@@ -1,5 +1,7 @@
 from plainvoice.model.config import Config
 
+import os
+
 
 def test_config():
     '''
@@ -10,3 +12,21 @@ def test_config():
     # just for this test I set an editor command, which does not exist;
     # during the tests I probably do not want to use an editor anyway (;
     assert conf.get('editor') == 'this_is_no_editor'
+
+
+def test_config_shared_instance_does_not_write_on_read():
+    '''
+    The shared instance should be returned on every call and reading
+    the config should not write the config file again.
+    '''
+    conf = Config.get_instance()
+    mtime = os.stat(conf.config_file).st_mtime_ns
+
+    for _ in range(3):
+        other = Config.get_instance()
+        assert other is conf
+        assert other.get('editor') == 'this_is_no_editor'
+
+    # also a new instance only reads an up to date config file
+    Config()
+    assert os.stat(conf.config_file).st_mtime_ns == mtime
@@ -0,0 +1,61 @@
+from plainvoice.model.data.data_index import DataIndex
+
+import os
+import shutil
+
+
+def test_data_index_incremental_update(test_data_folder):
+    # set up a temporary folder with some files to index
+    test_folder = test_data_folder('data_index')
+    os.makedirs(test_folder, exist_ok=True)
+    index_file = os.path.join(test_folder, 'index.json')
+    files = []
+    for i in range(3):
+        filename = os.path.join(test_folder, f'doc_{i}.yaml')
+        with open(filename, 'w') as f:
+            f.write(f'code: {i}\n')
+        files.append(filename)
+
+    # the projector counts how often it was called, since this
+    # means that a file had to be parsed
+    parsed = []
+
+    def projector(abs_filename):
+        parsed.append(abs_filename)
+        return {'name': os.path.basename(abs_filename)}
+
+    # on the first update every file has to be parsed
+    index = DataIndex(index_file, 'fingerprint')
+    records = index.update(files, projector)
+    assert len(parsed) == 3
+    assert list(records.keys()) == files
+    assert os.path.exists(index_file) is True
+
+    # a new index instance loads the index file and
+    # does not need to parse anything
+    parsed.clear()
+    index = DataIndex(index_file, 'fingerprint')
+    records = index.update(files, projector)
+    assert parsed == []
+    assert records[files[1]] == {'name': 'doc_1.yaml'}
+
+    # now change one file; only this one should be parsed again
+    with open(files[1], 'w') as f:
+        f.write('code: 1\ntitle: changed\n')
+    records = index.update(files, projector)
+    assert parsed == [files[1]]
+
+    # removed files will be removed from the index as well
+    os.remove(files[2])
+    records = index.update(files[:2], projector)
+    assert files[2] not in records
+    assert index.get(files[2]) is None
+
+    # another fingerprint means: rebuild everything
+    parsed.clear()
+    index = DataIndex(index_file, 'other fingerprint')
+    index.update(files[:2], projector)
+    assert len(parsed) == 2
+
+    # finally remove the temporary test folder
+    shutil.rmtree(test_folder)
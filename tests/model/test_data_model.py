@@ -22,6 +22,23 @@ def test_additional():
     assert data_model.get('does_not_exist') is None
 
 
+def test_get_resolves_like_to_dict():
+    # create a DataModel with fixed and additional fields, while
+    # one additional field has the name of a fixed field
+    data_model = DataModel()
+    data_model.define_fixed_field_type('int', int, str)
+    data_model.add_field_descriptor('number', 'int', '1')
+    data_model.add_field_descriptor('other', 'int', '2')
+    data_model.from_dict({'number': '5', 'extra': 'x'})
+    data_model.set_additional('other', 'additional wins')
+
+    # get() should give the same as the flat dict for every field
+    for readable in (False, True):
+        flat = data_model.to_dict(readable)
+        for fieldname in ['visible', 'number', 'other', 'extra', 'nothing']:
+            assert data_model.get(fieldname, readable) == flat.get(fieldname)
+
+
 def test_create_instance():
     # I create a new instance via typical Python code
     # yet also with the inbuilt create_instance() method
@@ -125,6 +142,41 @@ def test_from_dict():
     assert data_model.is_visible() is False
 
 
+def test_lazy_fixed():
+    # create a DataModel with a field type, which counts its
+    # conversions to internal
+    conversions = []
+
+    def to_internal(value):
+        conversions.append(value)
+        return int(value)
+
+    data_model = DataModel()
+    data_model.define_fixed_field_type('int', to_internal, str)
+    data_model.add_field_descriptor('a', 'int', '1')
+    data_model.add_field_descriptor('b', 'int', '2')
+    conversions.clear()
+
+    # in lazy mode the loaded values are not converted yet
+    data_model.set_lazy_fixed()
+    data_model.from_dict({'a': '007', 'b': '8'})
+    assert conversions == []
+
+    # only the accessed field gets converted and only once
+    assert data_model.get_fixed('a', False) == 7
+    assert data_model.get_fixed('a', False) == 7
+    assert conversions == ['007']
+
+    # the untouched field is written back as it was loaded, while
+    # the converted one is written in its readable format
+    assert '007' not in data_model.to_yaml_string()
+    assert "b: '8'" in data_model.to_yaml_string()
+    assert conversions == ['007']
+
+    # the normal dict output has everything converted
+    assert data_model.to_dict() == {'visible': True, 'a': 7, 'b': 8}
+
+
 def test_getter_setter():
     # here I create a DataModel instance
     # and test directly the getter for the base
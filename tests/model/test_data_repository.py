@@ -61,6 +61,77 @@ def test_list_from_data_repository(test_data_folder):
     )
 
 
+def test_parallel_list_from_data_repository(test_data_folder):
+    # use the tests/data/data_repository folder for it
+    folder = test_data_folder('data_repository')
+
+    # the parallel loading should give exactly the same dicts
+    # in exactly the same order as the sequential loading
+    data_repo = DataRepository(folder)
+    sequential = data_repo.get_list(False)
+    data_repo.set_workers(4)
+    parallel = data_repo.get_list(False)
+    assert list(parallel.items()) == list(sequential.items())
+
+
+def test_iter_documents_from_data_repository(test_data_folder):
+    # use the tests/data/data_repository folder for it
+    folder = test_data_folder('data_repository')
+
+    # the iterated dicts should be the same as the listed ones,
+    # with and without workers
+    data_repo = DataRepository(folder)
+    for workers in [1, 4]:
+        data_repo.set_workers(workers)
+        for visible_only in [True, False]:
+            listed = data_repo.get_list(visible_only)
+            iterated = {
+                data_repo.file.extract_name_from_path(abs_filename): data
+                for abs_filename, data in data_repo.iter_documents(visible_only)
+            }
+            assert iterated == listed
+
+    # with an order the index records are used for sorting, which
+    # only hold the visibility by default
+    ordered = [
+        data_repo.file.extract_name_from_path(abs_filename)
+        for abs_filename, _ in data_repo.iter_documents(
+            False, lambda record: (not record['visible'])
+        )
+    ]
+    assert ordered[-1] == 'test_document_b'
+
+
+def test_load_base_dict_from_name(test_data_folder, test_temp_file):
+    # use the tests/data/data_repository folder for it
+    folder = test_data_folder('data_repository')
+    data_repo = DataRepository(folder)
+
+    # only the base variables should be loaded
+    assert data_repo.load_base_dict_from_name('test_document_b') == {'visible': False}
+
+    # the fixed fields must not even be parsed; so a broken YAML
+    # after the base variables does not matter
+    head_file = test_temp_file(
+        '_pytest_head.yaml',
+        '# base variables\n\ndoc_typename: invoice\n\n'
+        + '# fixed fields\n\nbroken: [\n',
+    )
+    assert data_repo.load_base_dict_from_name(head_file) == {'doc_typename': 'invoice'}
+
+    # without the base variables block, the whole file is loaded
+    full_file = test_temp_file(
+        '_pytest_full.yaml', 'fixed field: abc\ndoc_typename: invoice\n'
+    )
+    assert data_repo.load_base_dict_from_name(full_file) == {
+        'fixed field': 'abc',
+        'doc_typename': 'invoice',
+    }
+
+    # not existing files give an empty dict
+    assert data_repo.load_base_dict_from_name('not_existing') == {}
+
+
 def test_load_data_model_from_file(test_data_folder, test_data_file):
     # use the tests/data/data_repository folder for it
     folder = test_data_folder('data_repository')
@@ -1,6 +1,8 @@
 from plainvoice.model.document.document import Document
 from plainvoice.model.document.document_type import DocumentType
 
+from decimal import Decimal
+
 
 def test_document_code():
     # create the instances
@@ -181,6 +183,57 @@ def test_document_get_postings():
     assert doc.get_total_with_vat(True) == '19.49 €'
 
 
+def test_document_totals_cache():
+    # create a document with a single posting and a postings list
+    doc = Document()
+    doc_type = DocumentType()
+    doc_type.add_fixed_field('posting', 'Posting', {})
+    doc_type.add_fixed_field('postings', 'PostingsList', [])
+    doc.set_fixed_fields_descriptor(doc_type.get_descriptor())
+    doc.from_dict(
+        {
+            'posting': {'unit_price': '1.50 €', 'quantity': '2', 'vat': '10 %'},
+            'postings': [{'unit_price': '2.00 €', 'quantity': '1', 'vat': '0 %'}],
+        }
+    )
+    assert doc.get_total_with_vat(True) == '5.30 €'
+
+    # asking again uses the cached totals
+    totals = doc._get_totals()
+    assert doc._get_totals() is totals
+
+    # yet the got totals are copies; changing them keeps the cache
+    assert doc.get_total(False) is not totals['total']
+    doc.get_total(False).set_value('100')
+    doc.get_totals()['total_with_vat'].set_value('100')
+    posting = doc.get_fixed('posting', False)
+    posting.get_totals()['by_vat'][Decimal('10')]['vat'].set_value('100')
+    posting.get_vat(False).set_value('100')
+    doc.get_fixed('postings', False).get_total(False).set_value('100')
+    assert doc._get_totals() is totals
+    assert doc.get_total(True) == '5.00 €'
+    assert doc.get_total_with_vat(True) == '5.30 €'
+    assert posting.get_vat(True) == '0.30 €'
+    assert doc.get_fixed('postings', False).get_total(True) == '2.00 €'
+
+    # changing a posting directly invalidates the totals
+    posting.set_fixed('quantity', '4')
+    assert doc._get_totals() is not totals
+    assert doc.get_total_with_vat(True) == '8.60 €'
+
+    # so does adding a posting to the postings list
+    postings = doc.get_fixed('postings', False)
+    list_totals = postings._get_totals()
+    postings.add_posting('added', '', '1.00 €', '1', '0 %')
+    assert postings._get_totals() is not list_totals
+    assert postings.get_total(True) == '3.00 €'
+    assert doc.get_total_with_vat(True) == '9.60 €'
+
+    # and replacing the field on the document itself
+    doc.set_fixed('postings', [], True)
+    assert doc.get_total_with_vat(True) == '6.60 €'
+
+
 def test_document_init():
     # create an instance
     doc = Document('doc type')
@@ -319,6 +372,44 @@ def test_document_links():
     assert doc.link_exists(filename) is False
     assert filename not in doc.get_links()
 
+    # replacing the list from outside is noticed as well
+    doc.set_links([filename])
+    assert doc.link_exists(filename) is True
+    doc.add_link(filename)
+    assert doc.get_links() == [filename]
+
+    # changing the got or the set list does not change the links
+    other_filename = '/foo/bar/other.yaml'
+    doc.get_links()[0] = other_filename
+    assert doc.get_links() == [filename]
+    assert doc.link_exists(filename) is True
+    assert doc.link_exists(other_filename) is False
+    links = [other_filename]
+    doc.set_links(links)
+    links.append(filename)
+    assert doc.link_exists(filename) is False
+    doc.add_link(filename)
+    assert doc.get_links() == [other_filename, filename]
+    doc.remove_link(other_filename)
+    assert doc.get_links() == [filename]
+
+
+def test_document_identity():
+    # documents without a filename are only equal to themselves
+    doc_a = Document()
+    doc_b = Document()
+    assert doc_a != doc_b
+    assert len({doc_a, doc_b}) == 2
+
+    # with a filename they are equal by it
+    doc_a.set_filename('/foo/bar/file.yaml')
+    doc_b.set_filename('/foo/bar/file.yaml')
+    assert doc_a == doc_b
+    assert len({doc_a, doc_b}) == 1
+
+    doc_b.set_filename('/foo/bar/other.yaml')
+    assert doc_a != doc_b
+
 
 def test_document_title():
     # create the instances
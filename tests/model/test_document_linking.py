@@ -1,7 +1,9 @@
 from plainvoice.model.document.document import Document
+from plainvoice.model.document.document_link_manager import DocumentLinkManager
 from plainvoice.model.document.document_type import DocumentType
 from plainvoice.model.document.document_type_repository import DocumentTypeRepository
 from plainvoice.model.document.document_repository import DocumentRepository
+from plainvoice.utils import yaml_utils
 
 import pytest
 import shutil
@@ -115,7 +117,7 @@ def test_link_documents(setup_and_teardown, test_data_folder):
     # quickly also check caching; load the linked doc_1 again,
     # which should be a reference only
     doc_again = doc_repo_new.load('doc_1', 'doc')
-    assert doc_again == linked_doc
+    assert doc_again is linked_doc
 
 
 def test_linking_and_removing(setup_and_teardown, test_data_folder):
@@ -174,7 +176,7 @@ def test_rename_doc_and_links_respectively(setup_and_teardown, test_data_folder)
 
     # quickly check the cache integrity
     doc_1_reload = doc_repo.load('doc_one', 'doc')
-    assert doc_1_reload == doc_1
+    assert doc_1_reload is doc_1
 
     # now I use a new repo to laod both docs again;
     # the client should now have the new path of doc_1,
@@ -191,3 +193,148 @@ def test_rename_doc_and_links_respectively(setup_and_teardown, test_data_folder)
     # the link in client (the absolute path) should be changed
     assert 'doc_one' in doc_new_from_client_link
     assert 'doc_1' not in doc_new_from_client_link
+
+
+def test_link_manager_sets():
+    # the link manager does not need any files
+    manager = DocumentLinkManager()
+    client = Document('client')
+    client.set_filename('/clients/client.yaml')
+    docs = []
+    for i in range(50):
+        doc = Document('doc')
+        doc.set_filename(f'/docs/doc_{i:02d}.yaml')
+        docs.append(doc)
+        manager.add_link(client, doc)
+        # adding it again does not change anything
+        manager.add_link(doc, client)
+
+    assert manager.get_links_of_document(client) == docs
+    assert len(client.get_links()) == 50
+    assert len(manager.links_by_id) == 50
+
+    # renaming moves the links to the new filename
+    manager.rename_document(docs[0], '/docs/doc_renamed.yaml')
+    assert docs[0].get_filename() == '/docs/doc_renamed.yaml'
+    assert manager.get_links_of_document(docs[0]) == [client]
+    assert docs[0] in manager.get_links_of_document(client)
+    assert '/docs/doc_00.yaml' not in manager.links_of_doc
+
+    # and the link can still be removed afterwards
+    assert manager.remove_link(client, docs[0]) is True
+    assert manager.remove_link(client, docs[0]) is False
+    assert len(manager.get_links_of_document(client)) == 49
+    assert len(manager.links_by_id) == 49
+
+
+def test_link_index(setup_and_teardown, test_data_folder):
+    test_folder = test_data_folder('document_linking')
+    types_folder = test_folder + '/types'
+
+    # instantiate the document repository
+    doc_repo = DocumentRepository(types_folder)
+
+    # link the first client with the first two documents
+    client_1 = doc_repo.load('client_1', 'client')
+    doc_1 = doc_repo.load('doc_1', 'doc')
+    doc_2 = doc_repo.load('doc_2', 'doc')
+    doc_repo.links.add_link(client_1, doc_1)
+    doc_repo.links.add_link(client_1, doc_2)
+    doc_repo.save(client_1)
+    doc_repo.save(doc_1)
+    doc_repo.save(doc_2)
+
+    # the third document links to the client only on its side
+    doc_3 = doc_repo.load('doc_3', 'doc')
+    doc_3.add_link(client_1.get_filename())
+    doc_repo.save(doc_3)
+
+    # the link index gets built on its first use, which loads the
+    # documents once; afterwards a new repository has to find the
+    # links in both directions without loading any document
+    DocumentRepository(types_folder).get_linked_filenames(client_1.get_filename())
+    doc_repo_new = DocumentRepository(types_folder)
+    linked = doc_repo_new.get_linked_filenames(client_1.get_filename())
+    assert linked == [
+        doc_1.get_filename(),
+        doc_2.get_filename(),
+        doc_3.get_filename(),
+    ]
+    assert len(doc_repo_new.cache.by_filename) == 0
+
+    # filtered by the document type
+    linked = doc_repo_new.get_linked_filenames(doc_1.get_filename(), 'client')
+    assert linked == [client_1.get_filename()]
+    assert doc_repo_new.get_linked_filenames(doc_1.get_filename(), 'doc') == []
+
+    # the client is found with the index, also from the other side
+    client = doc_repo_new.get_client_of_document(doc_repo_new.load('doc_3', 'doc'))
+    assert client.get_filename() == client_1.get_filename()
+
+    # removing and renaming documents update the index
+    doc_repo_new.remove('doc', 'doc_2')
+    doc_repo_new.rename_document(doc_repo_new.load('doc_1', 'doc'), 'doc_one')
+    linked = DocumentRepository(types_folder).get_linked_filenames(
+        client_1.get_filename()
+    )
+    assert linked == [
+        doc_1.get_filename().replace('doc_1', 'doc_one'),
+        doc_3.get_filename(),
+    ]
+
+
+def test_save_doc_under_another_name_keeps_links(setup_and_teardown, test_data_folder):
+    test_folder = test_data_folder('document_linking')
+    types_folder = test_folder + '/types'
+
+    # instantiate the document repository
+    doc_repo = DocumentRepository(types_folder)
+
+    # get the second client and the second document and link them
+    client_2 = doc_repo.load('client_2', 'client')
+    doc_2 = doc_repo.load('doc_2', 'doc')
+    doc_repo.links.add_link(client_2, doc_2)
+
+    # saving the document under another name changes its filename,
+    # which is its hash; the link manager still has to find it
+    doc_repo.save(doc_2, 'doc_two')
+    assert 'doc_two' in doc_2.get_filename()
+    assert doc_repo.get_links_of_document(client_2) == [doc_2]
+    assert doc_repo.links.remove_link(client_2, doc_2) is True
+    assert doc_repo.get_links_of_document(client_2) == []
+
+
+def test_client_of_document_by_own_link(
+    setup_and_teardown, test_data_folder, monkeypatch
+):
+    test_folder = test_data_folder('document_linking')
+    types_folder = test_folder + '/types'
+
+    # link the first document with the first client on both sides
+    doc_repo = DocumentRepository(types_folder)
+    client_1 = doc_repo.load('client_1', 'client')
+    doc_1 = doc_repo.load('doc_1', 'doc')
+    doc_repo.links.add_link(client_1, doc_1)
+    doc_repo.save(client_1)
+    doc_repo.save(doc_1)
+
+    # count the parsed files from now on
+    parsed = []
+    yaml_load = yaml_utils.load
+
+    def counting_load(stream):
+        parsed.append(stream)
+        return yaml_load(stream)
+
+    monkeypatch.setattr(yaml_utils, 'load', counting_load)
+
+    # with a cold cache a new repository finds the client by the own
+    # link of the document; so it must not build the link index, which
+    # would parse every document
+    shutil.rmtree(test_data_folder('config/cache'), ignore_errors=True)
+    doc_repo_new = DocumentRepository(types_folder)
+    doc = doc_repo_new.load('doc_1', 'doc')
+    parsed.clear()
+    client = doc_repo_new.get_client_of_document(doc)
+    assert client.get_filename() == client_1.get_filename()
+    assert len(parsed) == 1
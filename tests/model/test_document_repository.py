@@ -1,9 +1,17 @@
 from plainvoice.model.document.document import Document
+from plainvoice.model.document.document_cache import DocumentCache
+from plainvoice.model.document.document_date_index import DocumentDateIndex
+from plainvoice.model.document.document_calculator import DocumentCalculator
+from plainvoice.model.document.document_folder_index import DocumentFolderIndex
+from plainvoice.model.document.document_query import DocumentQuery
 from plainvoice.model.document.document_repository import DocumentRepository
+from plainvoice.model.document.document_summary import DocumentSummary
 from plainvoice.model.document.document_type_repository import DocumentTypeRepository
 
-from datetime import datetime
+from datetime import datetime, timedelta
+import gc
 import os
+import pytest
 
 
 def test_create_default_doc_type(test_data_folder, test_data_file):
@@ -50,6 +58,96 @@ def test_document_cache(test_data_folder, test_data_file):
     assert doc == doc_repo.cache.get_by_doc_type_and_name('invoice', 'invoice_1')
 
 
+def test_document_cache_bounds(test_temp_file):
+    cache = DocumentCache(2)
+    filenames = [
+        test_temp_file(f'_pytest_cache_{i}.yaml', 'title: x\n') for i in range(3)
+    ]
+    docs = [Document('invoice') for _ in filenames]
+    for i, (doc, filename) in enumerate(zip(docs, filenames)):
+        cache.add_document(doc, 'invoice', f'cache_{i}', filename)
+
+    # only two are held strongly, yet the third is still used here
+    assert len(cache.by_filename) == 2
+    assert cache.get_stats()['evictions'] == 1
+    assert cache.get_by_filename(filenames[0]) is docs[0]
+    assert cache.get_by_doc_type_and_name('invoice', 'cache_2') is docs[2]
+
+    # an evicted document, which is not used anymore, is freed
+    del docs[1]
+    gc.collect()
+    assert cache.get_by_filename(filenames[1]) is None
+    assert cache.get_by_doc_type_and_name('invoice', 'cache_1') is None
+
+    # a changed file is not returned from the cache anymore
+    with open(filenames[0], 'a') as changed_file:
+        changed_file.write('code: changed\n')
+    assert cache.get_by_filename(filenames[0]) is None
+
+    stats = cache.get_stats()
+    assert (stats['hits'], stats['misses']) == (2, 3)
+
+
+def test_document_list_uses_cache(test_data_folder):
+    # set the test data folder
+    test_folder = test_data_folder('document_repository')
+    types_folder = test_folder + '/types'
+
+    # listed documents are cached, so loading them afterwards
+    # or listing them again gets the same instances
+    doc_repo = DocumentRepository(types_folder)
+    docs = doc_repo.get_list_of_docs('invoice_due', False)
+    assert doc_repo.load(docs[0].get_filename()) is docs[0]
+    listed_ids = [id(doc) for doc in docs]
+    listed_again = doc_repo.get_list_of_docs('invoice_due', False)
+    assert [id(doc) for doc in listed_again] == listed_ids
+    due_docs = doc_repo.get_due_docs('invoice_due', True, True, False)
+    assert all(id(doc) in listed_ids for doc in due_docs)
+
+    # the other way around a loaded document is used by the listing
+    doc_repo = DocumentRepository(types_folder)
+    doc = doc_repo.load(docs[0].get_name(), 'invoice_due')
+    assert any(d is doc for d in doc_repo.get_list_of_docs('invoice_due', False))
+
+
+def test_document_by_code(test_data_folder):
+    # set the test data folder
+    test_folder = test_data_folder('document_repository')
+    types_folder = test_folder + '/types'
+
+    # instantiate the document repository
+    doc_repo = DocumentRepository(types_folder)
+
+    # find a visible and a hidden document by its code
+    doc = doc_repo.get_document_by_code('invoice_due', '2')
+    assert doc is not None and doc.get_name() == 'invoice_2'
+    doc = doc_repo.get_document_by_code('invoice_due', '4')
+    assert doc is not None and doc.get_name() == 'invoice_4'
+    assert doc_repo.get_document_by_code('invoice_due', 'no code') is None
+
+    # the name combi can be found without loading the document
+    assert doc_repo.get_doc_typename_name_combi_from_code('invoice_due', '5') == (
+        'invoice_due',
+        'invoice_5',
+    )
+    assert doc_repo.get_doc_typename_name_combi_from_code(
+        'invoice_due', 'invoice_5'
+    ) == ('invoice_due', 'invoice_5')
+
+    # a new document should be found by its code immediately, also
+    # after renaming it, yet not after removing it anymore
+    doc = doc_repo.create_document('invoice_due')
+    code = doc.get_code()
+    assert doc_repo.get_document_by_code('invoice_due', code) == doc
+    doc_repo.rename_document(doc, 'invoice_renamed')
+    assert doc_repo.get_doc_typename_name_combi_from_code('invoice_due', code) == (
+        'invoice_due',
+        'invoice_renamed',
+    )
+    doc_repo.remove('invoice_due', 'invoice_renamed')
+    assert doc_repo.get_document_by_code('invoice_due', code) is None
+
+
 def test_document_due_list_invoices_only(test_data_folder):
     # set the test data folder
     test_folder = test_data_folder('document_repository')
@@ -188,6 +286,287 @@ def test_document_due_list_all_types(test_data_folder):
     assert codes_check == codes_fetched
 
 
+def test_document_due_buckets(test_data_folder):
+    # set the test data folder
+    test_folder = test_data_folder('document_repository')
+    types_folder = test_folder + '/types'
+
+    # instantiate the document repository
+    doc_repo = DocumentRepository(types_folder)
+
+    # the buckets hold the same documents as the due summaries
+    buckets = doc_repo.get_due_buckets('', False)
+    for bucket, include_due, include_overdue in [
+        ('due', True, False),
+        ('overdue', False, True),
+    ]:
+        summaries = doc_repo.get_due_summaries('', include_due, include_overdue, False)
+        assert [s.get_filename() for s, _ in buckets[bucket]] == [
+            s.get_filename() for s in summaries
+        ]
+
+    # and the precalculated days are the ones of the summaries
+    assert len(buckets['due']) > 0 and len(buckets['overdue']) > 0
+    for summary, days in buckets['due']:
+        assert days == summary.days_till_due_date() and days > 0
+    for summary, days in buckets['overdue']:
+        assert days == summary.days_till_due_date() and days <= 0
+
+
+def test_document_date_index():
+    now = datetime(2024, 3, 10, 15, 30)
+    records = {
+        '/a.yaml': {'date_due': '2024-03-01'},
+        '/b.yaml': {'date_due': '+1'},
+        '/c.yaml': {'date_due': '2024-03-10'},
+        '/d.yaml': {'date_due': None},
+        '/e.yaml': {'date_due': 'someday'},
+        '/f.yaml': {'date_due': '2024-02-01', 'date_done': '2024-02-02'},
+    }
+    date_index = DocumentDateIndex()
+    date_index.build(records, 'date_due', now, lambda r: not r.get('date_done'))
+    assert date_index.abs_filenames == ['/a.yaml', '/c.yaml', '/b.yaml']
+    assert date_index.undated == ['/e.yaml']
+
+    # ranges include the start and exclude the end
+    tomorrow = datetime(2024, 3, 11)
+    before = [f for _, f in date_index.get_range(None, tomorrow)]
+    after = [f for _, f in date_index.get_range(tomorrow)]
+    assert before == ['/a.yaml', '/c.yaml']
+    assert after == ['/b.yaml']
+    assert date_index.get_range(datetime(2024, 3, 10), tomorrow) == [
+        (datetime(2024, 3, 10), '/c.yaml')
+    ]
+
+
+def test_document_query():
+    # "and" binds stronger than "or"; values can be quoted
+    query = DocumentQuery(
+        'code~"2024-*" and date_issued>=2024-01-01 or total>1000 and client="A b"',
+        '-total, code',
+        5,
+    )
+    assert query.conditions == [
+        [('code', '~', '2024-*'), ('date_issued', '>=', '2024-01-01')],
+        [('total', '>', '1000'), ('client', '=', 'A b')],
+    ]
+    assert query.sort == [('total', True), ('code', False)]
+    assert query.limit == 5
+    for where in ['code', 'code=1 nand total>1', 'code=1 and']:
+        with pytest.raises(ValueError):
+            DocumentQuery(where)
+
+    # indexed fields are decided by the record; for other fields
+    # the result is None, until the document is given
+    now = datetime(2024, 3, 10)
+    fieldnames = DocumentQuery.INDEX_FIELDS
+    record = {
+        'code': '2024-7',
+        'date_issued': '2024-02-01',
+        'total': '12.00 €',
+    }
+    assert query.matches(record, fieldnames, None, now) is True
+    record = {'code': '2023-7', 'date_issued': '+0', 'total': '1200.00 €'}
+    assert query.matches(record, fieldnames, None, now) is None
+    document = Document()
+    document.set_additional('client', 'A b')
+    assert query.matches(record, fieldnames, document, now) is True
+    document.set_additional('client', 'C')
+    assert query.matches(record, fieldnames, document, now) is False
+    record = {'code': '2023-7', 'date_issued': '+0', 'total': '12.00 €'}
+    assert query.matches(record, fieldnames, None, now) is False
+
+    # sorting by indexed fields only; missing values come last
+    records = [
+        ('t', '/a.yaml', {'code': '2', 'total': '5.00 €'}),
+        ('t', '/b.yaml', {'code': '1', 'total': None}),
+        ('t', '/c.yaml', {'code': '3', 'total': '5.00 €'}),
+        ('t', '/d.yaml', {'code': '4', 'total': '9.00 €'}),
+    ]
+    sorted_records = query.sort_records(records, {'t': fieldnames}, now)
+    assert [r[1] for r in sorted_records] == [
+        '/d.yaml',
+        '/a.yaml',
+        '/c.yaml',
+        '/b.yaml',
+    ]
+    with pytest.raises(ValueError):
+        DocumentQuery('', 'client').sort_records(records, {'t': fieldnames}, now)
+
+
+def test_documents_by_query(test_data_folder):
+    # set the test data folder
+    test_folder = test_data_folder('document_repository')
+    types_folder = test_folder + '/types'
+
+    # build the indexes first, which loads all documents once
+    DocumentRepository(types_folder).get_list_of_summaries('invoice_due', False)
+    DocumentRepository(types_folder).get_list_of_summaries('quote_due', False)
+
+    # "code" is in the index of invoice_due; "title" is a fixed field of
+    # the document type, which is not indexed, so only the documents with
+    # the matching code get loaded for checking the title
+    doc_repo = DocumentRepository(types_folder)
+    query = DocumentQuery('code>=3 and title~"*== DUE*"')
+    summaries = doc_repo.get_summaries_by_query('invoice_due', query, False)
+    assert [s.name for s in summaries] == ['invoice_4', 'invoice_5', 'invoice_6']
+    assert len(doc_repo.cache.documents) == 4
+    summaries = doc_repo.get_summaries_by_query('invoice_due', query)
+    assert [s.name for s in summaries] == ['invoice_5']
+    docs = doc_repo.get_docs_by_query('invoice_due', query, False)
+    assert [d.get_name() for d in docs] == ['invoice_4', 'invoice_5', 'invoice_6']
+
+    # conditions on indexed fields only do not load any document; also
+    # the other document types are skipped without building their index
+    doc_repo = DocumentRepository(types_folder)
+    query = DocumentQuery(
+        'type=quote_due or type=invoice_due and visible=false and code=6'
+    )
+    summaries = doc_repo.get_summaries_by_query('', query, False)
+    assert sorted(s.name for s in summaries) == [
+        'invoice_6',
+        'quote_1',
+        'quote_2',
+        'quote_3',
+        'quote_4',
+    ]
+    summaries = doc_repo.get_summaries_by_query(
+        'invoice_due', DocumentQuery('', '-code', 2), False
+    )
+    assert [s.name for s in summaries] == ['invoice_6', 'invoice_5']
+    assert len(doc_repo.cache.documents) == 0
+
+    # the limit also limits the documents, which get loaded
+    summaries = doc_repo.get_summaries_by_query(
+        'invoice_due', DocumentQuery('title~"testing*"', 'code', 2), False
+    )
+    assert [s.name for s in summaries] == ['invoice_1', 'invoice_2']
+    assert len(doc_repo.cache.documents) == 2
+
+
+def test_documents_by_date(test_data_folder):
+    # set the test data folder
+    test_folder = test_data_folder('document_repository')
+    types_folder = test_folder + '/types'
+
+    # the expected documents are filtered by hand from all documents;
+    # the test data only has relative due dates like "-1" and "+14"
+    doc_repo = DocumentRepository(types_folder)
+    docs = doc_repo.get_list_of_docs('invoice_due', False)
+    start = datetime.now() - timedelta(days=7)
+    end = datetime.now()
+    expected = [
+        d.get_filename()
+        for d in docs
+        if d.get_due_date() is not None and start <= d.get_due_date() < end
+    ]
+    assert 0 < len(expected) < len(docs)
+
+    # a new repository only loads the matching documents
+    doc_repo = DocumentRepository(types_folder)
+    by_date = doc_repo.get_docs_by_date('invoice_due', 'due', start, end, False)
+    assert [d.get_filename() for d in by_date] == expected
+    assert len(doc_repo.cache.documents) == len(expected)
+    summaries = doc_repo.get_summaries_by_date('invoice_due', 'due', start, end, False)
+    assert [s.get_filename() for s in summaries] == expected
+
+    # the date index is built only once, as long as nothing changed,
+    # unless it has relative dates, which depend on the point of time
+    date_index = doc_repo.date_indexes[('invoice_due', 'date_due')][1]
+    assert date_index.relative
+    doc_repo.get_summaries_by_date('invoice_due', 'due', start)
+    assert doc_repo.date_indexes[('invoice_due', 'date_due')][1] is not date_index
+
+    # pretend it had absolute dates only; then it gets reused
+    date_index = doc_repo.date_indexes[('invoice_due', 'date_due')][1]
+    date_index.relative = False
+    doc_repo.get_summaries_by_date('invoice_due', 'due', start)
+    assert doc_repo.date_indexes[('invoice_due', 'date_due')][1] is date_index
+
+    # unknown dates are not possible
+    with pytest.raises(ValueError):
+        doc_repo.get_summaries_by_date('invoice_due', 'unknown')
+
+
+def test_document_summaries(test_data_folder):
+    # set the test data folder
+    test_folder = test_data_folder('document_repository')
+    types_folder = test_folder + '/types'
+
+    # instantiate the document repository
+    doc_repo = DocumentRepository(types_folder)
+
+    # the summaries should be in the same order and have the same
+    # projected values as the full documents
+    for show_only_visible in [True, False]:
+        docs = doc_repo.get_list_of_docs('invoice_due', show_only_visible)
+        summaries = doc_repo.get_list_of_summaries('invoice_due', show_only_visible)
+        assert len(docs) == len(summaries) > 0
+        for doc, summary in zip(docs, summaries):
+            assert isinstance(summary, DocumentSummary)
+            assert summary.get_name() == doc.get_name()
+            assert summary.get_code() == doc.get_code()
+            assert summary.get_title() == doc.get_title()
+            assert summary.get_document_typename() == doc.get_document_typename()
+            assert summary.get_issued_date(True) == doc.get_issued_date(True)
+            assert summary.get_due_date(True) == doc.get_due_date(True)
+            assert summary.days_till_due_date() == doc.days_till_due_date()
+            assert summary.is_due() == doc.is_due()
+            assert summary.is_overdue() == doc.is_overdue()
+            assert summary.is_visible() == doc.is_visible()
+            assert summary.get_total_with_vat(True) == doc.get_total_with_vat(True)
+            assert summary.get_total_with_vat() == doc.get_total_with_vat()
+
+    # the due summaries should be the same as the due documents
+    for include_due, include_overdue in [(True, True), (True, False), (False, True)]:
+        due_docs = doc_repo.get_due_docs('', include_due, include_overdue, False)
+        due_summaries = doc_repo.get_due_summaries(
+            '', include_due, include_overdue, False
+        )
+        assert [d.get_filename() for d in due_docs] == [
+            s.get_filename() for s in due_summaries
+        ]
+
+    # also the calculation with them should be the same
+    assert DocumentCalculator(due_summaries).get_total_with_vat(
+        True
+    ) == DocumentCalculator(due_docs).get_total_with_vat(True)
+
+
+def test_document_folder_index(test_data_folder):
+    # set the test data folder
+    test_folder = test_data_folder('document_repository')
+    types_folder = test_folder + '/types'
+
+    # instantiate the document repository
+    doc_repo = DocumentRepository(types_folder)
+
+    # files inside the folder of a type get its type without
+    # opening them; even files in subfolders
+    due_folder = doc_repo.get_folder('invoice_due')
+    assert doc_repo.folder_index.get(due_folder + '/not_existing.yaml') == 'invoice_due'
+    sub_filename = due_folder + '/2024/not_existing.yaml'
+    assert doc_repo.folder_index.get(sub_filename) == 'invoice_due'
+    quote_filename = due_folder + '/../docs_quote_due/not_existing.yaml'
+    assert doc_repo.get_document_type_from_file(quote_filename) == 'quote_due'
+
+    # files outside of the folders or with another extension have no type
+    assert doc_repo.folder_index.get('/somewhere/else/invoice_1.yaml') == ''
+    assert doc_repo.folder_index.get(due_folder + '/invoice_1.pdf') == ''
+
+    # the deepest folder wins and shared folders are ambiguous
+    folder_index = DocumentFolderIndex()
+    folder_index.build({'a': '/data', 'b': '/data/b', 'c': '/data/c', 'd': '/data/c'})
+    assert folder_index.get('/data/x/doc.yaml') == 'a'
+    assert folder_index.get('/data/b/doc.yaml') == 'b'
+    assert folder_index.get('/data/c/doc.yaml') == ''
+
+    # loading by the absolute filename still works
+    doc = doc_repo.load(due_folder + '/invoice_1.yaml')
+    assert doc.get_document_typename() == 'invoice_due'
+    assert doc.get_name() == 'invoice_1'
+
+
 def test_document_from_absolute_filename(test_data_folder, test_data_file):
     # set the test data folder
     test_folder = test_data_folder('document_repository')
@@ -225,6 +604,35 @@ def test_document_from_name(test_data_folder):
     assert doc.get_additional('company') == 'Plainvoice Inc.'
 
 
+def test_iter_documents(test_data_folder):
+    # set the test data folder
+    test_folder = test_data_folder('document_repository')
+    types_folder = test_folder + '/types'
+
+    # instantiate the document repository
+    doc_repo = DocumentRepository(types_folder)
+
+    # the iterated documents should be the same and in the same
+    # order as the listed ones
+    for show_only_visible in [True, False]:
+        docs = doc_repo.get_list_of_docs('invoice_due', show_only_visible)
+        iterated = doc_repo.iter_documents('invoice_due', show_only_visible)
+        assert [(d.get_filename(), d.get_title()) for d in iterated] == [
+            (d.get_filename(), d.get_title()) for d in docs
+        ]
+
+    # all types get merged into one order
+    iterated = list(doc_repo.iter_documents('', False, 'code'))
+    doc_typenames = set(d.get_document_typename() for d in iterated)
+    assert set(['invoice_due', 'quote_due']) <= doc_typenames
+    codes = [d.get_code() or 'ZZZZ' for d in iterated]
+    assert codes == sorted(codes)
+
+    # unknown orders are not possible
+    with pytest.raises(ValueError):
+        list(doc_repo.iter_documents('invoice_due', False, 'unknown'))
+
+
 def test_document_type_repository(test_data_folder):
     # set the test data folder
     test_folder = test_data_folder('document_repository')
@@ -351,6 +759,11 @@ def test_save_document(test_data_folder):
     doc.set_fixed('title', 'invoice saving title new', True)
     abs_filename = doc_repo.save(doc)
 
+    # the saved document stays cached under its name, not its filename
+    hits = doc_repo.cache.get_stats()['hits']
+    assert doc_repo.load('invoice_saving', 'invoice') is doc
+    assert doc_repo.cache.get_stats()['hits'] == hits + 1
+
     # change things and load it again to see if the first change
     # got saved
     doc.set_fixed('title', 'unsaved', True)
@@ -1,3 +1,4 @@
+from plainvoice.model.document.document import Document
 from plainvoice.model.document.document_type import DocumentType
 
 
@@ -26,3 +27,43 @@ def test_document_type_fixed_fields():
         'age': {'type': 'int', 'default': 36},
     }
     assert doc_type.get_descriptor() == should_be
+
+
+def test_document_type_schema():
+    # create a document type with some fixed fields
+    doc_type = DocumentType()
+    doc_type.add_fixed_field('title', 'str', 'untitled')
+    doc_type.add_fixed_field('price', 'Price', '1.00 €')
+    doc_type.set_fixed('code_fieldname', 'title', True)
+
+    # documents of this type share the same compiled schema
+    doc_a = Document()
+    doc_a.init_internals_with_doctype(doc_type)
+    doc_b = Document()
+    doc_b.init_internals_with_doctype(doc_type, False)
+    schema = doc_type.get_schema(Document.get_field_types())
+    assert doc_a.fixed_field_conversion_manager is (
+        schema.fixed_field_conversion_manager
+    )
+    assert doc_b.fixed_field_conversion_manager is (
+        schema.fixed_field_conversion_manager
+    )
+    assert doc_a.code_fieldname == 'title'
+
+    # only the first document got its defaults
+    assert doc_a.get_fixed('title', True) == 'untitled'
+    assert doc_b.fixed == {}
+    doc_b.from_dict({'price': '2.00 €'})
+    assert doc_b.get_fixed('title', True) == 'untitled'
+    assert doc_b.get_fixed('price', True) == '2.00 €'
+
+    # changing the fields of one document does not change the schema
+    doc_a.add_field_descriptor('extra', 'int', 1)
+    assert doc_a.fixed_field_conversion_manager is not (
+        schema.fixed_field_conversion_manager
+    )
+    assert 'extra' not in schema.fixed_field_conversion_manager.get_fieldnames()
+
+    # changing the document type compiles a new schema
+    doc_type.add_fixed_field('notes', 'str', '')
+    assert doc_type.get_schema(Document.get_field_types()) is not schema
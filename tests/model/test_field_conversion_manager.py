@@ -105,3 +105,90 @@ def test_get_fieldnames_of_type():
     # now get the fieldnames, which are of type "int"
     int_fieldnames = field_conversion_manager.get_fieldnames_of_type('int')
     assert set(int_fieldnames) == set(['age', 'number'])
+
+
+def test_compiled_convert_dict():
+    # set up a manager like in test_convert_dict(), plus a field
+    # with an unknown type and one with None as its default
+    field_conversion_manager = FieldConversionManager()
+    field_conversion_manager.add_field_type('str', str, str)
+    field_conversion_manager.add_field_type('int', int, int)
+    field_conversion_manager.add_field_type(
+        'Decimal', lambda x: Decimal(str(x)), lambda x: float(x)
+    )
+    field_conversion_manager.add_field_descriptor('user', 'str', '')
+    field_conversion_manager.add_field_descriptor('age', 'int', 0)
+    field_conversion_manager.add_field_descriptor('height', 'Decimal', 0.0)
+    field_conversion_manager.add_field_descriptor('unknown', 'nope', 'x')
+    field_conversion_manager.add_field_descriptor('nothing', 'str', None)
+
+    # some dicts with different orders, missing fields and None values
+    datas = [
+        {'user': 'Manuel', 'height': 1.87},
+        {'height': 1.87, 'other': 1, 'user': None, 'unknown': 'y'},
+        {},
+    ]
+
+    # the compiled converters have to give the same results
+    # as the generic conversion, also in the same order
+    for data in datas:
+        field_conversion_manager.set_compiled(False)
+        internal = field_conversion_manager.convert_dict_to_internal(data)
+        readable = field_conversion_manager.convert_dict_to_readable(internal)
+        field_conversion_manager.set_compiled(True)
+        internal_compiled = field_conversion_manager.convert_dict_to_internal(data)
+        readable_compiled = field_conversion_manager.convert_dict_to_readable(
+            internal_compiled
+        )
+        assert internal_compiled == internal
+        assert readable_compiled == readable
+        present = [key for key in data if key in internal]
+        assert list(internal_compiled)[: len(present)] == present
+
+    # another manager with the same fields shares the compiled converters
+    other_manager = field_conversion_manager.copy()
+    assert other_manager.get_fingerprint() == field_conversion_manager.get_fingerprint()
+
+    # also a manager, which is set up with the same converter functions
+    # from scratch; the defaults only count by their values
+    def to_list(x):
+        return list(x)
+
+    def create_manager() -> FieldConversionManager:
+        manager = FieldConversionManager()
+        manager.add_field_type('str', str, str)
+        manager.add_field_type('list', to_list, to_list)
+        manager.add_field_descriptor('user', 'str', '')
+        manager.add_field_descriptor('items', 'list', [])
+        manager.set_compiled()
+        return manager
+
+    cache_size = len(FieldConversionManager.compiled_cache)
+    managers = [create_manager() for _ in range(3)]
+    assert len(set(m.get_fingerprint() for m in managers)) == 1
+    for manager in managers:
+        assert manager.convert_dict_to_internal({'user': 'x'}) == {
+            'user': 'x',
+            'items': [],
+        }
+    assert len(FieldConversionManager.compiled_cache) == cache_size + 1
+
+    # closures of the same code, which convert differently, must
+    # not share their compiled converters
+    def create_scaling_manager(factor: int) -> FieldConversionManager:
+        manager = FieldConversionManager()
+        manager.add_field_type('int', lambda x: int(x) * factor, int)
+        manager.add_field_descriptor('number', 'int', 1)
+        manager.set_compiled()
+        return manager
+
+    doubling = create_scaling_manager(2)
+    tripling = create_scaling_manager(3)
+    assert doubling.get_fingerprint() != tripling.get_fingerprint()
+    assert doubling.convert_dict_to_internal({'number': 5}) == {'number': 10}
+    assert tripling.convert_dict_to_internal({'number': 5}) == {'number': 15}
+
+    # changing the fields compiles new converters
+    field_conversion_manager.add_field_descriptor('extra', 'int', 5)
+    assert field_conversion_manager.convert_dict_to_internal({})['extra'] == 5
+    assert other_manager.get_fingerprint() != field_conversion_manager.get_fingerprint()
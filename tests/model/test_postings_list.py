@@ -1,5 +1,7 @@
 from plainvoice.model.posting.postings_list import PostingsList
 
+from decimal import Decimal
+
 
 def test_postings_list_iteration():
     # create an instance
@@ -142,3 +144,32 @@ def test_math_operations():
 
     # it should have vat now with the added postings
     assert postings_list.has_vat() is True
+
+
+def test_postings_list_totals_by_vat():
+    # create postings with two different vat rates, while
+    # one rate is written differently
+    postings_list = PostingsList()
+    postings_list.from_list(
+        [
+            {'unit_price': '10.00 €', 'quantity': '1', 'vat': '19 %'},
+            {'unit_price': '5.00 €', 'quantity': '2', 'vat': '7 %'},
+            {'unit_price': '1.00 €', 'quantity': '1', 'vat': '19%'},
+        ]
+    )
+
+    # all totals come in one dict
+    totals = postings_list.get_totals()
+    assert str(totals['total']) == '21.00 €'
+    assert str(totals['vat']) == '2.79 €'
+    assert str(totals['total_with_vat']) == '23.79 €'
+
+    # and grouped by the vat rate as well
+    by_vat = totals['by_vat']
+    assert len(by_vat) == 2
+    group_19 = by_vat[Decimal('19')]
+    assert str(group_19['vat_rate']) == '19 %'
+    assert str(group_19['total']) == '11.00 €'
+    assert str(group_19['vat']) == '2.09 €'
+    assert str(group_19['total_with_vat']) == '13.09 €'
+    assert str(by_vat[Decimal('7')]['vat']) == '0.70 €'
@@ -46,3 +46,31 @@ def test_price_rounding():
     # after comma
     percent_of_price = price * 0.05
     assert percent_of_price.value == Decimal('0.15')
+
+
+def test_price_cents():
+    # prices, which are exactly representable by cents, hold them
+    price = Price('12.5 €')
+    assert price.cents == 1250
+
+    # a parsed value with more digits has no cents, yet it
+    # still gets rounded only for its string
+    price_exact = Price('1.005 €')
+    assert price_exact.cents is None
+    assert price_exact.value == Decimal('1.005')
+    assert str(price_exact) == '1.01 €'
+
+    # adding up prices with cents is done with integers and
+    # gives the same result as with Decimals
+    total = Price()
+    for i in range(100):
+        total = total + price
+    assert total.cents == 125000
+    assert total.value == Decimal('1250.00')
+    assert str(total) == '1250.00 €'
+
+    # mixing in a price without cents falls back to Decimals
+    # and rounds 1248.995 half up
+    total = total - price_exact
+    assert total.value == Decimal('1249.00')
+    assert total.cents == 124900
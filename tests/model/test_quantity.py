@@ -175,3 +175,23 @@ def test_setter_getter():
     # since I changed has_colon, also check the
     # final str output of that quantity
     assert str(quantity) == '2:30 - min'
+
+
+def test_lazy_strings():
+    # results of math operations do not format their strings
+    # until they are needed
+    quantity = Quantity('1:30 min') + Quantity('1')
+    assert quantity._full_string is None
+    assert quantity.get_value() == Decimal('2.5')
+
+    # yet accessing them formats them like before
+    assert quantity.number_string == '2:30'
+    assert str(quantity) == '2:30 min'
+
+    # setters just mark the strings as outdated
+    quantity.set_has_colon(False)
+    assert quantity._full_string is None
+    assert str(quantity) == '2.5 min'
+
+    # there are no instance dicts anymore
+    assert not hasattr(quantity, '__dict__')
@@ -0,0 +1,13 @@
+from plainvoice.utils import yaml_utils
+
+
+def test_yaml_codec_roundtrip():
+    # the backend should be one of the known ones
+    assert yaml_utils.get_backend() in ('libyaml', 'python')
+
+    # dump and load again with the codec; multiline strings
+    # should still use the pipe style
+    the_dict = {'title': 'test', 'detail': 'line a\nline b'}
+    the_yaml_string = yaml_utils.dump(the_dict, sort_keys=False)
+    assert the_yaml_string == 'title: test\ndetail: |-\n  line a\n  line b\n'
+    assert yaml_utils.load(the_yaml_string) == the_dict